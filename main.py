@@ -7,10 +7,12 @@ src_path = os.path.join(current_dir, "src")
 if src_path not in sys.path:
     sys.path.append(src_path)
 
+import atexit
+
 from flask import Flask, request, jsonify
+from mcp_agent.core.agent_service import AgentService
 from mcp_agent.core.fastagent import FastAgent
 from mcp_agent.tools.google_sheets_tool import google_sheets_tool
-import asyncio
 
 app = Flask(__name__)
 
@@ -31,6 +33,8 @@ def initialize_agent():
     @agent.agent(
         name="artemis",
         model="claude-3-5-sonnet-20241022",
+        # The agent is shared by every request, so don't carry conversation across them
+        use_history=False,
         system_prompt="""
 You are Artemis, a specialized geotargeting AI assistant helping users find exact ad targeting pathways.
 
@@ -72,7 +76,8 @@ Keep responses focused on actionable Category → Grouping → Demographic pathw
                     },
                     "required": ["query"]
                 },
-                "handler": lambda query: asyncio.run(google_sheets_tool.execute(query))
+                # Awaited on the agent service's loop, which is already running
+                "handler": google_sheets_tool.execute
             }
         ]
     )
@@ -87,6 +92,11 @@ Keep responses focused on actionable Category → Grouping → Demographic pathw
 # Initialize agent at startup
 artemis_main = initialize_agent()
 
+# Start the agents and their MCP connections once, and reuse them for every request
+agent_service = AgentService(agent)
+agent_service.start()
+atexit.register(agent_service.stop)
+
 @app.route("/chat", methods=["POST"])
 def chat():
     """Handle chat requests with the optimized Artemis agent."""
@@ -94,14 +104,8 @@ def chat():
         user_input = request.json.get("message", "Hello")
         session_id = request.json.get("session_id", "default")
         
-        # Run the agent with the user input
-        async def run_agent():
-            async with agent.run() as agent_app:
-                result = await agent_app.send(user_input, agent_name="artemis")
-                return result
-        
-        # Execute the async function
-        result = asyncio.run(run_agent())
+        # Run the agent with the user input on the long-lived agent service
+        result = agent_service.send(user_input, agent_name="artemis")
         
         return jsonify({
             "response": result,
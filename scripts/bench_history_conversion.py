@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""History Conversion Benchmark
+
+Times converting a growing conversation history to each provider's format every turn,
+as the providers do when sending it, with and without the per-message conversion cache.
+"""
+
+import base64
+import os
+import sys
+import time
+from pathlib import Path
+
+import typer
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from mcp.types import (  # noqa: E402
+    BlobResourceContents,
+    EmbeddedResource,
+    ImageContent,
+    TextContent,
+)
+
+from mcp_agent._mcp_local_backup.prompt_message_multipart import (  # noqa: E402
+    PromptMessageMultipart,
+)
+from mcp_agent.llm.providers.google_converter import GoogleConverter  # noqa: E402
+from mcp_agent.llm.providers.multipart_converter_anthropic import (  # noqa: E402
+    AnthropicConverter,
+)
+from mcp_agent.llm.providers.multipart_converter_openai import OpenAIConverter  # noqa: E402
+
+
+def synthetic_turn(turn: int, attachment_bytes: int) -> list[PromptMessageMultipart]:
+    """A user message with an image and a PDF, and the assistant's reply."""
+    data = base64.b64encode(os.urandom(attachment_bytes)).decode()
+    user = PromptMessageMultipart(
+        role="user",
+        content=[
+            TextContent(type="text", text=f"Question {turn}: what do these show?"),
+            ImageContent(type="image", data=data, mimeType="image/png"),
+            EmbeddedResource(
+                type="resource",
+                resource=BlobResourceContents(
+                    uri=f"file:///report-{turn}.pdf", mimeType="application/pdf", blob=data
+                ),
+            ),
+        ],
+    )
+    assistant = PromptMessageMultipart(
+        role="assistant", content=[TextContent(type="text", text=f"Answer {turn}. " * 50)]
+    )
+    return [user, assistant]
+
+
+def fresh(history: list[PromptMessageMultipart]) -> list[PromptMessageMultipart]:
+    """The same messages without their cached conversions."""
+    return [PromptMessageMultipart(role=m.role, content=list(m.content)) for m in history]
+
+
+def main(
+    turns: int = typer.Option(40, help="Number of conversation turns"),
+    attachment_kb: int = typer.Option(64, help="Size of each image and PDF in KB"),
+    no_cache: bool = typer.Option(False, help="Also time converting without the cache"),
+) -> None:
+    """Benchmark per-turn conversion of a growing history."""
+    google = GoogleConverter()
+    converters = {
+        "google": google.convert_to_google_content,
+        "anthropic": lambda history: [AnthropicConverter.convert_to_anthropic(m) for m in history],
+        "openai": lambda history: [OpenAIConverter.convert_to_openai(m) for m in history],
+    }
+
+    for name, convert in converters.items():
+        history: list[PromptMessageMultipart] = []
+        cached_ms, uncached_ms = [], []
+        for turn in range(turns):
+            history.extend(synthetic_turn(turn, attachment_kb * 1024))
+            start = time.perf_counter()
+            convert(history)
+            cached_ms.append((time.perf_counter() - start) * 1000)
+            if no_cache:
+                copies = fresh(history)
+                start = time.perf_counter()
+                convert(copies)
+                uncached_ms.append((time.perf_counter() - start) * 1000)
+
+        line = (
+            f"{name:10} turn 1: {cached_ms[0]:7.2f}ms  turn {turns}: {cached_ms[-1]:7.2f}ms"
+            f"  total: {sum(cached_ms):8.2f}ms"
+        )
+        if no_cache:
+            line += f"  uncached turn {turns}: {uncached_ms[-1]:7.2f}ms"
+            line += f"  total: {sum(uncached_ms):8.2f}ms"
+        print(line)
+
+
+if __name__ == "__main__":
+    typer.run(main)
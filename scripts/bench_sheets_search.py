@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Sheets Search Benchmark
+
+Times the indexed hierarchical search against scoring every row of a synthetic sheet.
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+import typer
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from tools.sheets_search import (  # noqa: E402
+    SheetIndex,
+    expand_search_terms,
+    hierarchical_search,
+    score_row,
+)
+
+CATEGORIES = ["Automotive", "Retail", "Travel", "Health", "Finance", "Home", "Dining", "Sports"]
+GROUPINGS = ["Shoppers", "Intenders", "Visitors", "Enthusiasts", "Owners", "Households"]
+ADJECTIVES = ["luxury", "premium", "budget", "young", "affluent", "senior", "urban", "rural"]
+NOUNS = [
+    "car", "truck", "hardwood", "flooring", "coffee", "gym", "hotel", "spa",
+    "restaurant", "fashion", "mortgage", "vacation", "bmw", "lexus", "mercedes", "pickup",
+]  # fmt: skip
+FILLER = ["weekly", "recent", "frequent", "local", "online", "seasonal", "loyal", "new"]
+
+QUERIES = [
+    "luxury car buyers",
+    "hardwood floor shoppers",
+    "young coffee drinkers",
+    "high income hotel visitors",
+    "in market for a pickup truck",
+    "affluent spa customers",
+]
+
+
+def synthetic_sheet(rows: int, seed: int = 42) -> list[dict]:
+    """Build rows shaped like the geotargeting sheet."""
+    rng = random.Random(seed)
+    sheet = []
+    for i in range(rows):
+        adjective, noun = rng.choice(ADJECTIVES), rng.choice(NOUNS)
+        sheet.append(
+            {
+                "Category": rng.choice(CATEGORIES),
+                "Grouping": f"{noun.title()} {rng.choice(GROUPINGS)}",
+                "Demographic": f"{adjective.title()} {noun.title()} {i}",
+                "Description": " ".join(
+                    [rng.choice(FILLER), adjective, noun, rng.choice(GROUPINGS).lower()]
+                    + rng.sample(FILLER, 3)
+                ),
+            }
+        )
+    return sheet
+
+
+def main(
+    rows: int = typer.Option(50_000, help="Number of synthetic sheet rows"),
+    repeat: int = typer.Option(5, help="Timed runs per query"),
+    full_scan: bool = typer.Option(False, help="Also time scoring every row (slow)"),
+) -> None:
+    """Benchmark indexed sheet search on a synthetic sheet."""
+    sheet = synthetic_sheet(rows)
+
+    start = time.perf_counter()
+    index = SheetIndex(sheet)
+    build = time.perf_counter() - start
+    print(f"rows: {rows:,}  vocabulary: {len(index.vocabulary):,}  index build: {build:.3f}s")
+
+    for query in QUERIES:
+        # First run warms the per-token match cache, as repeated queries would in production
+        hierarchical_search(query, sheet, index)
+        start = time.perf_counter()
+        for _ in range(repeat):
+            matches = hierarchical_search(query, sheet, index)
+        indexed = (time.perf_counter() - start) / repeat
+        candidates = len(index.candidates(expand_search_terms(query)))
+
+        line = f"{query!r:36} indexed: {indexed * 1000:8.2f}ms  candidates: {candidates:4}"
+        if full_scan:
+            expanded = expand_search_terms(query)
+            start = time.perf_counter()
+            scored = [score_row(expanded, row) for row in sheet]
+            scan = time.perf_counter() - start
+            best = max((m.total_score for m in scored if m), default=0)
+            line += f"  full scan: {scan * 1000:9.2f}ms"
+            assert not matches or matches[0].total_score == best, "index missed the best match"
+        print(line)
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,104 @@
+"""
+Circuit breaker and reconnection backoff for MCP server connections.
+"""
+
+import random
+import time
+from enum import Enum
+
+from pydantic import BaseModel
+
+from mcp_agent.config import MCPReconnectSettings
+
+
+class CircuitState(str, Enum):
+    """Health of a server connection as seen by its circuit breaker."""
+
+    CLOSED = "closed"
+    """Healthy, or failing less often than the failure threshold: calls go through."""
+
+    OPEN = "open"
+    """Failed repeatedly: calls fail fast until the retry delay has passed."""
+
+    HALF_OPEN = "half_open"
+    """A trial connection is in progress; its outcome closes or re-opens the circuit."""
+
+
+class ServerHealth(BaseModel):
+    """
+    Snapshot of a server's circuit breaker.
+    """
+
+    state: CircuitState = CircuitState.CLOSED
+    """Current circuit state."""
+
+    consecutive_failures: int = 0
+    """Failures since the last successful connection."""
+
+    retry_in_seconds: float = 0
+    """Seconds until the next connection attempt is allowed (0 if allowed now)."""
+
+
+class CircuitBreaker:
+    """
+    Tracks consecutive connection failures for one server.
+
+    The circuit opens after failure_threshold consecutive failures, or when a trial
+    connection fails. While open, calls are rejected until an exponentially growing,
+    jittered delay has passed; then a single trial is allowed (half-open).
+    """
+
+    def __init__(self, settings: MCPReconnectSettings) -> None:
+        self.settings = settings
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self._open_until = 0.0
+
+    def backoff_delay(self) -> float:
+        """Delay before the next attempt, based on the number of consecutive failures."""
+        exponent = max(self.consecutive_failures - 1, 0)
+        delay = min(
+            self.settings.initial_delay_seconds * (2**exponent), self.settings.max_delay_seconds
+        )
+        return delay + random.uniform(0, delay * self.settings.jitter)
+
+    def retry_in(self, now: float | None = None) -> float:
+        """Seconds until a connection attempt is allowed."""
+        if self.state != CircuitState.OPEN:
+            return 0
+        now = time.monotonic() if now is None else now
+        return max(self._open_until - now, 0)
+
+    def allow_attempt(self, now: float | None = None) -> bool:
+        """
+        Whether a connection attempt may be made now. An open circuit whose delay has
+        passed moves to half-open and allows exactly one trial.
+        """
+        if self.state == CircuitState.CLOSED:
+            return True
+        if self.state == CircuitState.OPEN and self.retry_in(now) == 0:
+            self.state = CircuitState.HALF_OPEN
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self._open_until = 0.0
+
+    def record_failure(self, now: float | None = None) -> None:
+        self.consecutive_failures += 1
+        if (
+            self.state == CircuitState.HALF_OPEN
+            or self.consecutive_failures >= self.settings.failure_threshold
+        ):
+            now = time.monotonic() if now is None else now
+            self.state = CircuitState.OPEN
+            self._open_until = now + self.backoff_delay()
+
+    def health(self, now: float | None = None) -> ServerHealth:
+        return ServerHealth(
+            state=self.state,
+            consecutive_failures=self.consecutive_failures,
+            retry_in_seconds=self.retry_in(now),
+        )
@@ -7,6 +7,7 @@ from datetime import timedelta
 from typing import (
     Any,
     AsyncContextManager,
+    AsyncIterator,
     Callable,
     Dict,
     List,
@@ -122,6 +123,23 @@ class AugmentedLLMProtocol(Protocol):
         """
         ...
 
+    def generate_stream(
+        self,
+        multipart_messages: List[PromptMessageMultipart],
+        request_params: RequestParams | None = None,
+    ) -> AsyncIterator[str | PromptMessageMultipart]:
+        """
+        Apply a list of PromptMessageMultipart messages to the LLM, streaming the response.
+
+        Args:
+            multipart_messages: List of PromptMessageMultipart objects
+            request_params: Optional parameters to configure the LLM request
+
+        Yields:
+            Text deltas as they are generated, then the complete PromptMessageMultipart response
+        """
+        ...
+
     @property
     def message_history(self) -> List[PromptMessageMultipart]:
         """
@@ -0,0 +1,91 @@
+"""
+On-disk cache of server tool, prompt and capability listings, so agents can start
+without waiting for every server to connect and list its tools.
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import List
+
+from mcp.types import Prompt, Tool
+from pydantic import BaseModel, Field, ValidationError
+
+from mcp_agent._mcp_local_backup.mcp_compatibility import ServerCapabilities
+from mcp_agent.config import MCPServerSettings
+from mcp_agent.logger.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ServerListing(BaseModel):
+    """
+    What a server offers, as listed after connecting to it.
+    """
+
+    tools: List[Tool] = Field(default_factory=list)
+    prompts: List[Prompt] = Field(default_factory=list)
+    capabilities: ServerCapabilities | None = None
+
+    saved_at: float = Field(default_factory=time.time)
+    """When the listing was fetched (seconds since the epoch)."""
+
+    def same_tools(self, other: "ServerListing") -> bool:
+        return _dump(self.tools) == _dump(other.tools)
+
+    def same_prompts(self, other: "ServerListing") -> bool:
+        return _dump(self.prompts) == _dump(other.prompts)
+
+
+def _dump(models: List[BaseModel]) -> list:
+    return [model.model_dump(mode="json") for model in models]
+
+
+def config_hash(server_name: str, config: MCPServerSettings) -> str:
+    """Hash of a server's configuration; a listing is only reused for the same hash."""
+    payload = json.dumps(
+        {"name": server_name, "config": config.model_dump(mode="json")},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ListingCache:
+    """
+    Stores one JSON file per server listing under directory, named after the server
+    and its configuration hash. Changing a server's configuration leaves its old
+    listing unused.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+
+    def path(self, server_name: str, config: MCPServerSettings) -> Path:
+        safe_name = re.sub(r"[^\w.-]", "_", server_name)
+        return self.directory / f"{safe_name}-{config_hash(server_name, config)[:16]}.json"
+
+    def load(self, server_name: str, config: MCPServerSettings) -> ServerListing | None:
+        """The cached listing for a server, or None if missing or unreadable."""
+        path = self.path(server_name, config)
+        try:
+            return ServerListing.model_validate_json(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValidationError) as e:
+            logger.warning(f"Ignoring unreadable listing cache for '{server_name}': {e}")
+            return None
+
+    def save(self, server_name: str, config: MCPServerSettings, listing: ServerListing) -> None:
+        """Write a server's listing, replacing the previous one atomically."""
+        path = self.path(server_name, config)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(listing.model_dump_json(), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write listing cache for '{server_name}': {e}")
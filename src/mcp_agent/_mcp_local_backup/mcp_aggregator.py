@@ -1,7 +1,10 @@
-from asyncio import Lock, gather
+from asyncio import Lock, Semaphore, Task, ensure_future, gather
+from contextlib import asynccontextmanager
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterator,
+    Awaitable,
     Callable,
     Dict,
     List,
@@ -18,19 +21,36 @@ from mcp.types import (
     Prompt,
     TextContent,
     Tool,
+    ToolAnnotations,
 )
 from opentelemetry import trace
 from pydantic import AnyUrl, BaseModel, ConfigDict
 
+from mcp_agent.config import MCPServerSettings
 from mcp_agent.context_dependent import ContextDependent
+from mcp_agent.core.exceptions import ServerBusyError, ServerUnavailableError
 from mcp_agent.event_progress import ProgressAction
 from mcp_agent.logger.logger import get_logger
 from mcp_agent._mcp_local_backup.common import SEP, create_namespaced_name, is_namespaced_name
 from mcp_agent._mcp_local_backup.gen_client import gen_client
+from mcp_agent._mcp_local_backup.listing_cache import ListingCache, ServerListing
 from mcp_agent._mcp_local_backup.mcp_agent_client_session import MCPAgentClientSession
-from mcp_agent._mcp_local_backup.mcp_connection_manager import MCPConnectionManager
+from mcp_agent._mcp_local_backup.mcp_connection_manager import (
+    IdleConnectionManager,
+    MCPConnectionManager,
+    ServerStartupReport,
+)
+from mcp_agent._mcp_local_backup.request_limiter import ServerRequestLimiter, ServerRequestStats
+from mcp_agent._mcp_local_backup.single_flight import SingleFlight
+from mcp_agent._mcp_local_backup.tool_result_cache import (
+    ToolCacheKey,
+    ToolResultCache,
+    is_repeatable_tool,
+    tool_cache_ttl,
+)
 
 if TYPE_CHECKING:
+    from mcp_agent._mcp_local_backup.mcp_compatibility import ServerCapabilities
     from mcp_agent.context import Context
 
 
@@ -66,6 +86,9 @@ class MCPAggregator(ContextDependent):
     server_names: List[str]
     """A list of server names to connect to."""
 
+    max_parallel_server_requests: int = 8
+    """Maximum number of servers queried at once when searching or listing across servers."""
+
     model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
 
     async def __aenter__(self):
@@ -77,7 +100,7 @@ class MCPAggregator(ContextDependent):
             # Try to get existing connection manager from context
             if not hasattr(self.context, "_connection_manager"):
                 self.context._connection_manager = MCPConnectionManager(
-                    self.context.server_registry
+                    self.context.server_registry, shutdown_timeout=self._shutdown_timeout()
                 )
                 await self.context._connection_manager.__aenter__()
             self._persistent_connection_manager = self.context._connection_manager
@@ -126,8 +149,14 @@ class MCPAggregator(ContextDependent):
         self._namespaced_tool_map: Dict[str, NamespacedTool] = {}
         # Maps server_name -> list of tools
         self._server_to_tool_map: Dict[str, List[NamespacedTool]] = {}
+        # Maps local (un-namespaced) tool name -> names of the servers providing it
+        self._tool_name_index: Dict[str, List[str]] = {}
         self._tool_map_lock = Lock()
 
+        # Snapshot of the aggregated tool list, rebuilt only when the version changes
+        self._tool_list_version = 0
+        self._tool_list_snapshot: ListToolsResult | None = None
+
         # Cache for prompt objects, maps server_name -> list of prompt objects
         self._prompt_cache: Dict[str, List[Prompt]] = {}
         self._prompt_cache_lock = Lock()
@@ -135,10 +164,24 @@ class MCPAggregator(ContextDependent):
         # Lock for refreshing tools from a server
         self._refresh_lock = Lock()
 
+        # Outcome of the most recent concurrent server startup
+        self.server_startup_report = ServerStartupReport()
+
+        # Maps resource URI prefixes -> servers known to serve resources under them
+        self._resource_prefix_index: Dict[str, set[str]] = {}
+
+        # Capabilities from server listings, used before (or without) a live connection
+        self._listed_capabilities: Dict[str, ServerCapabilities] = {}
+        # Background re-listing of servers loaded from the on-disk listing cache
+        self._listing_refresh_task: Task | None = None
+
     async def close(self) -> None:
         """
         Close all persistent connections when the aggregator is deleted.
         """
+        if self._listing_refresh_task and not self._listing_refresh_task.done():
+            self._listing_refresh_task.cancel()
+
         if self.connection_persistence and self._persistent_connection_manager:
             try:
                 # Only attempt cleanup if we own the connection manager
@@ -147,7 +190,6 @@ class MCPAggregator(ContextDependent):
                     and self.context._connection_manager == self._persistent_connection_manager
                 ):
                     logger.info("Shutting down all persistent connections...")
-                    await self._persistent_connection_manager.disconnect_all()
                     await self._persistent_connection_manager.__aexit__(None, None, None)
                     delattr(self.context, "_connection_manager")
                 self.initialized = False
@@ -187,10 +229,37 @@ class MCPAggregator(ContextDependent):
             logger.error(f"Error creating MCPAggregator: {e}")
             await instance.__aexit__(None, None, None)
 
+    def _create_session_factory(self, server_name: str) -> Callable:
+        """
+        Create a client session factory bound to a specific server name.
+        """
+
+        def session_factory(read_stream, write_stream, read_timeout, **kwargs):
+            # Get agent's model if this aggregator is part of an agent
+            agent_model = None
+            if hasattr(self, "config") and self.config and hasattr(self.config, "model"):
+                agent_model = self.config.model
+
+            return MCPAgentClientSession(
+                read_stream,
+                write_stream,
+                read_timeout,
+                server_name=server_name,
+                agent_model=agent_model,
+                tool_list_changed_callback=self._handle_tool_list_changed,
+                **kwargs,  # Pass through any additional kwargs like server_config
+            )
+
+        return session_factory
+
     async def load_servers(self) -> None:
         """
         Discover tools from each server in parallel and build an index of namespaced tool names.
         Also populate the prompt cache.
+
+        With mcp.listing_cache_dir configured, servers with a cached listing are indexed
+        from it immediately; they are connected and listed again in the background, or
+        for servers with lazy_connect, on their first use.
         """
         if self.initialized:
             logger.debug("MCPAggregator already initialized.")
@@ -199,151 +268,273 @@ class MCPAggregator(ContextDependent):
         async with self._tool_map_lock:
             self._namespaced_tool_map.clear()
             self._server_to_tool_map.clear()
+            self._tool_name_index.clear()
+            self._invalidate_tool_list()
 
         async with self._prompt_cache_lock:
             self._prompt_cache.clear()
 
-        for server_name in self.server_names:
-            if self.connection_persistence:
-                logger.info(
-                    f"Creating persistent connection to server: {server_name}",
-                    data={
-                        "progress_action": ProgressAction.STARTING,
-                        "server_name": server_name,
-                        "agent_name": self.agent_name,
-                    },
-                )
+        cached_listings = self._load_cached_listings()
+        for server_name, listing in cached_listings.items():
+            await self._apply_listing(server_name, listing)
+            logger.debug(f"Loaded cached listing for server '{server_name}'")
 
-                # Create a wrapper to capture the parameters for the client session
-                def session_factory(read_stream, write_stream, read_timeout, **kwargs):
-                    # Get agent's model if this aggregator is part of an agent
-                    agent_model = None
-                    if hasattr(self, "config") and self.config and hasattr(self.config, "model"):
-                        agent_model = self.config.model
-
-                    return MCPAgentClientSession(
-                        read_stream,
-                        write_stream,
-                        read_timeout,
-                        server_name=server_name,
-                        agent_model=agent_model,
-                        tool_list_changed_callback=self._handle_tool_list_changed,
-                        **kwargs,  # Pass through any additional kwargs like server_config
-                    )
+        server_names = [name for name in self.server_names if name not in cached_listings]
 
-                await self._persistent_connection_manager.get_server(
-                    server_name, client_session_factory=session_factory
-                )
+        if self.connection_persistence and server_names:
+            self.server_startup_report = await self._launch_persistent_servers(server_names)
 
-            logger.info(
-                f"MCP Servers initialized for agent '{self.agent_name}'",
+        # Gather data from all servers concurrently, skipping any that failed to start
+        server_names = [
+            name for name in server_names if name not in self.server_startup_report.failed
+        ]
+        results = await gather(
+            *(self._fetch_server_listing(server_name) for server_name in server_names),
+            return_exceptions=True,
+        )
+
+        for server_name, result in zip(server_names, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error loading server data: {result}")
+                continue
+
+            await self._apply_listing(server_name, result)
+
+            logger.debug(
+                f"MCP Aggregator initialized for server '{server_name}'",
                 data={
                     "progress_action": ProgressAction.INITIALIZED,
+                    "server_name": server_name,
+                    "agent_name": self.agent_name,
+                    "tool_count": len(result.tools),
+                    "prompt_count": len(result.prompts),
+                },
+            )
+
+        async with self._tool_map_lock:
+            self._invalidate_tool_list()
+
+        self.initialized = True
+
+        stale_listings = {
+            server_name: listing
+            for server_name, listing in cached_listings.items()
+            if not self._is_lazy(server_name)
+        }
+        if stale_listings:
+            self._listing_refresh_task = ensure_future(
+                self._refresh_cached_listings(stale_listings)
+            )
+
+    async def _launch_persistent_servers(self, server_names: List[str]) -> ServerStartupReport:
+        """Start persistent connections to servers concurrently and report failures."""
+        for server_name in server_names:
+            logger.info(
+                f"Creating persistent connection to server: {server_name}",
+                data={
+                    "progress_action": ProgressAction.STARTING,
+                    "server_name": server_name,
                     "agent_name": self.agent_name,
                 },
             )
 
-        async def fetch_tools(client: ClientSession):
+        # Launch all servers concurrently - startup time is that of the slowest server
+        report = await self._persistent_connection_manager.launch_servers(
+            server_names, client_session_factory=self._create_session_factory
+        )
+
+        for server_name, error in report.failed.items():
+            logger.error(
+                f"MCP Server '{server_name}' failed to start for agent '{self.agent_name}': {error}",
+                data={
+                    "progress_action": ProgressAction.FATAL_ERROR,
+                    "server_name": server_name,
+                    "agent_name": self.agent_name,
+                    "error_message": f"{server_name} failed to start",
+                },
+            )
+
+        logger.info(
+            f"MCP Servers initialized for agent '{self.agent_name}'",
+            data={
+                "progress_action": ProgressAction.INITIALIZED,
+                "agent_name": self.agent_name,
+            },
+        )
+        return report
+
+    async def _fetch_server_listing(self, server_name: str) -> ServerListing:
+        """
+        List a server's tools and prompts. The listing is written to the listing cache
+        (if configured) unless listing failed.
+        """
+        listing = ServerListing()
+        complete = True
+
+        async def fetch(client: ClientSession) -> None:
+            nonlocal complete
             try:
                 result: ListToolsResult = await client.list_tools()
-                return result.tools or []
+                listing.tools = result.tools or []
             except Exception as e:
+                complete = False
                 logger.error(f"Error loading tools from server '{server_name}'", data=e)
-                return []
 
-        async def fetch_prompts(client: ClientSession, server_name: str) -> List[Prompt]:
             # Only fetch prompts if the server supports them
-            if not await self.server_supports_feature(server_name, "prompts"):
+            if not getattr(listing.capabilities, "prompts", False):
                 logger.debug(f"Server '{server_name}' does not support prompts")
-                return []
+                return
 
             try:
                 result = await client.list_prompts()
-                return getattr(result, "prompts", [])
+                listing.prompts = getattr(result, "prompts", [])
             except Exception as e:
+                complete = False
                 logger.debug(f"Error loading prompts from server '{server_name}': {e}")
-                return []
 
-        async def load_server_data(server_name: str):
-            tools: List[Tool] = []
-            prompts: List[Prompt] = []
+        if self.connection_persistence:
+            server_connection = await self._persistent_connection_manager.get_server(
+                server_name, client_session_factory=MCPAgentClientSession
+            )
+            listing.capabilities = server_connection.server_capabilities
+            await fetch(server_connection.session)
+        else:
+            # Capabilities are not available from temporary sessions
+            async with self._temporary_session(
+                server_name, client_session_factory=self._create_session_factory(server_name)
+            ) as client:
+                await fetch(client)
 
-            if self.connection_persistence:
-                server_connection = await self._persistent_connection_manager.get_server(
-                    server_name, client_session_factory=MCPAgentClientSession
-                )
-                tools = await fetch_tools(server_connection.session)
-                prompts = await fetch_prompts(server_connection.session, server_name)
-            else:
-                # Create a factory function for the client session
-                def create_session(read_stream, write_stream, read_timeout, **kwargs):
-                    # Get agent's model if this aggregator is part of an agent
-                    agent_model = None
-                    if hasattr(self, "config") and self.config and hasattr(self.config, "model"):
-                        agent_model = self.config.model
-
-                    return MCPAgentClientSession(
-                        read_stream,
-                        write_stream,
-                        read_timeout,
-                        server_name=server_name,
-                        agent_model=agent_model,
-                        tool_list_changed_callback=self._handle_tool_list_changed,
-                        **kwargs,  # Pass through any additional kwargs like server_config
-                    )
+        cache = self._listing_cache()
+        config = self._server_config(server_name)
+        if cache and config and complete:
+            cache.save(server_name, config, listing)
+        return listing
+
+    async def _apply_listing(self, server_name: str, listing: ServerListing) -> None:
+        """Index a server's listed tools, prompts and capabilities."""
+        async with self._tool_map_lock:
+            self._index_server_tools(server_name, listing.tools)
 
-                async with gen_client(
-                    server_name,
-                    server_registry=self.context.server_registry,
-                    client_session_factory=create_session,
-                ) as client:
-                    tools = await fetch_tools(client)
-                    prompts = await fetch_prompts(client, server_name)
+        async with self._prompt_cache_lock:
+            self._prompt_cache[server_name] = listing.prompts
 
-            return server_name, tools, prompts
+        if listing.capabilities is not None:
+            self._listed_capabilities[server_name] = listing.capabilities
 
-        # Gather data from all servers concurrently
-        results = await gather(
-            *(load_server_data(server_name) for server_name in self.server_names),
-            return_exceptions=True,
-        )
+    def _server_config(self, server_name: str) -> MCPServerSettings | None:
+        registry = self.context.server_registry
+        config = registry.registry.get(server_name) if registry else None
+        return config if isinstance(config, MCPServerSettings) else None
 
-        for result in results:
-            if isinstance(result, BaseException):
-                logger.error(f"Error loading server data: {result}")
+    def _is_lazy(self, server_name: str) -> bool:
+        """Whether a server is only connected when first used."""
+        config = self._server_config(server_name)
+        return bool(config and config.lazy_connect)
+
+    def _listing_cache(self) -> ListingCache | None:
+        """The on-disk listing cache, or None when mcp.listing_cache_dir is not configured."""
+        config = self.context.config
+        directory = config.mcp.listing_cache_dir if config and config.mcp else None
+        return ListingCache(directory) if directory else None
+
+    def _load_cached_listings(self) -> Dict[str, ServerListing]:
+        cache = self._listing_cache()
+        if cache is None:
+            return {}
+
+        listings = {}
+        for server_name in self.server_names:
+            config = self._server_config(server_name)
+            listing = cache.load(server_name, config) if config else None
+            if listing is not None:
+                listings[server_name] = listing
+        return listings
+
+    async def _refresh_cached_listings(self, cached_listings: Dict[str, ServerListing]) -> None:
+        """
+        Connect to servers that were loaded from cached listings and list them again.
+        Changed tools are reconciled through _refresh_server_tools.
+
+        Servers are started through the connection manager's get_server, which launches
+        each server once: tool calls made meanwhile wait for the same connection.
+        """
+        server_names = list(cached_listings)
+        try:
+            if self.connection_persistence:
+                report = await self._launch_persistent_servers(server_names)
+                self.server_startup_report.started.update(report.started)
+                self.server_startup_report.failed.update(report.failed)
+                server_names = [name for name in server_names if name not in report.failed]
+
+            results = await gather(
+                *(self._fetch_server_listing(server_name) for server_name in server_names),
+                return_exceptions=True,
+            )
+        except Exception as e:
+            logger.error(f"Failed to refresh cached server listings: {e}")
+            return
+
+        for server_name, listing in zip(server_names, results):
+            if isinstance(listing, BaseException):
+                logger.error(f"Error refreshing listing for server '{server_name}': {listing}")
                 continue
 
-            server_name, tools, prompts = result
+            if listing.capabilities is not None:
+                self._listed_capabilities[server_name] = listing.capabilities
 
-            # Process tools
-            self._server_to_tool_map[server_name] = []
-            for tool in tools:
-                namespaced_tool_name = create_namespaced_name(server_name, tool.name)
-                namespaced_tool = NamespacedTool(
-                    tool=tool,
-                    server_name=server_name,
-                    namespaced_tool_name=namespaced_tool_name,
-                )
+            if not cached_listings[server_name].same_prompts(listing):
+                async with self._prompt_cache_lock:
+                    self._prompt_cache[server_name] = listing.prompts
 
-                self._namespaced_tool_map[namespaced_tool_name] = namespaced_tool
-                self._server_to_tool_map[server_name].append(namespaced_tool)
+            if not cached_listings[server_name].same_tools(listing):
+                logger.info(f"Tools of server '{server_name}' changed since they were cached")
+                await self._refresh_server_tools(server_name)
 
-            # Process prompts
-            async with self._prompt_cache_lock:
-                self._prompt_cache[server_name] = prompts
+    def _index_server_tools(self, server_name: str, tools: List[Tool]) -> None:
+        """
+        Replace the tools registered for a server in the tool maps and the tool name index.
+        Callers must hold _tool_map_lock so that readers never see a partial update.
 
-            logger.debug(
-                f"MCP Aggregator initialized for server '{server_name}'",
-                data={
-                    "progress_action": ProgressAction.INITIALIZED,
-                    "server_name": server_name,
-                    "agent_name": self.agent_name,
-                    "tool_count": len(tools),
-                    "prompt_count": len(prompts),
-                },
+        Args:
+            server_name: The server the tools belong to
+            tools: The complete, current list of tools for the server
+        """
+        # Remove old tools for this server
+        for old_tool in self._server_to_tool_map.get(server_name, []):
+            self._namespaced_tool_map.pop(old_tool.namespaced_tool_name, None)
+            owners = self._tool_name_index.get(old_tool.tool.name)
+            if owners and server_name in owners:
+                owners.remove(server_name)
+                if not owners:
+                    del self._tool_name_index[old_tool.tool.name]
+
+        # Add new tools
+        self._server_to_tool_map[server_name] = []
+        for tool in tools:
+            namespaced_tool_name = create_namespaced_name(server_name, tool.name)
+            namespaced_tool = NamespacedTool(
+                tool=tool,
+                server_name=server_name,
+                namespaced_tool_name=namespaced_tool_name,
             )
 
-        self.initialized = True
+            self._namespaced_tool_map[namespaced_tool_name] = namespaced_tool
+            self._server_to_tool_map[server_name].append(namespaced_tool)
+            self._tool_name_index.setdefault(tool.name, []).append(server_name)
+
+    def _invalidate_tool_list(self) -> None:
+        """
+        Discard the tool list snapshot and bump its version so that consumers caching
+        converted tool definitions rebuild them. Callers must hold _tool_map_lock.
+        """
+        self._tool_list_snapshot = None
+        self._tool_list_version += 1
+
+    @property
+    def tool_list_version(self) -> int:
+        """Version of the aggregated tool list, incremented whenever the tools change."""
+        return self._tool_list_version
 
     async def get_capabilities(self, server_name: str):
         """Get server capabilities if available."""
@@ -351,6 +542,9 @@ class MCPAggregator(ContextDependent):
             # For non-persistent connections, we can't easily check capabilities
             return None
 
+        if server_name in self._listed_capabilities:
+            return self._listed_capabilities[server_name]
+
         try:
             server_conn = await self._persistent_connection_manager.get_server(
                 server_name, client_session_factory=MCPAgentClientSession
@@ -406,16 +600,20 @@ class MCPAggregator(ContextDependent):
     async def list_tools(self) -> ListToolsResult:
         """
         :return: Tools from all servers aggregated, and renamed to be dot-namespaced by server name.
+        The result is a cached snapshot, see tool_list_version.
         """
         if not self.initialized:
             await self.load_servers()
 
-        return ListToolsResult(
-            tools=[
-                namespaced_tool.tool.model_copy(update={"name": namespaced_tool_name})
-                for namespaced_tool_name, namespaced_tool in self._namespaced_tool_map.items()
-            ]
-        )
+        # The snapshot is shared between callers and must be treated as read-only
+        if self._tool_list_snapshot is None:
+            self._tool_list_snapshot = ListToolsResult(
+                tools=[
+                    namespaced_tool.tool.model_copy(update={"name": namespaced_tool_name})
+                    for namespaced_tool_name, namespaced_tool in self._namespaced_tool_map.items()
+                ]
+            )
+        return self._tool_list_snapshot
 
     async def refresh_all_tools(self) -> None:
         """
@@ -432,7 +630,7 @@ class MCPAggregator(ContextDependent):
         operation_type: str,
         operation_name: str,
         method_name: str,
-        method_args: Dict[str, Any] = None,
+        method_args: Dict[str, Any] | None = None,
         error_factory: Callable[[str], R] = None,
     ) -> R:
         """
@@ -443,7 +641,7 @@ class MCPAggregator(ContextDependent):
             operation_type: Type of operation (for logging) e.g., "tool", "prompt"
             operation_name: Name of the specific operation being called (for logging)
             method_name: Name of the method to call on the client session
-            method_args: Arguments to pass to the method
+            method_args: Arguments to pass to the method (none if None)
             error_factory: Function to create an error return value if the operation fails
 
         Returns:
@@ -453,45 +651,142 @@ class MCPAggregator(ContextDependent):
         async def try_execute(client: ClientSession):
             try:
                 method = getattr(client, method_name)
-                return await method(**method_args)
+                return await method(**(method_args or {}))
             except Exception as e:
                 error_msg = (
                     f"Failed to {method_name} '{operation_name}' on server '{server_name}': {e}"
                 )
                 logger.error(error_msg)
+                if self.connection_persistence:
+                    self._persistent_connection_manager.connection_failed(server_name, client, e)
                 if error_factory:
                     return error_factory(error_msg)
                 else:
                     # Re-raise the original exception to propagate it
                     raise e
 
-        if self.connection_persistence:
-            server_connection = await self._persistent_connection_manager.get_server(
-                server_name, client_session_factory=MCPAgentClientSession
+        try:
+            async with self._request_slot(server_name, operation_name):
+                if self.connection_persistence:
+                    # Connects lazily connected (or idle-closed) servers on first use
+                    session_factory = self._create_session_factory(server_name)
+                    async with self._persistent_connection_manager.session(
+                        server_name, client_session_factory=session_factory
+                    ) as session:
+                        return await try_execute(session)
+                else:
+                    async with self._temporary_session(server_name) as client:
+                        return await try_execute(client)
+        except (ServerUnavailableError, ServerBusyError) as e:
+            # Fail fast while the server's circuit breaker is open or its queue is full
+            error_msg = f"Failed to {method_name} '{operation_name}': {e.message} ({e.details})"
+            logger.warning(error_msg)
+            if error_factory:
+                return error_factory(error_msg)
+            raise
+
+    def _request_limiter(self, server_name: str) -> ServerRequestLimiter | None:
+        """
+        The context-wide limiter for a server's concurrent requests, shared by all
+        aggregators, or None if the server sets no max_concurrent_requests.
+        """
+        limiters = self.context.server_request_limiters
+        if server_name not in limiters:
+            limiters[server_name] = ServerRequestLimiter.from_config(
+                server_name, self._server_config(server_name)
             )
-            return await try_execute(server_connection.session)
-        else:
+        return limiters[server_name]
+
+    @asynccontextmanager
+    async def _request_slot(self, server_name: str, operation_name: str) -> AsyncIterator[None]:
+        """Hold one of the server's request slots, waiting in its queue if needed."""
+        limiter = self._request_limiter(server_name)
+        if limiter is None:
+            yield
+            return
+
+        async with limiter.slot() as queue_seconds:
+            if queue_seconds > 0:
+                logger.debug(
+                    f"{server_name}: '{operation_name}' queued for {queue_seconds * 1000:.1f}ms",
+                    data={"server_name": server_name, "queue_seconds": queue_seconds},
+                )
+            yield
+
+    def request_stats(self) -> Dict[str, ServerRequestStats]:
+        """Queueing and execution metrics for this aggregator's rate-limited servers."""
+        limiters = self.context.server_request_limiters
+        return {
+            name: limiter.stats()
+            for name, limiter in limiters.items()
+            if limiter is not None and name in self.server_names
+        }
+
+    def _idle_connection_manager(self) -> IdleConnectionManager | None:
+        """
+        The context's manager of warm connections for non-persistent aggregators, or None
+        when mcp.idle_connection_ttl_seconds is not configured.
+        """
+        config = self.context.config
+        idle_ttl = config.mcp.idle_connection_ttl_seconds if config and config.mcp else None
+        if not idle_ttl:
+            return None
+
+        # Created by initialize_context; created here for contexts built directly
+        if self.context.idle_connection_manager is None:
+            self.context.idle_connection_manager = IdleConnectionManager(
+                self.context.server_registry,
+                idle_ttl=idle_ttl,
+                context=self.context,
+                shutdown_timeout=self._shutdown_timeout(),
+            )
+        return self.context.idle_connection_manager
+
+    def _shutdown_timeout(self) -> float:
+        """How long connection managers wait for servers to exit at shutdown."""
+        config = self.context.config
+        return config.mcp.shutdown_timeout_seconds if config and config.mcp else 5.0
+
+    @asynccontextmanager
+    async def _temporary_session(
+        self,
+        server_name: str,
+        client_session_factory: Callable = MCPAgentClientSession,
+    ) -> AsyncIterator[ClientSession]:
+        """
+        Session for one operation of a non-persistent aggregator. Reuses a warm connection
+        when an idle TTL is configured, otherwise connects for this operation only.
+        """
+        idle_connections = self._idle_connection_manager()
+        if idle_connections:
+            async with idle_connections.session(
+                server_name, client_session_factory=client_session_factory
+            ) as session:
+                yield session
+            return
+
+        logger.debug(
+            f"Creating temporary connection to server: {server_name}",
+            data={
+                "progress_action": ProgressAction.STARTING,
+                "server_name": server_name,
+                "agent_name": self.agent_name,
+            },
+        )
+        async with gen_client(
+            server_name,
+            server_registry=self.context.server_registry,
+            client_session_factory=client_session_factory,
+        ) as client:
+            yield client
             logger.debug(
-                f"Creating temporary connection to server: {server_name}",
+                f"Closing temporary connection to server: {server_name}",
                 data={
-                    "progress_action": ProgressAction.STARTING,
+                    "progress_action": ProgressAction.SHUTDOWN,
                     "server_name": server_name,
                     "agent_name": self.agent_name,
                 },
             )
-            async with gen_client(
-                server_name, server_registry=self.context.server_registry
-            ) as client:
-                result = await try_execute(client)
-                logger.debug(
-                    f"Closing temporary connection to server: {server_name}",
-                    data={
-                        "progress_action": ProgressAction.SHUTDOWN,
-                        "server_name": server_name,
-                        "agent_name": self.agent_name,
-                    },
-                )
-                return result
 
     async def _parse_resource_name(self, name: str, resource_type: str) -> tuple[str, str]:
         """
@@ -503,6 +798,9 @@ class MCPAggregator(ContextDependent):
 
         Returns:
             Tuple of (server_name, local_resource_name)
+
+        Raises:
+            ValueError: If a non-namespaced tool name is provided by more than one server
         """
         # First, check if this is a direct hit in our namespaced tool map
         # This handles both namespaced and non-namespaced direct lookups
@@ -522,16 +820,75 @@ class MCPAggregator(ContextDependent):
             # If the server name doesn't exist, it might be a tool with a hyphen in its name
             # Fall through to the next checks
 
-        # For tools, search all servers for the tool by exact name match
+        # For tools, look up the owning server by exact local name
         if resource_type == "tool":
-            for server_name, tools in self._server_to_tool_map.items():
-                for namespaced_tool in tools:
-                    if namespaced_tool.tool.name == name:
-                        return server_name, name
+            owners = self._tool_name_index.get(name)
+            if owners:
+                if len(owners) > 1:
+                    candidates = ", ".join(
+                        create_namespaced_name(server_name, name) for server_name in owners
+                    )
+                    raise ValueError(
+                        f"Tool '{name}' is provided by multiple servers, use one of: {candidates}"
+                    )
+                return owners[0], name
 
         # For all other resource types, use the first server
         return (self.server_names[0] if self.server_names else None, name)
 
+    async def _gather_servers(
+        self, server_names: List[str], fetch: Callable[[str], Awaitable[R]]
+    ) -> Dict[str, R]:
+        """
+        Run fetch for several servers concurrently, at most max_parallel_server_requests
+        at a time. fetch is expected to handle its own errors.
+
+        Returns:
+            Results keyed by server name, in the order of server_names
+        """
+        semaphore = Semaphore(self.max_parallel_server_requests)
+
+        async def bounded(server_name: str) -> R:
+            async with semaphore:
+                return await fetch(server_name)
+
+        results = await gather(*(bounded(server_name) for server_name in server_names))
+        return dict(zip(server_names, results))
+
+    async def _first_success(
+        self, server_names: List[str], attempt: Callable[[str], Awaitable[R | None]]
+    ) -> tuple[str | None, R | None]:
+        """
+        Try attempt on several servers concurrently (at most max_parallel_server_requests at
+        a time) and return the first successful result in server priority order. An attempt
+        fails by returning None or raising. Attempts still running once the answer is known
+        are cancelled.
+
+        Returns:
+            The name of the server that answered and its result, or (None, None)
+        """
+        semaphore = Semaphore(self.max_parallel_server_requests)
+
+        async def bounded(server_name: str) -> R | None:
+            async with semaphore:
+                return await attempt(server_name)
+
+        tasks = [(server_name, ensure_future(bounded(server_name))) for server_name in server_names]
+        try:
+            for server_name, task in tasks:
+                try:
+                    result = await task
+                except Exception as e:
+                    logger.debug(f"Server '{server_name}' did not answer: {e}")
+                    continue
+                if result is not None:
+                    return server_name, result
+            return None, None
+        finally:
+            for _, task in tasks:
+                task.cancel()
+            await gather(*(task for _, task in tasks), return_exceptions=True)
+
     async def call_tool(self, name: str, arguments: dict | None = None) -> CallToolResult:
         """
         Call a namespaced tool, e.g., 'server_name-tool_name'.
@@ -540,7 +897,14 @@ class MCPAggregator(ContextDependent):
             await self.load_servers()
 
         # Use the common parser to get server and tool name
-        server_name, local_tool_name = await self._parse_resource_name(name, "tool")
+        try:
+            server_name, local_tool_name = await self._parse_resource_name(name, "tool")
+        except ValueError as e:
+            logger.error(f"Error: {e}")
+            return CallToolResult(
+                isError=True,
+                content=[TextContent(type="text", text=str(e))],
+            )
 
         if server_name is None:
             logger.error(f"Error: Tool '{name}' not found")
@@ -559,23 +923,75 @@ class MCPAggregator(ContextDependent):
             },
         )
 
-        tracer = trace.get_tracer(__name__)
-        with tracer.start_as_current_span(f"MCP Tool: {server_name}/{local_tool_name}"):
-            trace.get_current_span().set_attribute("tool_name", local_tool_name)
-            trace.get_current_span().set_attribute("server_name", server_name)
-            return await self._execute_on_server(
-                server_name=server_name,
-                operation_type="tool",
-                operation_name=local_tool_name,
-                method_name="call_tool",
-                method_args={
-                    "name": local_tool_name,
-                    "arguments": arguments,
+        server_config, annotations = self._tool_settings(server_name, local_tool_name)
+        call_key = ToolResultCache.key(server_name, local_tool_name, arguments)
+
+        cache_ttl = tool_cache_ttl(server_config, local_tool_name, annotations)
+        if cache_ttl:
+            cache = self._tool_result_cache()
+            cached_result = cache.get(call_key)
+            logger.debug(
+                f"Tool result cache {'miss' if cached_result is None else 'hit'}",
+                data={
+                    "tool_name": local_tool_name,
+                    "server_name": server_name,
+                    "agent_name": self.agent_name,
+                    "cache_hits": cache.hits,
+                    "cache_misses": cache.misses,
                 },
-                error_factory=lambda msg: CallToolResult(
-                    isError=True, content=[TextContent(type="text", text=msg)]
-                ),
             )
+            if cached_result is not None:
+                return cached_result
+
+        async def execute() -> CallToolResult:
+            tracer = trace.get_tracer(__name__)
+            with tracer.start_as_current_span(f"MCP Tool: {server_name}/{local_tool_name}"):
+                trace.get_current_span().set_attribute("tool_name", local_tool_name)
+                trace.get_current_span().set_attribute("server_name", server_name)
+                return await self._execute_on_server(
+                    server_name=server_name,
+                    operation_type="tool",
+                    operation_name=local_tool_name,
+                    method_name="call_tool",
+                    method_args={
+                        "name": local_tool_name,
+                        "arguments": arguments,
+                    },
+                    error_factory=lambda msg: CallToolResult(
+                        isError=True, content=[TextContent(type="text", text=msg)]
+                    ),
+                )
+
+        dedupe_mode = server_config.deduplicate_tool_calls if server_config else "safe"
+        if dedupe_mode == "all" or (
+            dedupe_mode == "safe" and (cache_ttl or is_repeatable_tool(annotations))
+        ):
+            result = await self._tool_call_flights().do(call_key, execute)
+        else:
+            result = await execute()
+
+        if cache_ttl:
+            cache.put(call_key, result, cache_ttl)
+        return result
+
+    def _tool_settings(
+        self, server_name: str, tool_name: str
+    ) -> tuple[MCPServerSettings | None, ToolAnnotations | None]:
+        """Configuration of the server providing a tool, and the tool's annotations."""
+        server_config = self._server_config(server_name)
+        namespaced_tool = self._namespaced_tool_map.get(
+            create_namespaced_name(server_name, tool_name)
+        )
+        annotations = namespaced_tool.tool.annotations if namespaced_tool else None
+        return server_config, annotations
+
+    def _tool_result_cache(self) -> ToolResultCache:
+        """The context-wide tool result cache, shared by all aggregators."""
+        return self.context.tool_result_cache
+
+    def _tool_call_flights(self) -> SingleFlight[ToolCacheKey, CallToolResult]:
+        """The context-wide table of in-flight tool calls, shared by all aggregators."""
+        return self.context.tool_call_flights
 
     async def get_prompt(
         self,
@@ -689,120 +1105,52 @@ class MCPAggregator(ContextDependent):
             logger.debug(
                 f"Found prompt '{local_prompt_name}' in cache for servers: {potential_servers}"
             )
+            candidate_servers = potential_servers
+        else:
+            # If not in cache, perform a full search as fallback (cache might be outdated)
+            logger.debug(f"Prompt '{local_prompt_name}' not found in any server's cache")
+            candidate_servers = self.server_names
 
-            # Try each server from the cache
-            for s_name in potential_servers:
-                # Check if this server supports prompts
-                capabilities = await self.get_capabilities(s_name)
-                if not capabilities or not capabilities.prompts:
-                    logger.debug(f"Server '{s_name}' does not support prompts, skipping")
-                    continue
-
-                try:
-                    method_args = {"name": local_prompt_name}
-                    if arguments:
-                        method_args["arguments"] = arguments
-
-                    result = await self._execute_on_server(
-                        server_name=s_name,
-                        operation_type="prompt",
-                        operation_name=local_prompt_name,
-                        method_name="get_prompt",
-                        method_args=method_args,
-                        error_factory=lambda _: None,  # Return None instead of an error
-                    )
-
-                    # If we got a successful result with messages, return it
-                    if result and result.messages:
-                        logger.debug(
-                            f"Successfully retrieved prompt '{local_prompt_name}' from server '{s_name}'"
-                        )
-                        # Add namespaced name using the actual server where found
-                        result.namespaced_name = create_namespaced_name(s_name, local_prompt_name)
-
-                        # Store the arguments in the result for display purposes
-                        if arguments:
-                            result.arguments = arguments
+        # Only servers that support prompts are searched
+        capabilities = await self._gather_servers(candidate_servers, self.get_capabilities)
+        supported_servers = []
+        for s_name, server_capabilities in capabilities.items():
+            if server_capabilities and server_capabilities.prompts:
+                supported_servers.append(s_name)
+            else:
+                logger.debug(f"Server '{s_name}' does not support prompts, skipping")
 
-                        return result
+        method_args = {"name": local_prompt_name}
+        if arguments:
+            method_args["arguments"] = arguments
 
-                except Exception as e:
-                    logger.debug(f"Error retrieving prompt from server '{s_name}': {e}")
-        else:
-            logger.debug(f"Prompt '{local_prompt_name}' not found in any server's cache")
+        async def fetch_prompt(s_name: str) -> GetPromptResult | None:
+            result = await self._execute_on_server(
+                server_name=s_name,
+                operation_type="prompt",
+                operation_name=local_prompt_name,
+                method_name="get_prompt",
+                method_args=method_args,
+                error_factory=lambda _: None,  # Return None instead of an error
+            )
+            # Only a result with messages counts as found
+            return result if result and result.messages else None
 
-            # If not in cache, perform a full search as fallback (cache might be outdated)
-            # First identify servers that support prompts
-            supported_servers = []
-            for s_name in self.server_names:
-                capabilities = await self.get_capabilities(s_name)
-                if capabilities and capabilities.prompts:
-                    supported_servers.append(s_name)
-                else:
-                    logger.debug(
-                        f"Server '{s_name}' does not support prompts, skipping from fallback search"
-                    )
+        # Query the servers concurrently, preferring earlier servers
+        s_name, result = await self._first_success(supported_servers, fetch_prompt)
+        if result is not None:
+            logger.debug(f"Retrieved prompt '{local_prompt_name}' from server '{s_name}'")
+            # Add namespaced name using the actual server where found
+            result.namespaced_name = create_namespaced_name(s_name, local_prompt_name)
 
-            # Try all supported servers in order
-            for s_name in supported_servers:
-                try:
-                    # Use a quiet approach - don't log errors if not found
-                    method_args = {"name": local_prompt_name}
-                    if arguments:
-                        method_args["arguments"] = arguments
-
-                    result = await self._execute_on_server(
-                        server_name=s_name,
-                        operation_type="prompt",
-                        operation_name=local_prompt_name,
-                        method_name="get_prompt",
-                        method_args=method_args,
-                        error_factory=lambda _: None,  # Return None instead of an error
-                    )
+            # Store the arguments in the result for display purposes
+            if arguments:
+                result.arguments = arguments
 
-                    # If we got a successful result with messages, return it
-                    if result and result.messages:
-                        logger.debug(
-                            f"Found prompt '{local_prompt_name}' on server '{s_name}' (not in cache)"
-                        )
-                        # Add namespaced name using the actual server where found
-                        result.namespaced_name = create_namespaced_name(s_name, local_prompt_name)
-
-                        # Store the arguments in the result for display purposes
-                        if arguments:
-                            result.arguments = arguments
-
-                        # Update the cache - need to fetch the prompt object to store in cache
-                        try:
-                            prompt_list_result = await self._execute_on_server(
-                                server_name=s_name,
-                                operation_type="prompts-list",
-                                operation_name="",
-                                method_name="list_prompts",
-                                error_factory=lambda _: None,
-                            )
+            if not potential_servers:
+                await self._cache_found_prompt(s_name, local_prompt_name)
 
-                            prompts = getattr(prompt_list_result, "prompts", [])
-                            matching_prompts = [p for p in prompts if p.name == local_prompt_name]
-                            if matching_prompts:
-                                async with self._prompt_cache_lock:
-                                    if s_name not in self._prompt_cache:
-                                        self._prompt_cache[s_name] = []
-                                    # Add if not already in the cache
-                                    prompt_names_in_cache = [
-                                        p.name for p in self._prompt_cache[s_name]
-                                    ]
-                                    if local_prompt_name not in prompt_names_in_cache:
-                                        self._prompt_cache[s_name].append(matching_prompts[0])
-                        except Exception:
-                            # Ignore errors when updating cache
-                            pass
-
-                        return result
-
-                except Exception:
-                    # Don't log errors during fallback search
-                    pass
+            return result
 
         # If we get here, we couldn't find the prompt on any server
         logger.info(f"Prompt '{local_prompt_name}' not found on any server")
@@ -811,6 +1159,31 @@ class MCPAggregator(ContextDependent):
             messages=[],
         )
 
+    async def _cache_found_prompt(self, server_name: str, prompt_name: str) -> None:
+        """Add a prompt found outside the prompt cache to the cache."""
+        try:
+            prompt_list_result = await self._execute_on_server(
+                server_name=server_name,
+                operation_type="prompts-list",
+                operation_name="",
+                method_name="list_prompts",
+                error_factory=lambda _: None,
+            )
+
+            prompts = getattr(prompt_list_result, "prompts", [])
+            matching_prompts = [p for p in prompts if p.name == prompt_name]
+            if matching_prompts:
+                async with self._prompt_cache_lock:
+                    if server_name not in self._prompt_cache:
+                        self._prompt_cache[server_name] = []
+                    # Add if not already in the cache
+                    prompt_names_in_cache = [p.name for p in self._prompt_cache[server_name]]
+                    if prompt_name not in prompt_names_in_cache:
+                        self._prompt_cache[server_name].append(matching_prompts[0])
+        except Exception:
+            # Ignore errors when updating cache
+            pass
+
     async def list_prompts(
         self, server_name: str | None = None, agent_name: str | None = None
     ) -> Mapping[str, List[Prompt]]:
@@ -875,17 +1248,16 @@ class MCPAggregator(ContextDependent):
                 return results
 
         # Identify servers that support prompts
+        capabilities = await self._gather_servers(self.server_names, self.get_capabilities)
         supported_servers = []
-        for s_name in self.server_names:
-            capabilities = await self.get_capabilities(s_name)
-            if capabilities and capabilities.prompts:
+        for s_name, server_capabilities in capabilities.items():
+            if server_capabilities and server_capabilities.prompts:
                 supported_servers.append(s_name)
             else:
                 logger.debug(f"Server '{s_name}' does not support prompts, skipping")
                 results[s_name] = []
 
-        # Fetch prompts from supported servers
-        for s_name in supported_servers:
+        async def fetch_prompts(s_name: str) -> List[Prompt]:
             try:
                 result = await self._execute_on_server(
                     server_name=s_name,
@@ -897,14 +1269,16 @@ class MCPAggregator(ContextDependent):
 
                 prompts = getattr(result, "prompts", [])
 
-                # Update cache and results
+                # Update cache
                 async with self._prompt_cache_lock:
                     self._prompt_cache[s_name] = prompts
-
-                results[s_name] = prompts
+                return prompts
             except Exception as e:
                 logger.debug(f"Error fetching prompts from {s_name}: {e}")
-                results[s_name] = []
+                return []
+
+        # Fetch prompts from supported servers concurrently
+        results.update(await self._gather_servers(supported_servers, fetch_prompts))
 
         logger.debug(f"Available prompts across servers: {results}")
         return results
@@ -933,66 +1307,31 @@ class MCPAggregator(ContextDependent):
             logger.error(f"Cannot refresh tools for unknown server '{server_name}'")
             return
 
-        await self.display.show_tool_update(aggregator=self, updated_server=server_name)
+        if getattr(self, "display", None):
+            await self.display.show_tool_update(aggregator=self, updated_server=server_name)
 
         async with self._refresh_lock:
             try:
                 # Fetch new tools from the server
+                session_factory = self._create_session_factory(server_name)
                 if self.connection_persistence:
-                    # Create a factory function that will include our parameters
-                    def create_session(read_stream, write_stream, read_timeout):
-                        return MCPAgentClientSession(
-                            read_stream,
-                            write_stream,
-                            read_timeout,
-                            server_name=server_name,
-                            tool_list_changed_callback=self._handle_tool_list_changed,
-                        )
-
+                    # Reconnects servers that were idle-closed or not yet connected
                     server_connection = await self._persistent_connection_manager.get_server(
-                        server_name, client_session_factory=create_session
+                        server_name, client_session_factory=session_factory
                     )
                     tools_result = await server_connection.session.list_tools()
                     new_tools = tools_result.tools or []
                 else:
-                    # Create a factory function for the client session
-                    def create_session(read_stream, write_stream, read_timeout):
-                        return MCPAgentClientSession(
-                            read_stream,
-                            write_stream,
-                            read_timeout,
-                            server_name=server_name,
-                            tool_list_changed_callback=self._handle_tool_list_changed,
-                        )
-
-                    async with gen_client(
-                        server_name,
-                        server_registry=self.context.server_registry,
-                        client_session_factory=create_session,
+                    async with self._temporary_session(
+                        server_name, client_session_factory=session_factory
                     ) as client:
                         tools_result = await client.list_tools()
                         new_tools = tools_result.tools or []
 
                 # Update tool maps
                 async with self._tool_map_lock:
-                    # Remove old tools for this server
-                    old_tools = self._server_to_tool_map.get(server_name, [])
-                    for old_tool in old_tools:
-                        if old_tool.namespaced_tool_name in self._namespaced_tool_map:
-                            del self._namespaced_tool_map[old_tool.namespaced_tool_name]
-
-                    # Add new tools
-                    self._server_to_tool_map[server_name] = []
-                    for tool in new_tools:
-                        namespaced_tool_name = create_namespaced_name(server_name, tool.name)
-                        namespaced_tool = NamespacedTool(
-                            tool=tool,
-                            server_name=server_name,
-                            namespaced_tool_name=namespaced_tool_name,
-                        )
-
-                        self._namespaced_tool_map[namespaced_tool_name] = namespaced_tool
-                        self._server_to_tool_map[server_name].append(namespaced_tool)
+                    self._index_server_tools(server_name, new_tools)
+                    self._invalidate_tool_list()
 
                 logger.info(
                     f"Successfully refreshed tools for server '{server_name}'",
@@ -1038,16 +1377,64 @@ class MCPAggregator(ContextDependent):
         if not self.server_names:
             raise ValueError("No servers available to get resource from")
 
-        # Try each server in order - simply attempt to get the resource
-        for s_name in self.server_names:
+        # Go straight to the server known to serve this URI, if any
+        indexed_server = self._server_for_resource(resource_uri)
+        if indexed_server:
             try:
-                return await self._get_resource_from_server(s_name, resource_uri)
-            except Exception:
-                # Continue to next server if not found
-                continue
+                return await self._get_resource_from_server(indexed_server, resource_uri)
+            except Exception as e:
+                logger.debug(f"Indexed server '{indexed_server}' failed for {resource_uri}: {e}")
 
-        # If we reach here, we couldn't find the resource on any server
-        raise ValueError(f"Resource '{resource_uri}' not found on any server")
+        # Query all servers concurrently, preferring earlier servers
+        s_name, result = await self._first_success(
+            self.server_names,
+            lambda s_name: self._get_resource_from_server(s_name, resource_uri),
+        )
+        if result is None:
+            raise ValueError(f"Resource '{resource_uri}' not found on any server")
+
+        self._index_resources(s_name, [resource_uri])
+        return result
+
+    @staticmethod
+    def _resource_uri_prefixes(resource_uri: str) -> List[str]:
+        """
+        Prefixes of a URI at path boundaries, longest first: the URI itself, then each
+        parent path down to scheme://authority. URIs without an authority (file:///...)
+        stop at their top-level directory, as a bare scheme:/// would match every URI of
+        the scheme.
+        """
+        scheme, sep, rest = resource_uri.partition("://")
+        if not sep:
+            return [resource_uri]
+
+        prefixes = [resource_uri]
+        path = rest.rstrip("/")
+        while "/" in path:
+            path = path.rsplit("/", 1)[0]
+            if path:
+                prefixes.append(f"{scheme}://{path}/")
+        authority = rest.split("/", 1)[0]
+        if authority:
+            prefixes.append(f"{scheme}://{authority}")
+        return list(dict.fromkeys(prefixes))
+
+    def _index_resources(self, server_name: str, resource_uris: List[str]) -> None:
+        """Record that a server serves resources under the prefixes of these URIs."""
+        for resource_uri in resource_uris:
+            for prefix in self._resource_uri_prefixes(resource_uri):
+                self._resource_prefix_index.setdefault(prefix, set()).add(server_name)
+
+    def _server_for_resource(self, resource_uri: str) -> str | None:
+        """
+        The server serving the longest indexed prefix of a URI, if exactly one server is
+        known for that prefix.
+        """
+        for prefix in self._resource_uri_prefixes(resource_uri):
+            servers = self._resource_prefix_index.get(prefix)
+            if servers:
+                return next(iter(servers)) if len(servers) == 1 else None
+        return None
 
     async def _get_resource_from_server(
         self, server_name: str, resource_uri: str
@@ -1111,20 +1498,15 @@ class MCPAggregator(ContextDependent):
         if not self.initialized:
             await self.load_servers()
 
-        results: Dict[str, List[str]] = {}
-
         # Get the list of servers to check
-        servers_to_check = [server_name] if server_name else self.server_names
-
-        # For each server, try to list its resources
-        for s_name in servers_to_check:
+        servers_to_check = []
+        for s_name in [server_name] if server_name else self.server_names:
             if s_name not in self.server_names:
                 logger.error(f"Server '{s_name}' not found")
                 continue
+            servers_to_check.append(s_name)
 
-            # Initialize empty list for this server
-            results[s_name] = []
-
+        async def fetch_resources(s_name: str) -> List[str]:
             try:
                 # Use the _execute_on_server method to call list_resources on the server
                 result = await self._execute_on_server(
@@ -1138,9 +1520,13 @@ class MCPAggregator(ContextDependent):
 
                 # Get resources from result
                 resources = getattr(result, "resources", [])
-                results[s_name] = [str(r.uri) for r in resources]
+                resource_uris = [str(r.uri) for r in resources]
+                self._index_resources(s_name, resource_uris)
+                return resource_uris
 
             except Exception as e:
                 logger.error(f"Error fetching resources from {s_name}: {e}")
+                return []
 
-        return results
+        # List resources from all servers concurrently
+        return await self._gather_servers(servers_to_check, fetch_resources)
@@ -2,18 +2,33 @@
 Manages the lifecycle of multiple MCP server connections.
 """
 
-import asyncio
+import time
 import traceback
+from contextlib import asynccontextmanager
 from datetime import timedelta
 from typing import (
     TYPE_CHECKING,
     AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
     Callable,
     Dict,
+    List,
     Optional,
 )
 
-from anyio import Event, Lock, create_task_group
+from anyio import (
+    BrokenResourceError,
+    CancelScope,
+    ClosedResourceError,
+    EndOfStream,
+    Event,
+    Lock,
+    create_task_group,
+    fail_after,
+    move_on_after,
+    sleep,
+)
 from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 from httpx import HTTPStatusError
 from mcp import ClientSession
@@ -24,11 +39,14 @@ from mcp.client.stdio import (
     stdio_client,
 )
 from mcp.client.streamable_http import GetSessionIdCallback, streamablehttp_client
+from pydantic import BaseModel, Field
+
+from mcp_agent._mcp_local_backup.circuit_breaker import CircuitBreaker, CircuitState, ServerHealth
 from mcp_agent._mcp_local_backup.mcp_compatibility import JSONRPCMessage, ServerCapabilities
 
-from mcp_agent.config import MCPServerSettings
+from mcp_agent.config import MCPReconnectSettings, MCPServerPoolSettings, MCPServerSettings
 from mcp_agent.context_dependent import ContextDependent
-from mcp_agent.core.exceptions import ServerInitializationError
+from mcp_agent.core.exceptions import ServerInitializationError, ServerUnavailableError
 from mcp_agent.event_progress import ProgressAction
 from mcp_agent.logger.logger import get_logger
 from mcp_agent._mcp_local_backup.logger_textio import get_stderr_handler
@@ -40,6 +58,12 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# How long to wait for connections to close after cancelling them at shutdown
+KILL_GRACE_SECONDS = 2.0
+
+# Errors raised by a session whose transport has gone away
+CONNECTION_ERRORS = (BrokenResourceError, ClosedResourceError, EndOfStream, ConnectionError)
+
 
 class StreamingContextAdapter:
     """Adapter to provide a 3-value context from a 2-value context manager"""
@@ -62,6 +86,34 @@ def _add_none_to_context(context_manager):
     return StreamingContextAdapter(context_manager)
 
 
+class ServerStartupReport(BaseModel):
+    """
+    Outcome of launching a group of servers concurrently.
+    """
+
+    started: Dict[str, float] = Field(default_factory=dict)
+    """Servers that initialized successfully, mapped to their startup time in seconds."""
+
+    failed: Dict[str, str] = Field(default_factory=dict)
+    """Servers that failed or timed out during startup, mapped to the error message."""
+
+
+class ServerShutdownReport(BaseModel):
+    """
+    Outcome of shutting down a connection manager's servers.
+    """
+
+    stopped: Dict[str, float] = Field(default_factory=dict)
+    """Servers that exited after the shutdown request, mapped to the time taken in seconds."""
+
+    killed: Dict[str, float] = Field(default_factory=dict)
+    """Servers still running at the shutdown deadline, whose connection was cancelled (and
+    stdio process killed), mapped to the time taken in seconds."""
+
+    unresponsive: List[str] = Field(default_factory=list)
+    """Servers whose connection had still not closed after being cancelled."""
+
+
 class ServerConnection:
     """
     Represents a long-lived MCP server connection, including:
@@ -106,9 +158,28 @@ class ServerConnection:
         self._error_occurred = False
         self._error_message = None
 
+        # Cancel scope of the lifecycle task, used to abort a stalled startup
+        self._cancel_scope: CancelScope | None = None
+        # Set when the lifecycle task has exited and the transport is closed
+        self._closed_event = Event()
+
+        # Set once the session has initialized; a connection that ends after this
+        # without a shutdown request was lost
+        self._was_initialized = False
+        self._on_lost: Callable[["ServerConnection"], None] | None = None
+
     def is_healthy(self) -> bool:
         """Check if the server connection is healthy and ready to use."""
-        return self.session is not None and not self._error_occurred
+        return (
+            self.session is not None
+            and self._initialized_event.is_set()
+            and not self._error_occurred
+        )
+
+    @property
+    def is_starting(self) -> bool:
+        """Whether the connection is still being established (neither ready nor failed)."""
+        return not self._initialized_event.is_set() and not self._closed_event.is_set()
 
     def reset_error_state(self) -> None:
         """Reset the error state, allowing reconnection attempts."""
@@ -121,6 +192,37 @@ class ServerConnection:
         """
         self._shutdown_event.set()
 
+    def abort(self, reason: str) -> None:
+        """
+        Cancel the lifecycle task immediately, without waiting for a clean shutdown.
+        Used when the server does not finish initializing in time.
+        """
+        self._error_occurred = True
+        self._error_message = reason
+        self._shutdown_event.set()
+        if self._cancel_scope is not None:
+            self._cancel_scope.cancel()
+        self._initialized_event.set()
+
+    def kill(self) -> None:
+        """
+        Cancel the lifecycle task without waiting for a clean shutdown. Cancelling closes
+        the transport; a stdio server process that has not exited is killed.
+        """
+        self._shutdown_event.set()
+        if self._cancel_scope is not None:
+            self._cancel_scope.cancel()
+
+    @property
+    def is_closed(self) -> bool:
+        return self._closed_event.is_set()
+
+    async def wait_for_closed(self) -> None:
+        """
+        Wait until the lifecycle task has exited.
+        """
+        await self._closed_event.wait()
+
     async def wait_for_shutdown_request(self) -> None:
         """
         Wait until the shutdown event is set.
@@ -142,6 +244,7 @@ class ServerConnection:
             self._init_hook(self.session, self.server_config.auth)
 
         # Now the session is ready for use
+        self._was_initialized = True
         self._initialized_event.set()
 
     async def wait_for_initialized(self) -> None:
@@ -180,65 +283,325 @@ async def _server_lifecycle_task(server_conn: ServerConnection) -> None:
     Runs inside the MCPConnectionManager's shared TaskGroup.
     """
     server_name = server_conn.server_name
-    try:
-        transport_context = server_conn._transport_context_factory()
+    with CancelScope() as cancel_scope:
+        server_conn._cancel_scope = cancel_scope
+        try:
+            transport_context = server_conn._transport_context_factory()
+
+            async with transport_context as (read_stream, write_stream, _):
+                server_conn.create_session(read_stream, write_stream)
+
+                async with server_conn.session:
+                    await server_conn.initialize_session()
+                    await server_conn.wait_for_shutdown_request()
+
+        except HTTPStatusError as http_exc:
+            logger.error(
+                f"{server_name}: Lifecycle task encountered HTTP error: {http_exc}",
+                exc_info=True,
+                data={
+                    "progress_action": ProgressAction.FATAL_ERROR,
+                    "server_name": server_name,
+                },
+            )
+            server_conn._error_occurred = True
+            server_conn._error_message = f"HTTP Error: {http_exc.response.status_code} {http_exc.response.reason_phrase} for URL: {http_exc.request.url}"
+            server_conn._initialized_event.set()
+            # No raise - let get_server handle it with a friendly message
+
+        except Exception as exc:
+            logger.error(
+                f"{server_name}: Lifecycle task encountered an error: {exc}",
+                exc_info=True,
+                data={
+                    "progress_action": ProgressAction.FATAL_ERROR,
+                    "server_name": server_name,
+                },
+            )
+            server_conn._error_occurred = True
+
+            if "ExceptionGroup" in type(exc).__name__ and hasattr(exc, "exceptions"):
+                # Handle ExceptionGroup better by extracting the actual errors
+                error_messages = []
+                for subexc in exc.exceptions:
+                    if isinstance(subexc, HTTPStatusError):
+                        # Special handling for HTTP errors to make them more user-friendly
+                        error_messages.append(
+                            f"HTTP Error: {subexc.response.status_code} {subexc.response.reason_phrase} for URL: {subexc.request.url}"
+                        )
+                    else:
+                        error_messages.append(f"Error: {type(subexc).__name__}: {subexc}")
+                    if hasattr(subexc, "__cause__") and subexc.__cause__:
+                        error_messages.append(
+                            f"Caused by: {type(subexc.__cause__).__name__}: {subexc.__cause__}"
+                        )
+                server_conn._error_message = error_messages
+            else:
+                # For regular exceptions, keep the traceback but format it more cleanly
+                server_conn._error_message = traceback.format_exception(exc)
+
+            # If there's an error, we should also set the event so that
+            # 'get_server' won't hang
+            server_conn._initialized_event.set()
+            # No raise - allow graceful exit
 
-        async with transport_context as (read_stream, write_stream, _):
-            server_conn.create_session(read_stream, write_stream)
+    # An established connection that ended without being asked to was lost
+    if server_conn._was_initialized and not server_conn._shutdown_event.is_set():
+        server_conn._error_occurred = True
+        server_conn._error_message = server_conn._error_message or "Connection lost"
+        if server_conn._on_lost is not None:
+            server_conn._on_lost(server_conn)
 
-            async with server_conn.session:
-                await server_conn.initialize_session()
-                await server_conn.wait_for_shutdown_request()
+    server_conn._closed_event.set()
 
-    except HTTPStatusError as http_exc:
-        logger.error(
-            f"{server_name}: Lifecycle task encountered HTTP error: {http_exc}",
-            exc_info=True,
-            data={
-                "progress_action": ProgressAction.FATAL_ERROR,
-                "server_name": server_name,
-            },
+
+class ServerLaunch:
+    """
+    A launch of a server in progress. Callers that need the server while it is starting
+    wait for this launch and share its outcome instead of starting another connection.
+    """
+
+    def __init__(self) -> None:
+        self.connection: ServerConnection | None = None
+        self.error: Exception | None = None
+        self._done = Event()
+
+    def finish(self, connection: ServerConnection | None, error: Exception | None) -> None:
+        self.connection = connection
+        self.error = error
+        self._done.set()
+
+    async def wait(self) -> ServerConnection | None:
+        """
+        Wait for the launch to finish.
+
+        Returns:
+            The started connection, or None if the launch was cancelled
+        """
+        await self._done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.connection
+
+
+class ServerPoolStats(BaseModel):
+    """
+    Metrics for the session pool of a single server.
+    """
+
+    sessions: int = 0
+    """Open sessions, including the primary connection."""
+
+    in_flight: int = 0
+    """Calls currently running across all sessions."""
+
+    peak_in_flight: int = 0
+    """Highest number of calls running at the same time."""
+
+    checkouts: int = 0
+    """Calls routed through the pool."""
+
+    sessions_created: int = 0
+    """Additional sessions opened by the pool."""
+
+    sessions_reaped: int = 0
+    """Additional sessions closed after being idle."""
+
+    spawn_failures: int = 0
+    """Additional sessions that failed to start."""
+
+
+class PooledSession:
+    """A pool member: a server connection and the number of calls running on it."""
+
+    def __init__(self, connection: ServerConnection) -> None:
+        self.connection = connection
+        self.in_flight = 0
+        self.last_used = time.monotonic()
+
+
+class ServerSessionPool:
+    """
+    Spreads concurrent calls to one server across several sessions.
+
+    The primary connection is the one held by MCPConnectionManager.running_servers; the
+    pool opens additional connections (up to max_sessions) in the background when every
+    session is busy, hands each call the least loaded live session, and closes additional
+    sessions that stay idle beyond idle_timeout_seconds (never dropping below min_sessions).
+    """
+
+    def __init__(
+        self,
+        manager: "MCPConnectionManager",
+        server_name: str,
+        settings: MCPServerPoolSettings,
+        client_session_factory: Callable,
+    ) -> None:
+        self.server_name = server_name
+        self.settings = settings
+        self._manager = manager
+        self._client_session_factory = client_session_factory
+        self._primary: PooledSession | None = None
+        self._additional: List[PooledSession] = []
+        self._spawning = 0
+        self._started = False
+        self._closed = Event()
+        self._stats = ServerPoolStats()
+
+    @property
+    def sessions(self) -> List[PooledSession]:
+        primary = [self._primary] if self._primary is not None else []
+        return primary + self._additional
+
+    def stats(self) -> ServerPoolStats:
+        """Current pool metrics."""
+        sessions = self.sessions
+        return self._stats.model_copy(
+            update={
+                "sessions": len(sessions),
+                "in_flight": sum(pooled.in_flight for pooled in sessions),
+            }
         )
-        server_conn._error_occurred = True
-        server_conn._error_message = f"HTTP Error: {http_exc.response.status_code} {http_exc.response.reason_phrase} for URL: {http_exc.request.url}"
-        server_conn._initialized_event.set()
-        # No raise - let get_server handle it with a friendly message
-
-    except Exception as exc:
-        logger.error(
-            f"{server_name}: Lifecycle task encountered an error: {exc}",
-            exc_info=True,
-            data={
-                "progress_action": ProgressAction.FATAL_ERROR,
-                "server_name": server_name,
-            },
+
+    @asynccontextmanager
+    async def checkout(self) -> AsyncIterator[ClientSession]:
+        """
+        Check out the least loaded session for the duration of one call. When every
+        session is busy the pool grows, but the call does not wait for the new session
+        to start.
+        """
+        await self._refresh_primary()
+        self._start()
+        self._drop_unhealthy()
+
+        pooled = self._least_loaded()
+        if pooled.in_flight > 0 and self._can_grow():
+            self._start_spawn()
+
+        pooled.in_flight += 1
+        self._stats.checkouts += 1
+        in_flight = sum(session.in_flight for session in self.sessions)
+        self._stats.peak_in_flight = max(self._stats.peak_in_flight, in_flight)
+        try:
+            yield pooled.connection.session
+        finally:
+            pooled.in_flight -= 1
+            pooled.last_used = time.monotonic()
+
+    async def _refresh_primary(self) -> None:
+        connection = await self._manager.get_server(
+            self.server_name, client_session_factory=self._client_session_factory
+        )
+        if self._primary is None or self._primary.connection is not connection:
+            self._primary = PooledSession(connection)
+
+    def _start(self) -> None:
+        """Open the min_sessions warm sessions and start idle reaping on first use."""
+        if self._started:
+            return
+        self._started = True
+        for _ in range(self.settings.min_sessions - len(self.sessions)):
+            self._start_spawn()
+        if self.settings.max_sessions > self.settings.min_sessions:
+            self._manager._tg.start_soon(self._reap_idle_sessions)
+
+    def _least_loaded(self) -> PooledSession:
+        return min(self.sessions, key=lambda pooled: pooled.in_flight)
+
+    def _can_grow(self) -> bool:
+        return (
+            not self._closed.is_set()
+            and len(self.sessions) + self._spawning < self.settings.max_sessions
         )
-        server_conn._error_occurred = True
 
-        if "ExceptionGroup" in type(exc).__name__ and hasattr(exc, "exceptions"):
-            # Handle ExceptionGroup better by extracting the actual errors
-            error_messages = []
-            for subexc in exc.exceptions:
-                if isinstance(subexc, HTTPStatusError):
-                    # Special handling for HTTP errors to make them more user-friendly
-                    error_messages.append(
-                        f"HTTP Error: {subexc.response.status_code} {subexc.response.reason_phrase} for URL: {subexc.request.url}"
-                    )
-                else:
-                    error_messages.append(f"Error: {type(subexc).__name__}: {subexc}")
-                if hasattr(subexc, "__cause__") and subexc.__cause__:
-                    error_messages.append(
-                        f"Caused by: {type(subexc.__cause__).__name__}: {subexc.__cause__}"
-                    )
-            server_conn._error_message = error_messages
-        else:
-            # For regular exceptions, keep the traceback but format it more cleanly
-            server_conn._error_message = traceback.format_exception(exc)
+    def _drop_unhealthy(self) -> None:
+        for pooled in list(self._additional):
+            if not pooled.connection.is_healthy():
+                self._additional.remove(pooled)
+                pooled.connection.request_shutdown()
 
-        # If there's an error, we should also set the event so that
-        # 'get_server' won't hang
-        server_conn._initialized_event.set()
-        # No raise - allow graceful exit
+    def _start_spawn(self) -> None:
+        """Open an additional session in the background."""
+        # Counted now, so calls checked out before it starts do not spawn more
+        self._spawning += 1
+        self._manager._tg.start_soon(self._spawn)
+
+    async def _spawn(self) -> None:
+        """Open an additional session counted by _start_spawn."""
+        try:
+            connection = self._manager._create_connection(
+                self.server_name, client_session_factory=self._client_session_factory
+            )
+            self._manager._tg.start_soon(_server_lifecycle_task, connection)
+
+            startup_timeout = connection.server_config.startup_timeout_seconds
+            try:
+                with fail_after(startup_timeout):
+                    await connection.wait_for_initialized()
+            except TimeoutError:
+                connection.abort(f"Timed out after {startup_timeout}s waiting for initialization")
+
+            if not connection.is_healthy() or self._closed.is_set():
+                connection.request_shutdown()
+                if not connection.is_healthy():
+                    self._stats.spawn_failures += 1
+                    logger.warning(f"{self.server_name}: Failed to open pooled session")
+                return
+
+            self._additional.append(PooledSession(connection))
+            self._stats.sessions_created += 1
+            logger.debug(
+                f"{self.server_name}: Opened pooled session ({len(self.sessions)} open)"
+            )
+        finally:
+            self._spawning -= 1
+
+    def reap_idle(self, now: float | None = None) -> int:
+        """
+        Close additional sessions idle for longer than idle_timeout_seconds.
+
+        Returns:
+            Number of sessions closed
+        """
+        now = time.monotonic() if now is None else now
+        reaped = 0
+        for pooled in list(self._additional):
+            if len(self.sessions) <= self.settings.min_sessions:
+                break
+            idle = now - pooled.last_used
+            if pooled.in_flight == 0 and idle >= self.settings.idle_timeout_seconds:
+                self._additional.remove(pooled)
+                pooled.connection.request_shutdown()
+                reaped += 1
+
+        if reaped:
+            self._stats.sessions_reaped += reaped
+            logger.debug(
+                f"{self.server_name}: Closed {reaped} idle pooled session(s) "
+                f"({len(self.sessions)} open)"
+            )
+        return reaped
+
+    async def _reap_idle_sessions(self) -> None:
+        interval = self.settings.idle_timeout_seconds / 2
+        while not self._closed.is_set():
+            with move_on_after(interval):
+                await self._closed.wait()
+            self.reap_idle()
+
+    def close(self) -> List[ServerConnection]:
+        """Stop reaping and shut down the additional sessions. The primary is left to
+        the connection manager.
+
+        Returns:
+            The connections that were asked to shut down
+        """
+        self._closed.set()
+        connections = [pooled.connection for pooled in self._additional]
+        for connection in connections:
+            connection.request_shutdown()
+        self._additional.clear()
+        return connections
 
 
 class MCPConnectionManager(ContextDependent):
@@ -248,11 +611,27 @@ class MCPConnectionManager(ContextDependent):
     """
 
     def __init__(
-        self, server_registry: "ServerRegistry", context: Optional["Context"] = None
+        self,
+        server_registry: "ServerRegistry",
+        context: Optional["Context"] = None,
+        shutdown_timeout: float = 5.0,
     ) -> None:
         super().__init__(context=context)
         self.server_registry = server_registry
+        self.shutdown_timeout = shutdown_timeout
+        self.shutdown_report = ServerShutdownReport()
         self.running_servers: Dict[str, ServerConnection] = {}
+        self._pools: Dict[str, ServerSessionPool] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        # Background reconnection loops
+        self._reconnect_scopes: Dict[str, CancelScope] = {}
+        # Launches in progress, shared by every caller that needs the server meanwhile
+        self._launches: Dict[str, ServerLaunch] = {}
+        # Usage of each server, for shutting down servers that have been idle too long
+        self._in_use: Dict[str, int] = {}
+        self._last_used: Dict[str, float] = {}
+        self._reaper_started = False
+        self._closed = Event()
         self._lock = Lock()
         # Manage our own task group - independent of task context
         self._task_group = None
@@ -269,15 +648,15 @@ class MCPConnectionManager(ContextDependent):
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Ensure clean shutdown of all connections before exiting."""
+        self._closed.set()
         try:
-            # First request all servers to shutdown
-            await self.disconnect_all()
+            # Shut down all servers, waiting at most shutdown_timeout for them to exit
+            self.shutdown_report = await self.shutdown()
 
-            # Add a small delay to allow for clean shutdown
-            await asyncio.sleep(0.5)
-
-            # Then close the task group if it's active
+            # Then close the task group if it's active; anything still running in it
+            # (including servers that ignored cancellation) is abandoned
             if self._task_group_active:
+                self._task_group.cancel_scope.cancel()
                 await self._task_group.__aexit__(exc_type, exc_val, exc_tb)
                 self._task_group_active = False
                 self._task_group = None
@@ -285,27 +664,15 @@ class MCPConnectionManager(ContextDependent):
         except Exception as e:
             logger.error(f"Error during connection manager shutdown: {e}")
 
-    async def launch_server(
+    def _create_connection(
         self,
         server_name: str,
-        client_session_factory: Callable[
-            [MemoryObjectReceiveStream, MemoryObjectSendStream, timedelta | None],
-            ClientSession,
-        ],
+        client_session_factory: Callable,
         init_hook: Optional["InitHookCallable"] = None,
     ) -> ServerConnection:
         """
-        Connect to a server and return a RunningServer instance that will persist
-        until explicitly disconnected.
+        Build a (not yet started) connection to a server from its registry configuration.
         """
-        # Create task group if it doesn't exist yet - make this method more resilient
-        if not self._task_group_active:
-            self._task_group = create_task_group()
-            await self._task_group.__aenter__()
-            self._task_group_active = True
-            self._tg = self._task_group
-            logger.info(f"Auto-created task group for server: {server_name}")
-
         config = self.server_registry.registry.get(server_name)
         if not config:
             raise ValueError(f"Server '{server_name}' not found in registry.")
@@ -338,7 +705,7 @@ class MCPConnectionManager(ContextDependent):
             else:
                 raise ValueError(f"Unsupported transport: {config.transport}")
 
-        server_conn = ServerConnection(
+        return ServerConnection(
             server_name=server_name,
             server_config=config,
             transport_context_factory=transport_context_factory,
@@ -346,14 +713,43 @@ class MCPConnectionManager(ContextDependent):
             init_hook=init_hook or self.server_registry.init_hooks.get(server_name),
         )
 
+    async def launch_server(
+        self,
+        server_name: str,
+        client_session_factory: Callable[
+            [MemoryObjectReceiveStream, MemoryObjectSendStream, timedelta | None],
+            ClientSession,
+        ],
+        init_hook: Optional["InitHookCallable"] = None,
+    ) -> ServerConnection:
+        """
+        Connect to a server and return a RunningServer instance that will persist
+        until explicitly disconnected.
+        """
+        # Create task group if it doesn't exist yet - make this method more resilient
+        if not self._task_group_active:
+            self._task_group = create_task_group()
+            await self._task_group.__aenter__()
+            self._task_group_active = True
+            self._tg = self._task_group
+            logger.info(f"Auto-created task group for server: {server_name}")
+
+        server_conn = self._create_connection(server_name, client_session_factory, init_hook)
+
         async with self._lock:
             # Check if already running
             if server_name in self.running_servers:
                 return self.running_servers[server_name]
 
+            server_conn._on_lost = self._connection_lost
             self.running_servers[server_name] = server_conn
             self._tg.start_soon(_server_lifecycle_task, server_conn)
 
+            self._last_used[server_name] = time.monotonic()
+            if self._idle_ttl(server_name) and not self._reaper_started:
+                self._reaper_started = True
+                self._tg.start_soon(self._close_idle_connections)
+
         logger.info(f"{server_name}: Up and running with a persistent connection!")
         return server_conn
 
@@ -365,15 +761,83 @@ class MCPConnectionManager(ContextDependent):
     ) -> ServerConnection:
         """
         Get a running server instance, launching it if needed.
+
+        Raises:
+            ServerUnavailableError: The server's circuit breaker is open after repeated
+                connection failures
+            ServerInitializationError: The server failed to start
         """
-        # Get the server connection if it's already running and healthy
-        async with self._lock:
-            server_conn = self.running_servers.get(server_name)
-            if server_conn and server_conn.is_healthy():
+
+        async def connect() -> ServerConnection:
+            breaker = self._breaker(server_name)
+            if not breaker.allow_attempt():
+                raise ServerUnavailableError(
+                    f"MCP Server '{server_name}' is unavailable",
+                    f"{breaker.consecutive_failures} consecutive connection failures; "
+                    f"next attempt in {breaker.retry_in():.1f}s",
+                )
+            try:
+                server_conn = await self._start_server(
+                    server_name, client_session_factory, init_hook
+                )
+            except ServerInitializationError:
+                self._record_failure(server_name)
+                raise
+            self._record_success(server_name)
+            return server_conn
+
+        return await self._launch_once(server_name, connect)
+
+    async def _launch_once(
+        self, server_name: str, connect: Callable[[], Awaitable[ServerConnection]]
+    ) -> ServerConnection:
+        """
+        Return the server's connection if it is ready. Otherwise run connect(), unless a
+        launch of the server (by another caller or a reconnection attempt) is already in
+        progress, in which case wait for that launch and share its outcome.
+        """
+        while True:
+            async with self._lock:
+                server_conn = self.running_servers.get(server_name)
+                if server_conn and server_conn.is_healthy():
+                    return server_conn
+                launch = self._launches.get(server_name)
+                if launch is None:
+                    launch = ServerLaunch()
+                    self._launches[server_name] = launch
+                    break
+            server_conn = await launch.wait()
+            if server_conn is not None:
                 return server_conn
+            # The launching caller was cancelled: try again
 
-            # If server exists but isn't healthy, remove it so we can create a new one
-            if server_conn:
+        server_conn, error = None, None
+        try:
+            server_conn = await connect()
+            return server_conn
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            if self._launches.get(server_name) is launch:
+                del self._launches[server_name]
+            launch.finish(server_conn, error)
+
+    async def _start_server(
+        self,
+        server_name: str,
+        client_session_factory: Callable,
+        init_hook: Optional["InitHookCallable"] = None,
+    ) -> ServerConnection:
+        """
+        Replace any unhealthy connection to a server with a new one, and wait for it to
+        initialize.
+        """
+        async with self._lock:
+            server_conn = self.running_servers.get(server_name)
+            # If server exists but isn't healthy, remove it so we can create a new one; a
+            # connection still starting is waited for instead
+            if server_conn and not server_conn.is_healthy() and not server_conn.is_starting:
                 logger.info(f"{server_name}: Server exists but is unhealthy, recreating...")
                 self.running_servers.pop(server_name)
                 server_conn.request_shutdown()
@@ -386,7 +850,22 @@ class MCPConnectionManager(ContextDependent):
         )
 
         # Wait until it's fully initialized, or an error occurs
-        await server_conn.wait_for_initialized()
+        startup_timeout = server_conn.server_config.startup_timeout_seconds
+        try:
+            with fail_after(startup_timeout):
+                await server_conn.wait_for_initialized()
+        except TimeoutError:
+            async with self._lock:
+                if self.running_servers.get(server_name) is server_conn:
+                    self.running_servers.pop(server_name)
+            server_conn.abort(f"Timed out after {startup_timeout}s waiting for initialization")
+            logger.error(
+                f"{server_name}: Startup timed out after {startup_timeout}s",
+                data={
+                    "progress_action": ProgressAction.FATAL_ERROR,
+                    "server_name": server_name,
+                },
+            )
 
         # Check if the server is healthy after initialization
         if not server_conn.is_healthy():
@@ -406,6 +885,286 @@ class MCPConnectionManager(ContextDependent):
 
         return server_conn
 
+    def _reconnect_settings(self, server_name: str) -> MCPReconnectSettings:
+        config = self.server_registry.registry.get(server_name)
+        if isinstance(config, MCPServerSettings):
+            return config.reconnect
+        return MCPReconnectSettings()
+
+    def _breaker(self, server_name: str) -> CircuitBreaker:
+        breaker = self._breakers.get(server_name)
+        if breaker is None:
+            breaker = CircuitBreaker(self._reconnect_settings(server_name))
+            self._breakers[server_name] = breaker
+        return breaker
+
+    def server_health(self, server_name: str) -> ServerHealth:
+        """Circuit breaker state of a server."""
+        return self._breaker(server_name).health()
+
+    def health(self) -> Dict[str, ServerHealth]:
+        """Circuit breaker state of every server this manager has connected to."""
+        return {name: breaker.health() for name, breaker in self._breakers.items()}
+
+    def _emit_health(self, server_name: str, message: str) -> None:
+        """Log a change in a server's health as a progress event."""
+        health = self.server_health(server_name)
+        if health.state == CircuitState.CLOSED and health.consecutive_failures == 0:
+            action, log = ProgressAction.INITIALIZED, logger.info
+        elif health.state == CircuitState.OPEN:
+            action, log = ProgressAction.FATAL_ERROR, logger.error
+        else:
+            action, log = ProgressAction.RECONNECTING, logger.warning
+        log(
+            f"{server_name}: {message}",
+            data={
+                "progress_action": action,
+                "target": server_name,
+                "server_name": server_name,
+                "error_message": message,
+                "circuit_state": health.state.value,
+                "consecutive_failures": health.consecutive_failures,
+                "retry_in_seconds": round(health.retry_in_seconds, 2),
+            },
+        )
+
+    def _record_success(self, server_name: str) -> None:
+        breaker = self._breaker(server_name)
+        recovered = breaker.consecutive_failures > 0
+        breaker.record_success()
+        if recovered:
+            self._emit_health(server_name, "Reconnected")
+
+    def _record_failure(self, server_name: str) -> None:
+        breaker = self._breaker(server_name)
+        breaker.record_failure()
+        if breaker.state == CircuitState.OPEN:
+            self._emit_health(
+                server_name,
+                f"Circuit open after {breaker.consecutive_failures} consecutive failures",
+            )
+
+    def connection_failed(
+        self, server_name: str, session: ClientSession, error: BaseException
+    ) -> None:
+        """
+        Report an error raised by a session. If it shows the transport has gone away, the
+        connection is dropped and reconnected in the background.
+        """
+        if not isinstance(error, CONNECTION_ERRORS):
+            return
+        server_conn = self.running_servers.get(server_name)
+        if server_conn is None or server_conn.session is not session:
+            return
+        server_conn.abort(f"Connection lost: {type(error).__name__}: {error}")
+        self._connection_lost(server_conn)
+
+    def _connection_lost(self, server_conn: ServerConnection) -> None:
+        """
+        Called when an established connection drops without a shutdown request. Records
+        the failure and starts a background reconnection loop.
+        """
+        server_name = server_conn.server_name
+        if self.running_servers.get(server_name) is not server_conn:
+            return
+        self._breaker(server_name).record_failure()
+        self._emit_health(server_name, "Connection lost")
+
+        settings = self._reconnect_settings(server_name)
+        if (
+            settings.enabled
+            and self._task_group_active
+            and server_name not in self._reconnect_scopes
+        ):
+            scope = CancelScope()
+            self._reconnect_scopes[server_name] = scope
+            self._tg.start_soon(
+                self._reconnect,
+                scope,
+                server_name,
+                server_conn._client_session_factory,
+                server_conn._init_hook,
+            )
+
+    async def _reconnect(
+        self,
+        scope: CancelScope,
+        server_name: str,
+        client_session_factory: Callable,
+        init_hook: Optional["InitHookCallable"] = None,
+    ) -> None:
+        """
+        Reconnect to a server with exponential backoff, until it succeeds, the attempt
+        limit is reached or the server is disconnected.
+        """
+        settings = self._reconnect_settings(server_name)
+        breaker = self._breaker(server_name)
+        attempts = 0
+        with scope:
+            try:
+                while settings.max_attempts is None or attempts < settings.max_attempts:
+                    if breaker.state == CircuitState.OPEN:
+                        delay = breaker.retry_in()
+                    else:
+                        delay = breaker.backoff_delay()
+                    await sleep(delay)
+
+                    server_conn = self.running_servers.get(server_name)
+                    if server_conn is not None and server_conn.is_healthy():
+                        # Reconnected by a caller in the meantime
+                        return
+                    if not breaker.allow_attempt():
+                        continue
+
+                    attempts += 1
+                    self._emit_health(server_name, f"Reconnecting (attempt {attempts})")
+
+                    async def connect() -> ServerConnection:
+                        try:
+                            server_conn = await self._start_server(
+                                server_name, client_session_factory, init_hook
+                            )
+                        except ServerInitializationError:
+                            self._record_failure(server_name)
+                            raise
+                        self._record_success(server_name)
+                        return server_conn
+
+                    try:
+                        await self._launch_once(server_name, connect)
+                    except (ServerInitializationError, ServerUnavailableError):
+                        continue
+                    return
+
+                self._emit_health(server_name, f"Giving up after {attempts} reconnection attempts")
+            finally:
+                if self._reconnect_scopes.get(server_name) is scope:
+                    self._reconnect_scopes.pop(server_name)
+
+    def _stop_reconnecting(self, server_name: str) -> None:
+        scope = self._reconnect_scopes.pop(server_name, None)
+        if scope is not None:
+            scope.cancel()
+
+    @asynccontextmanager
+    async def session(
+        self,
+        server_name: str,
+        client_session_factory: Callable,
+    ) -> AsyncIterator[ClientSession]:
+        """
+        Check out a session to a server for a single call, connecting if needed.
+
+        Servers configured with a pool spread concurrent calls across several sessions;
+        other servers share their single persistent connection.
+        """
+        self._in_use[server_name] = self._in_use.get(server_name, 0) + 1
+        try:
+            async with self._checkout(server_name, client_session_factory) as session:
+                yield session
+        finally:
+            self._in_use[server_name] -= 1
+            self._last_used[server_name] = time.monotonic()
+
+    @asynccontextmanager
+    async def _checkout(
+        self,
+        server_name: str,
+        client_session_factory: Callable,
+    ) -> AsyncIterator[ClientSession]:
+        config = self.server_registry.registry.get(server_name)
+        pool_settings = config.pool if isinstance(config, MCPServerSettings) else None
+        if pool_settings is None or pool_settings.max_sessions <= 1:
+            server_conn = await self.get_server(
+                server_name, client_session_factory=client_session_factory
+            )
+            yield server_conn.session
+            return
+
+        pool = self._pools.get(server_name)
+        if pool is None:
+            pool = ServerSessionPool(self, server_name, pool_settings, client_session_factory)
+            self._pools[server_name] = pool
+        async with pool.checkout() as session:
+            yield session
+
+    def _idle_ttl(self, server_name: str) -> float | None:
+        """Seconds a server may stay idle before it is disconnected (never if None)."""
+        config = self.server_registry.registry.get(server_name)
+        return config.idle_shutdown_seconds if isinstance(config, MCPServerSettings) else None
+
+    async def close_idle(self, now: float | None = None) -> List[str]:
+        """
+        Disconnect servers that are not in use and were last used (or connected) longer
+        ago than their idle TTL. They are connected again on next use.
+
+        Returns:
+            Names of the disconnected servers
+        """
+        now = time.monotonic() if now is None else now
+        idle = []
+        for server_name in list(self.running_servers):
+            idle_ttl = self._idle_ttl(server_name)
+            if (
+                idle_ttl
+                and self._in_use.get(server_name, 0) == 0
+                and now - self._last_used.get(server_name, now) >= idle_ttl
+            ):
+                idle.append(server_name)
+
+        for server_name in idle:
+            self._last_used.pop(server_name, None)
+            logger.info(f"{server_name}: Idle, shutting down until next use")
+            await self.disconnect_server(server_name)
+        return idle
+
+    async def _close_idle_connections(self) -> None:
+        while not self._closed.is_set():
+            idle_ttls = [ttl for name in self.running_servers if (ttl := self._idle_ttl(name))]
+            with move_on_after(min(idle_ttls) / 2 if idle_ttls else 1):
+                await self._closed.wait()
+            if not self._closed.is_set():
+                await self.close_idle()
+
+    def pool_stats(self) -> Dict[str, ServerPoolStats]:
+        """Metrics for each server with a session pool."""
+        return {name: pool.stats() for name, pool in self._pools.items()}
+
+    async def launch_servers(
+        self,
+        server_names: List[str],
+        client_session_factory: Callable[[str], Callable],
+    ) -> ServerStartupReport:
+        """
+        Launch several servers concurrently and wait for each to initialize or fail.
+        A slow or broken server does not block or prevent the others from starting.
+
+        Args:
+            server_names: Names of the servers to launch
+            client_session_factory: Called with a server name, returns the client session
+                factory to use for that server
+
+        Returns:
+            ServerStartupReport listing the servers that started and those that failed
+        """
+        report = ServerStartupReport()
+
+        async def start(server_name: str) -> None:
+            start_time = time.perf_counter()
+            try:
+                await self.get_server(
+                    server_name, client_session_factory=client_session_factory(server_name)
+                )
+                report.started[server_name] = time.perf_counter() - start_time
+            except Exception as e:
+                report.failed[server_name] = str(e)
+
+        async with create_task_group() as tg:
+            for server_name in server_names:
+                tg.start_soon(start, server_name)
+
+        return report
+
     async def get_server_capabilities(self, server_name: str) -> ServerCapabilities | None:
         """Get the capabilities of a specific server."""
         server_conn = await self.get_server(
@@ -420,21 +1179,36 @@ class MCPConnectionManager(ContextDependent):
         logger.info(f"{server_name}: Disconnecting persistent connection to server...")
 
         async with self._lock:
+            self._stop_reconnecting(server_name)
             server_conn = self.running_servers.pop(server_name, None)
+            pool = self._pools.pop(server_name, None)
+        if pool:
+            pool.close()
         if server_conn:
             server_conn.request_shutdown()
             logger.info(f"{server_name}: Shutdown signal sent (lifecycle task will exit).")
         else:
             logger.info(f"{server_name}: No persistent connection found. Skipping server shutdown")
 
-    async def disconnect_all(self) -> None:
-        """Disconnect all servers that are running under this connection manager."""
+    async def disconnect_all(self) -> List[ServerConnection]:
+        """
+        Disconnect all servers that are running under this connection manager.
+
+        Returns:
+            The connections that were asked to shut down (including pooled sessions)
+        """
         # Get a copy of servers to shutdown
         servers_to_shutdown = []
+        pooled_connections = []
 
         async with self._lock:
-            if not self.running_servers:
-                return
+            for server_name in list(self._reconnect_scopes):
+                self._stop_reconnecting(server_name)
+
+            pools = list(self._pools.values())
+            self._pools.clear()
+            for pool in pools:
+                pooled_connections.extend(pool.close())
 
             # Make a copy of the servers to shut down
             servers_to_shutdown = list(self.running_servers.items())
@@ -445,3 +1219,76 @@ class MCPConnectionManager(ContextDependent):
         for name, conn in servers_to_shutdown:
             logger.info(f"{name}: Requesting shutdown...")
             conn.request_shutdown()
+
+        return [conn for _, conn in servers_to_shutdown] + pooled_connections
+
+    async def shutdown(self, timeout: float | None = None) -> ServerShutdownReport:
+        """
+        Ask every server to shut down at once, and wait until their connections have
+        closed or the deadline passes. Connections still open at the deadline are
+        cancelled, which kills stdio server processes that have not exited.
+
+        Args:
+            timeout: Overall deadline in seconds (shutdown_timeout if not given)
+
+        Returns:
+            ServerShutdownReport with the time each server took to stop
+        """
+        timeout = self.shutdown_timeout if timeout is None else timeout
+        report = ServerShutdownReport()
+        start_time = time.perf_counter()
+        connections = await self.disconnect_all()
+
+        async def wait_closed(conn: ServerConnection, stopped: Dict[str, float]) -> None:
+            await conn.wait_for_closed()
+            # Pooled sessions share their server's name: report the slowest
+            elapsed = time.perf_counter() - start_time
+            stopped[conn.server_name] = max(stopped.get(conn.server_name, 0), elapsed)
+
+        async def wait_all(conns: List[ServerConnection], stopped: Dict[str, float]) -> None:
+            async with create_task_group() as tg:
+                for conn in conns:
+                    tg.start_soon(wait_closed, conn, stopped)
+
+        with move_on_after(timeout):
+            await wait_all(connections, report.stopped)
+
+        remaining = [conn for conn in connections if not conn.is_closed]
+        if remaining:
+            for conn in remaining:
+                logger.warning(f"{conn.server_name}: Did not shut down in {timeout}s, killing")
+                conn.kill()
+            with move_on_after(KILL_GRACE_SECONDS):
+                await wait_all(remaining, report.killed)
+            report.unresponsive = sorted(
+                {conn.server_name for conn in remaining if not conn.is_closed}
+            )
+
+        if connections:
+            logger.info(
+                f"Shut down {len(connections)} server connections in "
+                f"{time.perf_counter() - start_time:.2f}s",
+                data=report.model_dump(),
+            )
+        return report
+
+
+class IdleConnectionManager(MCPConnectionManager):
+    """
+    Connections for non-persistent aggregators. A server is connected on first use and
+    stays warm while in use and for idle_ttl seconds after its last use, then is closed,
+    so a burst of operations pays the process spawn and handshake once.
+    """
+
+    def __init__(
+        self,
+        server_registry: "ServerRegistry",
+        idle_ttl: float,
+        context: Optional["Context"] = None,
+        shutdown_timeout: float = 5.0,
+    ) -> None:
+        super().__init__(server_registry, context=context, shutdown_timeout=shutdown_timeout)
+        self.idle_ttl = idle_ttl
+
+    def _idle_ttl(self, server_name: str) -> float | None:
+        return self.idle_ttl
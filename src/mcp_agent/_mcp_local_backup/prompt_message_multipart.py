@@ -1,4 +1,4 @@
-from typing import List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
 
 from mcp.types import (
     EmbeddedResource,
@@ -8,10 +8,27 @@ from mcp.types import (
     Role,
     TextContent,
 )
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 from mcp_agent._mcp_local_backup.helpers.content_helpers import get_text
 
+T = TypeVar("T")
+
+
+def _snapshot(value: Any) -> Any:
+    """
+    The field values of a content block, recursively, as nested tuples. Unchanged values
+    are the same objects, so comparing snapshots is cheap even for large payloads, while
+    edits made in place are still detected.
+    """
+    if isinstance(value, BaseModel):
+        return (type(value), *map(_snapshot, value.__dict__.values()))
+    if isinstance(value, (list, tuple)):
+        return tuple(map(_snapshot, value))
+    if isinstance(value, dict):
+        return tuple((key, _snapshot(item)) for key, item in value.items())
+    return value
+
 
 class PromptMessageMultipart(BaseModel):
     """
@@ -22,6 +39,26 @@ class PromptMessageMultipart(BaseModel):
     role: Role
     content: List[Union[TextContent, ImageContent, EmbeddedResource]]
 
+    # Provider conversions of this message: format -> (content fingerprint, converted message)
+    _conversions: Dict[str, Tuple[Tuple[Any, ...], Any]] = PrivateAttr(default_factory=dict)
+
+    def converted(self, format_name: str, convert: Callable[["PromptMessageMultipart"], T]) -> T:
+        """
+        Return this message converted to a provider format, converting it only once.
+
+        The result is kept on the message and reused for as long as its role and content
+        are unchanged, including edits made to a content block in place, so history re-sent
+        every turn is not converted again. The result is shared between callers and must
+        not be modified.
+        """
+        fingerprint = (self.role, *map(_snapshot, self.content))
+        cached = self._conversions.get(format_name)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        result = convert(self)
+        self._conversions[format_name] = (fingerprint, result)
+        return result
+
     @classmethod
     def to_multipart(cls, messages: List[PromptMessage]) -> List["PromptMessageMultipart"]:
         """Convert a sequence of PromptMessages into PromptMessageMultipart objects."""
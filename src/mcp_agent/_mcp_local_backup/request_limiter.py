@@ -0,0 +1,164 @@
+"""
+Per-server limits on concurrent requests, with a first-in, first-out queue.
+"""
+
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque
+
+from anyio import Event, get_cancelled_exc_class, move_on_after
+from pydantic import BaseModel
+
+from mcp_agent.config import MCPServerSettings
+from mcp_agent.core.exceptions import ServerBusyError
+
+
+class ServerRequestStats(BaseModel):
+    """
+    Counters for the requests made to one server through its limiter.
+    """
+
+    requests: int = 0
+    """Requests that were given a slot."""
+
+    queued: int = 0
+    """Requests that had to wait for a slot."""
+
+    rejected: int = 0
+    """Requests that failed because the queue was full."""
+
+    timed_out: int = 0
+    """Requests that failed after waiting longer than the queue timeout."""
+
+    in_flight: int = 0
+    """Requests currently executing."""
+
+    queue_depth: int = 0
+    """Requests currently waiting."""
+
+    queue_seconds_total: float = 0
+    """Time spent waiting for a slot, summed over all requests."""
+
+    queue_seconds_max: float = 0
+    """Longest time a request waited for a slot."""
+
+    execution_seconds_total: float = 0
+    """Time spent executing once a slot was given, summed over all requests."""
+
+
+class _Waiter:
+    def __init__(self) -> None:
+        self.event = Event()
+        self.granted = False
+
+
+class ServerRequestLimiter:
+    """
+    Allows at most max_concurrent requests to a server at a time. Further requests wait
+    in arrival order, up to max_queued of them, each for at most queue_timeout seconds.
+    A finishing request hands its slot directly to the oldest waiter, so late arrivals
+    cannot overtake queued requests.
+    """
+
+    def __init__(
+        self,
+        server_name: str,
+        max_concurrent: int,
+        max_queued: int | None = None,
+        queue_timeout: float | None = None,
+    ) -> None:
+        self.server_name = server_name
+        self.max_concurrent = max_concurrent
+        self.max_queued = max_queued
+        self.queue_timeout = queue_timeout
+        self._in_flight = 0
+        self._waiters: Deque[_Waiter] = deque()
+        self._stats = ServerRequestStats()
+
+    @classmethod
+    def from_config(
+        cls, server_name: str, config: MCPServerSettings | None
+    ) -> "ServerRequestLimiter | None":
+        """A limiter for a server, or None if its configuration sets no limit."""
+        if config is None or config.max_concurrent_requests is None:
+            return None
+        return cls(
+            server_name,
+            max_concurrent=config.max_concurrent_requests,
+            max_queued=config.max_queued_requests,
+            queue_timeout=config.queue_timeout_seconds,
+        )
+
+    def stats(self) -> ServerRequestStats:
+        return self._stats.model_copy(
+            update={"in_flight": self._in_flight, "queue_depth": len(self._waiters)}
+        )
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[float]:
+        """
+        Wait for a free slot and hold it for the duration of the block.
+
+        Yields:
+            Seconds spent waiting in the queue
+
+        Raises:
+            ServerBusyError: The queue is full, or the wait exceeded the queue timeout
+        """
+        queued_at = time.monotonic()
+        if self._in_flight < self.max_concurrent and not self._waiters:
+            self._in_flight += 1
+        else:
+            await self._wait_for_slot()
+        queue_seconds = time.monotonic() - queued_at
+
+        self._stats.requests += 1
+        self._stats.queue_seconds_total += queue_seconds
+        self._stats.queue_seconds_max = max(self._stats.queue_seconds_max, queue_seconds)
+        started_at = time.monotonic()
+        try:
+            yield queue_seconds
+        finally:
+            self._stats.execution_seconds_total += time.monotonic() - started_at
+            self._release()
+
+    async def _wait_for_slot(self) -> None:
+        if self.max_queued is not None and len(self._waiters) >= self.max_queued:
+            self._stats.rejected += 1
+            raise ServerBusyError(
+                f"MCP Server '{self.server_name}' is busy",
+                f"{self._in_flight} requests in flight and {len(self._waiters)} queued",
+            )
+
+        waiter = _Waiter()
+        self._waiters.append(waiter)
+        self._stats.queued += 1
+        try:
+            with move_on_after(self.queue_timeout):
+                await waiter.event.wait()
+        except get_cancelled_exc_class():
+            # Cancelled after being handed a slot: pass it on
+            if waiter.granted:
+                self._release()
+            raise
+        finally:
+            if not waiter.granted:
+                self._waiters.remove(waiter)
+
+        if not waiter.granted:
+            self._stats.timed_out += 1
+            raise ServerBusyError(
+                f"MCP Server '{self.server_name}' is busy",
+                f"Timed out after {self.queue_timeout}s waiting for one of "
+                f"{self.max_concurrent} request slots",
+            )
+
+    def _release(self) -> None:
+        """Hand the slot to the oldest waiter, or free it if nobody is waiting."""
+        if self._waiters:
+            waiter = self._waiters.popleft()
+            waiter.granted = True
+            waiter.event.set()
+        else:
+            self._in_flight -= 1
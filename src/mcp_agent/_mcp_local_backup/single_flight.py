@@ -0,0 +1,63 @@
+"""
+Deduplication of identical concurrent requests ("single flight").
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+
+class _Flight(Generic[T]):
+    def __init__(self, task: "asyncio.Task[T]") -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight(Generic[K, T]):
+    """
+    Runs at most one request per key at a time. Callers arriving while a request for the
+    same key is in flight wait for it and receive the same result (or exception).
+
+    The shared request runs in its own task. A cancelled caller stops waiting without
+    affecting the others; the request itself is cancelled only once nobody waits for it.
+    """
+
+    def __init__(self) -> None:
+        self._flights: Dict[K, _Flight[T]] = {}
+        self.shared = 0
+        """Calls that joined a request already in flight."""
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    async def do(self, key: K, request: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run request, or join the identical request already in flight for key.
+
+        Args:
+            key: Identifies identical requests
+            request: Starts the request when none is in flight for key
+        """
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(request()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+        else:
+            self.shared += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # The last waiter went away: new callers must not join a cancelled request
+                self._forget(key, flight)
+                flight.task.cancel()
+
+    def _forget(self, key: K, flight: _Flight[T]) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
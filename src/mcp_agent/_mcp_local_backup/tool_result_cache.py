@@ -0,0 +1,101 @@
+"""
+Size-bounded LRU cache of tool results, for tools that are pure functions of their arguments.
+"""
+
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Tuple
+
+from mcp.types import CallToolResult
+
+from mcp_agent.config import MCPServerSettings
+
+ToolCacheKey = Tuple[str, str, str]
+
+
+def tool_cache_ttl(
+    server_config: MCPServerSettings | None,
+    tool_name: str,
+    annotations: Any = None,
+) -> float | None:
+    """
+    How long results of a tool may be cached, or None if the tool is not cacheable.
+
+    Args:
+        server_config: Configuration of the server providing the tool
+        tool_name: Local (un-namespaced) name of the tool
+        annotations: The tool's MCP ToolAnnotations, if any
+    """
+    settings = server_config.tool_cache if server_config else None
+    if settings is None or tool_name in settings.exclude:
+        return None
+
+    if tool_name in settings.tools:
+        return settings.tools[tool_name] or settings.ttl_seconds
+
+    if settings.use_annotations and is_repeatable_tool(annotations):
+        return settings.ttl_seconds
+
+    return None
+
+
+def is_repeatable_tool(annotations: Any) -> bool:
+    """Whether a tool's annotations declare it read-only or idempotent, so repeating a
+    call (or sharing one call's result) has no additional effect."""
+    if annotations is None:
+        return False
+    return bool(
+        getattr(annotations, "readOnlyHint", None) or getattr(annotations, "idempotentHint", None)
+    )
+
+
+class ToolResultCache:
+    """
+    Caches successful tool results by (server, tool, canonicalised arguments), each entry
+    expiring after its tool's TTL. The least recently used entry is evicted when full.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[ToolCacheKey, Tuple[float, CallToolResult]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(server_name: str, tool_name: str, arguments: Dict[str, Any] | None) -> ToolCacheKey:
+        """Cache key for a call; argument order and formatting do not matter."""
+        canonical = json.dumps(
+            arguments or {}, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+        )
+        return server_name, tool_name, canonical
+
+    def get(self, key: ToolCacheKey) -> CallToolResult | None:
+        """Return a copy of the cached result for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] <= time.monotonic():
+            del self._entries[key]
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1].model_copy(deep=True)
+
+    def put(self, key: ToolCacheKey, result: CallToolResult, ttl: float) -> None:
+        """Cache a result for ttl seconds. Error results are never cached."""
+        if result.isError:
+            return
+        self._entries[key] = (time.monotonic() + ttl, result.model_copy(deep=True))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -10,6 +10,7 @@ import uuid
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterator,
     Callable,
     Dict,
     List,
@@ -113,6 +114,9 @@ class BaseAgent(MCPAggregator, AgentProtocol):
         # Map function names to tools
         self._function_tool_map: Dict[str, Any] = {}
 
+        # (aggregator snapshot, snapshot extended with the human input tool)
+        self._human_input_tool_list: Optional[Tuple[ListToolsResult, ListToolsResult]] = None
+
         if not self.config.human_input:
             self.human_input_callback = None
         else:
@@ -343,19 +347,28 @@ class BaseAgent(MCPAggregator, AgentProtocol):
         if not self.human_input_callback:
             return result
 
+        # The aggregator result is a shared snapshot - extend a copy, and reuse
+        # it for as long as the underlying snapshot is unchanged
+        if self._human_input_tool_list and self._human_input_tool_list[0] is result:
+            return self._human_input_tool_list[1]
+
         # Add a human_input_callback as a tool
         from mcp.server.fastmcp.tools import Tool as FastTool
 
         human_input_tool: FastTool = FastTool.from_function(self.request_human_input)
-        result.tools.append(
-            Tool(
-                name=HUMAN_INPUT_TOOL_NAME,
-                description=human_input_tool.description,
-                inputSchema=human_input_tool.parameters,
-            )
+        extended = ListToolsResult(
+            tools=[
+                *result.tools,
+                Tool(
+                    name=HUMAN_INPUT_TOOL_NAME,
+                    description=human_input_tool.description,
+                    inputSchema=human_input_tool.parameters,
+                ),
+            ]
         )
+        self._human_input_tool_list = (result, extended)
 
-        return result
+        return extended
 
     async def call_tool(self, name: str, arguments: Dict[str, Any] | None = None) -> CallToolResult:
         """
@@ -599,6 +612,28 @@ class BaseAgent(MCPAggregator, AgentProtocol):
         with self.tracer.start_as_current_span(f"Agent: '{self.name}' generate"):
             return await self._llm.generate(multipart_messages, request_params)
 
+    async def generate_stream(
+        self,
+        multipart_messages: List[PromptMessageMultipart],
+        request_params: RequestParams | None = None,
+    ) -> AsyncIterator[str | PromptMessageMultipart]:
+        """
+        Create a completion with the LLM, streaming the response.
+
+        Args:
+            multipart_messages: List of multipart messages to send to the LLM
+            request_params: Optional parameters to configure the request
+
+        Yields:
+            Text deltas from the attached LLM as they arrive, then the complete response
+        """
+        assert self._llm
+        # generate() opens the tracing span; the stream only relays the LLM's text deltas
+        async for item in self._llm.stream_generation(
+            lambda params: self.generate(multipart_messages, params), request_params
+        ):
+            yield item
+
     async def structured(
         self,
         multipart_messages: List[PromptMessageMultipart],
@@ -5,6 +5,8 @@ This workflow provides an implementation that manages complex tasks by
 dynamically planning, delegating to specialized agents, and synthesizing results.
 """
 
+import asyncio
+from contextlib import nullcontext
 from typing import Any, Dict, List, Literal, Optional, Tuple, Type
 
 from mcp.types import TextContent
@@ -12,6 +14,7 @@ from mcp.types import TextContent
 from mcp_agent.agents.agent import Agent
 from mcp_agent.agents.base_agent import BaseAgent
 from mcp_agent.agents.workflow.orchestrator_models import (
+    AgentTask,
     NextStep,
     Plan,
     PlanResult,
@@ -58,6 +61,8 @@ class OrchestratorAgent(BaseAgent):
         agents: List[Agent],
         plan_type: Literal["full", "iterative"] = "full",
         plan_iterations: int = 5,
+        max_parallel_tasks: Optional[int] = None,
+        task_timeout_seconds: Optional[float] = None,
         context: Optional[Any] = None,
         **kwargs,
     ) -> None:
@@ -68,6 +73,9 @@ class OrchestratorAgent(BaseAgent):
             config: Agent configuration or name
             agents: List of specialized worker agents available for task execution
             plan_type: Planning mode ("full" or "iterative")
+            plan_iterations: Maximum number of planning iterations
+            max_parallel_tasks: Maximum number of a step's tasks to run at once (unbounded if None)
+            task_timeout_seconds: Timeout for each task, reported as a task error (none if None)
             context: Optional context object
             **kwargs: Additional keyword arguments to pass to BaseAgent
         """
@@ -85,6 +93,10 @@ class OrchestratorAgent(BaseAgent):
             self.logger.info(f"Adding agent '{agent_name}' to orchestrator")
             self.agents[agent_name] = agent
         self.plan_iterations = plan_iterations
+        self.max_parallel_tasks = max_parallel_tasks
+        self.task_timeout_seconds = task_timeout_seconds
+        # An agent has one LLM and message history, so its tasks run one at a time
+        self._agent_locks: Dict[str, asyncio.Lock] = {}
         # For tracking state during execution
         self.plan_result: Optional[PlanResult] = None
 
@@ -298,88 +310,56 @@ class OrchestratorAgent(BaseAgent):
         # Format context for tasks
         context = format_plan_result(previous_result)
 
-        # Execute all tasks in parallel
-        futures = []
-        error_tasks = []
+        semaphore = asyncio.Semaphore(self.max_parallel_tasks) if self.max_parallel_tasks else None
 
-        for task in step.tasks:
+        async def execute_task(task: AgentTask) -> TaskWithResult:
             # Check agent exists
             agent = self.agents.get(task.agent)
             if not agent:
                 self.logger.error(
                     f"No agent found matching '{task.agent}'. Available agents: {list(self.agents.keys())}"
                 )
-                error_tasks.append(
-                    (
-                        task,
-                        f"Error: Agent '{task.agent}' not found. Available agents: {', '.join(self.agents.keys())}",
-                    )
+                return TaskWithResult(
+                    description=task.description,
+                    agent=task.agent,
+                    result=f"ERROR: Error: Agent '{task.agent}' not found. Available agents: {', '.join(self.agents.keys())}",
                 )
-                continue
 
             # Prepare task prompt
             task_description = TASK_PROMPT_TEMPLATE.format(
                 objective=previous_result.objective, task=task.description, context=context
             )
-
-            # Queue task for execution
-            futures.append(
-                (
-                    task,
-                    agent.generate(
-                        [
-                            PromptMessageMultipart(
-                                role="user",
-                                content=[TextContent(type="text", text=task_description)],
-                            )
-                        ]
-                    ),
-                )
+            prompt = PromptMessageMultipart(
+                role="user",
+                content=[TextContent(type="text", text=task_description)],
             )
 
-        # Wait for all tasks
-        task_results = []
-        for future in futures:
-            task, future_obj = future
+            agent_lock = self._agent_locks.setdefault(task.agent, asyncio.Lock())
             try:
-                result = await future_obj
+                async with agent_lock, semaphore or nullcontext():
+                    result = await asyncio.wait_for(
+                        agent.generate([prompt]), timeout=self.task_timeout_seconds
+                    )
                 result_text = result.all_text()
-
-                # Create task result
-                task_model = task.model_dump()
-                task_result = TaskWithResult(
-                    description=task_model["description"],
-                    agent=task_model["agent"],
-                    result=result_text,
+            except asyncio.TimeoutError:
+                self.logger.error(
+                    f"Task for agent '{task.agent}' timed out after {self.task_timeout_seconds}s"
                 )
-                task_results.append(task_result)
+                result_text = f"ERROR: Task timed out after {self.task_timeout_seconds} seconds"
             except Exception as e:
                 self.logger.error(f"Error executing task: {str(e)}")
-                # Add error result
-                task_model = task.model_dump()
-                task_results.append(
-                    TaskWithResult(
-                        description=task_model["description"],
-                        agent=task_model["agent"],
-                        result=f"ERROR: {str(e)}",
-                    )
-                )
+                result_text = f"ERROR: {str(e)}"
+
+            return TaskWithResult(description=task.description, agent=task.agent, result=result_text)
+
+        # Execute all tasks in parallel (tasks for the same agent in turn) - failures are
+        # isolated to their own task result, and results are collected in plan order
+        task_results = await asyncio.gather(*(execute_task(task) for task in step.tasks))
 
         # Add all task results to step result
         for task_result in task_results:
             step_result.add_task_result(task_result)
 
-        # Add error task results
-        for task, error_message in error_tasks:
-            task_model = task.model_dump()
-            step_result.add_task_result(
-                TaskWithResult(
-                    description=task_model["description"],
-                    agent=task_model["agent"],
-                    result=f"ERROR: {error_message}",
-                )
-            )
-
         # Format step result
         step_result.result = format_step_result_text(step_result)
         return step_result
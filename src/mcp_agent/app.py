@@ -151,6 +151,11 @@ class MCPApp:
             },
         )
         try:
+            await self._context.provider_clients.aclose()
+            if self._context.idle_connection_manager is not None:
+                await self._context.idle_connection_manager.__aexit__(None, None, None)
+            if self._context.completion_cache is not None:
+                self._context.completion_cache.close()
             await cleanup_context()
         except asyncio.CancelledError:
             self.logger.debug("Cleanup cancelled error during shutdown")
@@ -6,7 +6,7 @@ for the application configuration.
 from pathlib import Path
 from typing import Dict, List, Literal, Optional
 
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -24,6 +24,71 @@ class MCPSamplingSettings(BaseModel):
     model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
 
 
+class MCPServerPoolSettings(BaseModel):
+    """
+    Pool of sessions to one MCP server, so concurrent calls are not serialized
+    behind a single connection.
+    """
+
+    min_sessions: int = Field(default=1, ge=1)
+    """Sessions kept open even when idle."""
+
+    max_sessions: int = Field(default=4, ge=1)
+    """Upper bound on concurrently open sessions."""
+
+    idle_timeout_seconds: float = Field(default=300, gt=0)
+    """Close sessions above min_sessions that have been idle for this long."""
+
+    @model_validator(mode="after")
+    def validate_bounds(self) -> "MCPServerPoolSettings":
+        if self.max_sessions < self.min_sessions:
+            raise ValueError("max_sessions must be greater than or equal to min_sessions")
+        return self
+
+
+class MCPReconnectSettings(BaseModel):
+    """
+    Background reconnection and circuit breaking for a server whose connection fails.
+    """
+
+    enabled: bool = True
+    """Reconnect in the background when an established connection drops."""
+
+    initial_delay_seconds: float = Field(default=0.5, ge=0)
+    """Delay before the first reconnection attempt, doubled after every failure."""
+
+    max_delay_seconds: float = Field(default=30, ge=0)
+    """Upper bound on the delay between attempts."""
+
+    jitter: float = Field(default=0.2, ge=0, le=1)
+    """Random extra delay, as a fraction of the delay, so servers don't retry in lockstep."""
+
+    failure_threshold: int = Field(default=3, ge=1)
+    """Consecutive failures after which the circuit opens and calls fail fast."""
+
+    max_attempts: int | None = Field(default=None, ge=1)
+    """Background attempts per outage before giving up (keep trying if unset)."""
+
+
+class MCPToolCacheSettings(BaseModel):
+    """
+    Caching of tool results for tools that are pure functions of their arguments.
+    Error results are never cached.
+    """
+
+    ttl_seconds: float = Field(default=300, gt=0)
+    """How long a cached result stays valid, unless overridden per tool."""
+
+    use_annotations: bool = True
+    """Cache tools the server annotates with readOnlyHint or idempotentHint."""
+
+    tools: Dict[str, float | None] = {}
+    """Tools to cache regardless of annotations, mapped to their TTL (ttl_seconds if null)."""
+
+    exclude: List[str] = []
+    """Tools that are never cached, even when annotated."""
+
+
 class MCPRootSettings(BaseModel):
     """Represents a root directory configuration for an MCP server."""
 
@@ -75,6 +140,9 @@ class MCPServerSettings(BaseModel):
     read_transport_sse_timeout_seconds: int = 300
     """The timeout in seconds for the server connection."""
 
+    startup_timeout_seconds: float | None = None
+    """The timeout in seconds for the server to start and complete initialization (no limit if unset)."""
+
     url: str | None = None
     """The URL for the server (e.g. for SSE transport)."""
 
@@ -96,14 +164,138 @@ class MCPServerSettings(BaseModel):
     cwd: str | None = None
     """Working directory for the executed server command."""
 
+    pool: MCPServerPoolSettings | None = None
+    """Open several sessions to this server and spread concurrent calls across them."""
+
+    tool_cache: MCPToolCacheSettings | None = None
+    """Cache results of this server's read-only tools (no caching if unset)."""
+
+    reconnect: MCPReconnectSettings = Field(default_factory=MCPReconnectSettings)
+    """Reconnection and circuit breaker settings for this server."""
+
+    lazy_connect: bool = False
+    """
+    Don't connect when the agent starts if the server's tools and prompts are in the
+    listing cache (mcp.listing_cache_dir); connect on the first call that needs it.
+    """
+
+    idle_shutdown_seconds: float | None = Field(default=None, gt=0)
+    """Disconnect the server after it has been unused for this long; it is connected
+    again on next use (stays connected if unset)."""
+
+    max_concurrent_requests: int | None = Field(default=None, ge=1)
+    """Maximum requests in flight to this server at once; further requests wait in a
+    first-in, first-out queue (no limit if unset)."""
+
+    max_queued_requests: int | None = Field(default=None, ge=0)
+    """Maximum requests waiting for this server when max_concurrent_requests is reached;
+    requests beyond this fail immediately (no limit if unset)."""
+
+    queue_timeout_seconds: float | None = Field(default=None, gt=0)
+    """How long a request may wait in the queue before failing (no limit if unset)."""
+
+    deduplicate_tool_calls: Literal["off", "safe", "all"] = "safe"
+    """
+    Share one request between identical concurrent calls to the same tool. "safe" only
+    shares calls to read-only or idempotent tools (by annotation or tool_cache config),
+    "all" shares calls to any tool, "off" never shares.
+    """
+
 
 class MCPSettings(BaseModel):
     """Configuration for all MCP servers."""
 
     servers: Dict[str, MCPServerSettings] = {}
+
+    idle_connection_ttl_seconds: float | None = Field(default=None, gt=0)
+    """
+    Keep connections opened by non-persistent agents warm for this long after their last
+    use instead of reconnecting for every operation (connect per operation if unset).
+    """
+
+    tool_cache_max_entries: int = Field(default=1024, ge=1)
+    """Maximum number of tool results held by the tool result cache (least recently used
+    results are evicted first)."""
+
+    shutdown_timeout_seconds: float = Field(default=5.0, gt=0)
+    """
+    How long to wait at shutdown for servers to exit after being asked to. Connections
+    still open after this are cancelled and stdio server processes are killed.
+    """
+
+    listing_cache_dir: str | None = None
+    """
+    Directory to cache each server's tool, prompt and capability listings in. Agents
+    start from the cached listings while servers connect and are re-listed in the
+    background (no caching if unset).
+    """
+
     model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
 
 
+class LLMRetrySettings(BaseModel):
+    """
+    Retrying of LLM provider requests that fail with a transient error, such as a rate
+    limit, an overloaded server or a dropped connection.
+    """
+
+    max_attempts: int = Field(default=4, ge=1)
+    """Attempts per request, including the first one (1 disables retrying)."""
+
+    initial_delay_seconds: float = Field(default=1.0, ge=0)
+    """Upper bound of the random delay before the first retry, doubled for every retry."""
+
+    max_delay_seconds: float = Field(default=30.0, ge=0)
+    """Upper bound on the delay between attempts."""
+
+    deadline_seconds: float | None = Field(default=None, gt=0)
+    """Overall time allowed for a request, including all its retries (no deadline if unset)."""
+
+    retry_on_status: List[int] = [408, 409, 429, 500, 502, 503, 504, 529]
+    """HTTP status codes that are retried."""
+
+    respect_retry_after: bool = True
+    """Wait as long as the provider's Retry-After header asks, when it sends one."""
+
+
+class LLMRateLimitSettings(BaseModel):
+    """
+    Client-side rate limit for the requests sent with one provider API key to one model,
+    shared by all agents of the application.
+    """
+
+    requests_per_minute: int | None = Field(default=None, gt=0)
+    """Requests sent per minute (unlimited if unset)."""
+
+    tokens_per_minute: int | None = Field(default=None, gt=0)
+    """Estimated input and output tokens per minute (unlimited if unset)."""
+
+
+class LLMCompletionCacheSettings(BaseModel):
+    """
+    Caching of LLM completions, so byte-identical requests (e.g. in evaluation runs and
+    regression suites) are answered without calling the provider again.
+    """
+
+    enabled: bool = False
+    """Cache completions."""
+
+    deterministic_only: bool = True
+    """Only cache requests sent with temperature 0. Set to false to cache every request."""
+
+    backend: Literal["memory", "sqlite"] = "memory"
+    """Keep completions in memory, or in a SQLite database shared between runs."""
+
+    path: str = "fastagent.cache.sqlite"
+    """Database file of the sqlite backend."""
+
+    ttl_seconds: float | None = Field(default=None, gt=0)
+    """How long a completion stays cached (no expiry if unset)."""
+
+    max_entries: int = Field(default=1000, ge=1)
+    """Maximum number of cached completions (least recently used are evicted first)."""
+
+
 class AnthropicSettings(BaseModel):
     """
     Settings for using Anthropic models in the fast-agent application.
@@ -113,6 +305,14 @@ class AnthropicSettings(BaseModel):
 
     base_url: str | None = None
 
+    cache_mode: Literal["off", "prompt", "auto"] = "off"
+    """
+    Prompt caching policy. "prompt" caches the system prompt and tool definitions,
+    "auto" also caches the conversation history prefix, "off" disables caching.
+    Cache writes cost more than regular input tokens, so caching pays off for long or
+    repeated conversations. Can be overridden per request with RequestParams.cache_mode
+    """
+
     model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
 
 
@@ -295,6 +495,18 @@ class Settings(BaseSettings):
     auto_sampling: bool = True
     """Enable automatic sampling model selection if not explicitly configured"""
 
+    llm_retry: LLMRetrySettings = LLMRetrySettings()
+    """Retrying of LLM provider requests that fail with a transient error"""
+
+    completion_cache: LLMCompletionCacheSettings = LLMCompletionCacheSettings()
+    """Caching of LLM completions for identical requests"""
+
+    rate_limits: Dict[str, LLMRateLimitSettings] = {}
+    """
+    Client-side rate limits, keyed by provider (e.g. "anthropic") or by provider and model
+    (e.g. "anthropic.claude-sonnet-4-0"), which takes precedence
+    """
+
     anthropic: AnthropicSettings | None = None
     """Settings for using Anthropic models in the fast-agent application"""
 
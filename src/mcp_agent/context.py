@@ -5,7 +5,7 @@ A central context object to store global state that is shared across the applica
 import asyncio
 import concurrent.futures
 import uuid
-from typing import TYPE_CHECKING, Any, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
 
 from mcp import ServerSession
 from opentelemetry import trace
@@ -19,11 +19,18 @@ from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
 from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
+from mcp_agent._mcp_local_backup.mcp_connection_manager import IdleConnectionManager
+from mcp_agent._mcp_local_backup.request_limiter import ServerRequestLimiter
+from mcp_agent._mcp_local_backup.single_flight import SingleFlight
+from mcp_agent._mcp_local_backup.tool_result_cache import ToolResultCache
 from mcp_agent.config import Settings, get_settings
 from mcp_agent.executor.executor import AsyncioExecutor, Executor
 from mcp_agent.executor.task_registry import ActivityRegistry
+from mcp_agent.llm.completion_cache import CompletionCache, create_completion_cache
+from mcp_agent.llm.provider_clients import ProviderClients
+from mcp_agent.llm.rate_limiter import RateLimiters
 from mcp_agent.logger.events import EventFilter
 from mcp_agent.logger.logger import LoggingConfig, get_logger
 from mcp_agent.logger.transport import create_transport
@@ -58,6 +65,29 @@ class Context(BaseModel):
 
     tracer: trace.Tracer | None = None
 
+    # Async provider SDK clients shared by all LLMs, closed on application cleanup
+    provider_clients: ProviderClients = Field(default_factory=ProviderClients)
+
+    # Client-side provider rate limits shared by all LLMs
+    rate_limiters: RateLimiters = Field(default_factory=RateLimiters)
+
+    # Cached provider completions shared by all LLMs, when completion_cache is enabled
+    completion_cache: Optional[CompletionCache] = None
+
+    # Results of repeatable MCP tool calls, shared by all aggregators
+    tool_result_cache: ToolResultCache = Field(default_factory=ToolResultCache)
+
+    # MCP tool calls in flight, so identical concurrent calls share one request
+    tool_call_flights: SingleFlight = Field(default_factory=SingleFlight)
+
+    # Concurrent request limits per MCP server (None if the server sets no limit)
+    server_request_limiters: Dict[str, Optional[ServerRequestLimiter]] = Field(
+        default_factory=dict
+    )
+
+    # Warm MCP connections for non-persistent aggregators, when an idle TTL is configured
+    idle_connection_manager: Optional[IdleConnectionManager] = None
+
     model_config = ConfigDict(
         extra="allow",
         arbitrary_types_allowed=True,  # Tell Pydantic to defer type evaluation
@@ -176,6 +206,19 @@ async def initialize_context(
     if config.otel:
         context.tracer = trace.get_tracer(config.otel.service_name)
 
+    # Caches and connections shared by all agents
+    if config.completion_cache and config.completion_cache.enabled:
+        context.completion_cache = create_completion_cache(config.completion_cache)
+    if config.mcp:
+        context.tool_result_cache = ToolResultCache(max_entries=config.mcp.tool_cache_max_entries)
+        if config.mcp.idle_connection_ttl_seconds:
+            context.idle_connection_manager = IdleConnectionManager(
+                context.server_registry,
+                idle_ttl=config.mcp.idle_connection_ttl_seconds,
+                context=context,
+                shutdown_timeout=config.mcp.shutdown_timeout_seconds,
+            )
+
     if store_globally:
         global _global_context
         _global_context = context
@@ -0,0 +1,205 @@
+"""
+Host a FastAgent application as a long-running service.
+
+Entering FastAgent.run() initialises the MCPApp, creates every agent and connects
+their MCP servers. Doing that once per HTTP request dominates request latency, so
+AgentService enters run() a single time on a dedicated event loop thread and lets
+synchronous callers (e.g. Flask/WSGI handlers) submit work to the running agents.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional, TypeVar, Union
+
+from mcp.types import PromptMessage
+
+from mcp_agent._mcp_local_backup.prompt_message_multipart import PromptMessageMultipart
+from mcp_agent.core.agent_app import AgentApp
+from mcp_agent.logger.logger import get_logger
+
+if TYPE_CHECKING:
+    from mcp_agent.core.fastagent import FastAgent
+
+logger = get_logger(__name__)
+
+R = TypeVar("R")
+
+
+class AgentService:
+    """
+    Runs a FastAgent application on a background event loop for the lifetime of a process.
+
+    Agents and MCP server connections are initialised once by start() and reused by every
+    call until stop(). All agent work runs on the service's event loop, so connections
+    created there stay valid across requests.
+
+    Example:
+        service = AgentService(fast)
+        service.start()
+        response = service.send("Hello", agent_name="default")
+        service.stop()
+    """
+
+    def __init__(self, fast: "FastAgent") -> None:
+        self.fast = fast
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._app: AgentApp | None = None
+        self._started: concurrent.futures.Future[AgentApp] | None = None
+        self._stop_event: asyncio.Event | None = None
+        self._main_task: asyncio.Task[None] | None = None
+
+    @property
+    def app(self) -> AgentApp:
+        """The running AgentApp. Only valid between start() and stop()."""
+        if self._app is None:
+            raise RuntimeError("AgentService is not running - call start() first")
+        return self._app
+
+    @property
+    def is_running(self) -> bool:
+        return self._app is not None and self._thread is not None and self._thread.is_alive()
+
+    def start(self, timeout: Optional[float] = None) -> AgentApp:
+        """
+        Start the event loop thread and initialise all agents.
+
+        Blocks until the agents are ready. Errors raised while starting the application
+        are re-raised here.
+
+        Args:
+            timeout: Seconds to wait for initialisation (wait indefinitely if None)
+
+        Returns:
+            The running AgentApp
+        """
+        if self._thread is not None:
+            return self.app
+
+        # Everything stop() needs exists before the thread starts, so a start() that
+        # times out can still be stopped
+        self._started = concurrent.futures.Future()
+        self._loop = asyncio.new_event_loop()
+        self._stop_event = asyncio.Event()
+        self._main_task = self._loop.create_task(self._serve())
+        self._thread = threading.Thread(
+            target=self._run_loop, name=f"{self.fast.name}-agent-service", daemon=True
+        )
+        self._thread.start()
+        try:
+            self._app = self._started.result(timeout=timeout)
+        except BaseException:
+            self.stop()
+            raise
+        return self._app
+
+    def _run_loop(self) -> None:
+        assert self._loop is not None and self._main_task is not None
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_until_complete(self._main_task)
+        finally:
+            self._loop.close()
+
+    async def _serve(self) -> None:
+        assert self._started is not None and self._stop_event is not None
+        try:
+            async with self.fast.run() as agent_app:
+                self._started.set_result(agent_app)
+                await self._stop_event.wait()
+        except BaseException as e:
+            if not self._started.done():
+                self._started.set_exception(e)
+            else:
+                logger.error(f"Agent service stopped with error: {e}")
+
+    def submit(self, work: Callable[[AgentApp], Awaitable[R]]) -> "concurrent.futures.Future[R]":
+        """
+        Schedule work on the service's event loop without waiting for it.
+
+        Args:
+            work: Called with the running AgentApp, returning the awaitable to run
+
+        Returns:
+            A concurrent Future for the result
+        """
+        app = self.app
+        assert self._loop is not None
+
+        async def run() -> R:
+            return await work(app)
+
+        return asyncio.run_coroutine_threadsafe(run(), self._loop)
+
+    def call(self, work: Callable[[AgentApp], Awaitable[R]], timeout: Optional[float] = None) -> R:
+        """
+        Run work on the service's event loop and wait for the result.
+
+        Args:
+            work: Called with the running AgentApp, returning the awaitable to run
+            timeout: Seconds to wait for the result (wait indefinitely if None)
+        """
+        future = self.submit(work)
+        try:
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    def send(
+        self,
+        message: Union[str, PromptMessage, PromptMessageMultipart],
+        agent_name: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> str:
+        """
+        Send a message to an agent and wait for its response.
+
+        Args:
+            message: Message content in any format accepted by AgentApp.send
+            agent_name: Optional name of the agent to send to (default agent if None)
+            timeout: Seconds to wait for the response (wait indefinitely if None)
+        """
+        return self.call(lambda app: app.send(message, agent_name), timeout=timeout)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Shut down the agents and MCP connections, then stop the event loop thread.
+
+        Args:
+            timeout: Seconds to wait for shutdown (wait indefinitely if None)
+        """
+        thread, loop = self._thread, self._loop
+        if thread is None:
+            return
+
+        if loop is not None and not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(self._shutdown)
+            except RuntimeError:
+                # The loop has already finished
+                pass
+        thread.join(timeout=timeout)
+
+        self._thread = None
+        self._loop = None
+        self._app = None
+        self._stop_event = None
+        self._main_task = None
+
+    def _shutdown(self) -> None:
+        # Runs on the service loop, so it sees whether startup has finished
+        assert self._started is not None and self._stop_event is not None
+        if self._started.done():
+            self._stop_event.set()
+        elif self._main_task is not None:
+            # Still initialising (e.g. start() timed out) - abandon the startup
+            self._main_task.cancel()
+
+    def __enter__(self) -> "AgentService":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
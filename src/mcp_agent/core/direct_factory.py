@@ -177,6 +177,8 @@ async def create_agents_by_type(
                     agents=child_agents,
                     plan_iterations=agent_data.get("plan_iterations", 5),
                     plan_type=agent_data.get("plan_type", "full"),
+                    max_parallel_tasks=agent_data.get("max_parallel_tasks"),
+                    task_timeout_seconds=agent_data.get("task_timeout_seconds"),
                 )
 
                 # Initialize the orchestrator
@@ -47,6 +47,22 @@ class ServerInitializationError(FastAgentError):
         super().__init__(message, details)
 
 
+class ServerUnavailableError(FastAgentError):
+    """Raised without contacting a server whose circuit breaker is open
+    (it has failed repeatedly and is waiting before the next reconnection attempt)."""
+
+    def __init__(self, message: str, details: str = "") -> None:
+        super().__init__(message, details)
+
+
+class ServerBusyError(FastAgentError):
+    """Raised when a request cannot be queued for a server at its concurrency limit,
+    or waits in the queue longer than the configured timeout."""
+
+    def __init__(self, message: str, details: str = "") -> None:
+        super().__init__(message, details)
+
+
 class ModelConfigError(FastAgentError):
     """Raised when there are issues with LLM model configuration
     Example: Unknown model name in model specification string
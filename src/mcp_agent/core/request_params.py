@@ -2,7 +2,7 @@
 Request parameters definitions for LLM interactions.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 from pydantic import BaseModel, Field
 
 
@@ -52,6 +52,36 @@ class RequestParams(CreateMessageRequestParams):
     Whether to allow simultaneous tool calls
     """
 
+    max_parallel_tool_calls: int = Field(default=5, ge=1)
+    """
+    The maximum number of tool calls from a single assistant turn executed concurrently.
+    Tool calls run one at a time when parallel_tool_calls is False
+    """
+
+    stream: bool = False
+    """
+    Stream the response from the provider, rendering text as it arrives.
+    Supported by the Anthropic and OpenAI providers; others return the complete response
+    """
+
+    max_history_tokens: int | None = Field(default=None, gt=0)
+    """
+    Keep prompt messages and conversation history within this many estimated tokens by
+    dropping the oldest turns. Configures the LLM's memory, so it is set when creating the LLM
+    """
+
+    priority: int = 0
+    """
+    Queueing priority when a client-side rate limit delays requests: higher priorities are
+    sent first, e.g. 1 for interactive sessions and -1 for batch jobs
+    """
+
+    cache_mode: Literal["off", "prompt", "auto"] | None = None
+    """
+    Anthropic prompt caching policy for this request, overriding anthropic.cache_mode
+    in the configuration (used if None)
+    """
+
     response_format: Any | None = None
     """
     Override response format for structured calls. Prefer sending pydantic model - only use in exceptional circumstances
@@ -15,6 +15,7 @@ class ProgressAction(str, Enum):
     LOADED = "Loaded"
     INITIALIZED = "Initialized"
     CHATTING = "Chatting"
+    STREAMING = "Streaming"
     ROUTING = "Routing"
     PLANNING = "Planning"
     READY = "Ready"
@@ -22,6 +23,7 @@ class ProgressAction(str, Enum):
     UPDATED = "Updated"
     FINISHED = "Finished"
     SHUTDOWN = "Shutdown"
+    RECONNECTING = "Reconnecting"
     AGGREGATOR_INITIALIZED = "Running"
     FATAL_ERROR = "Error"
 
@@ -83,6 +85,9 @@ def convert_log_event(event: Event) -> Optional[ProgressEvent]:
         chat_turn = event_data.get("chat_turn")
         if chat_turn is not None:
             details = f"{model} turn {chat_turn}"
+        tokens_per_second = event_data.get("tokens_per_second")
+        if tokens_per_second is not None:
+            details = f"{details} {tokens_per_second:.1f} tok/s"
     else:
         if not target:
             target = event_data.get("target", "unknown")
@@ -1,9 +1,16 @@
+import asyncio
 from abc import abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
     Dict,
     Generic,
+    Iterator,
     List,
     Optional,
     Tuple,
@@ -16,25 +23,39 @@ from mcp.types import (
     CallToolRequest,
     CallToolResult,
     GetPromptResult,
+    ListToolsResult,
     PromptMessage,
     TextContent,
+    Tool,
 )
 from openai import NotGiven
 from openai.lib._parsing import type_to_response_format_param as _type_to_response_format
+from pydantic import BaseModel
 from pydantic_core import from_json
 from rich.text import Text
 
+from mcp_agent.config import LLMCompletionCacheSettings, LLMRetrySettings
 from mcp_agent.context_dependent import ContextDependent
-from mcp_agent.core.exceptions import PromptExitError
+from mcp_agent.core.exceptions import PromptExitError, ProviderKeyError
 from mcp_agent.core.prompt import Prompt
 from mcp_agent.core.request_params import RequestParams
 from mcp_agent.event_progress import ProgressAction
-from mcp_agent.llm.memory import Memory, SimpleMemory
+from mcp_agent.llm.completion_cache import (
+    CompletionCache,
+    completion_key,
+    create_completion_cache,
+    is_deterministic,
+)
+from mcp_agent.llm.memory import Memory, SimpleMemory, TokenBudgetMemory
 from mcp_agent.llm.provider_types import Provider
+from mcp_agent.llm.rate_limiter import RateLimiter, RateLimiters, rate_limit_settings
+from mcp_agent.llm.retry import call_with_retry
 from mcp_agent.llm.sampling_format_converter import (
     BasicFormatConverter,
     ProviderFormatConverter,
 )
+from mcp_agent.llm.streaming import CompletionStream, StreamListener
+from mcp_agent.llm.token_estimator import estimate_tokens
 from mcp_agent.logger.logger import get_logger
 from mcp_agent._mcp_local_backup.helpers.content_helpers import get_text
 from mcp_agent._mcp_local_backup.interfaces import (
@@ -49,6 +70,9 @@ from mcp_agent.ui.console_display import ConsoleDisplay
 # Define type variables locally
 MessageParamT = TypeVar("MessageParamT")
 MessageT = TypeVar("MessageT")
+ToolsT = TypeVar("ToolsT")
+ClientT = TypeVar("ClientT")
+ResultT = TypeVar("ResultT")
 
 # Forward reference for type annotations
 if TYPE_CHECKING:
@@ -59,6 +83,9 @@ if TYPE_CHECKING:
 # TODO -- move this to a constant
 HUMAN_INPUT_TOOL_NAME = "__human_input__"
 
+# Receives text deltas while a generate_stream() call is in progress in the current task
+_stream_listener: ContextVar[StreamListener | None] = ContextVar("stream_listener", default=None)
+
 
 def deep_merge(dict1: Dict[Any, Any], dict2: Dict[Any, Any]) -> Dict[Any, Any]:
     """
@@ -91,12 +118,24 @@ class AugmentedLLM(ContextDependent, AugmentedLLMProtocol, Generic[MessageParamT
     PARAM_SYSTEM_PROMPT = "systemPrompt"
     PARAM_STOP_SEQUENCES = "stopSequences"
     PARAM_PARALLEL_TOOL_CALLS = "parallel_tool_calls"
+    PARAM_MAX_PARALLEL_TOOL_CALLS = "max_parallel_tool_calls"
     PARAM_METADATA = "metadata"
     PARAM_USE_HISTORY = "use_history"
     PARAM_MAX_ITERATIONS = "max_iterations"
     PARAM_TEMPLATE_VARS = "template_vars"
+    PARAM_STREAM = "stream"
+    PARAM_PRIORITY = "priority"
+    PARAM_MAX_HISTORY_TOKENS = "max_history_tokens"
+    PARAM_CACHE_MODE = "cache_mode"
     # Base set of fields that should always be excluded
-    BASE_EXCLUDE_FIELDS = {PARAM_METADATA}
+    BASE_EXCLUDE_FIELDS = {
+        PARAM_METADATA,
+        PARAM_MAX_PARALLEL_TOOL_CALLS,
+        PARAM_STREAM,
+        PARAM_PRIORITY,
+        PARAM_MAX_HISTORY_TOKENS,
+        PARAM_CACHE_MODE,
+    }
 
     """
     The basic building block of agentic systems is an LLM enhanced with augmentations
@@ -147,11 +186,11 @@ class AugmentedLLM(ContextDependent, AugmentedLLMProtocol, Generic[MessageParamT
         self.name = agent.name if agent else name
         self.instruction = agent.instruction if agent else instruction
         self.provider = provider
-        # memory contains provider specific API types.
-        self.history: Memory[MessageParamT] = SimpleMemory[MessageParamT]()
-
         self._message_history: List[PromptMessageMultipart] = []
 
+        # (aggregator tool list snapshot, provider-specific conversion of its tools)
+        self._provider_tools_cache: Tuple[ListToolsResult, Any] | None = None
+
         # Initialize the display component
         self.display = ConsoleDisplay(config=self.context.config)
 
@@ -168,9 +207,19 @@ class AugmentedLLM(ContextDependent, AugmentedLLMProtocol, Generic[MessageParamT
                 self.default_request_params, self._init_request_params
             )
 
+        # memory contains provider specific API types.
+        self.history: Memory[MessageParamT] = self._create_memory()
+
         self.type_converter = type_converter
         self.verb = kwargs.get("verb")
 
+    def _create_memory(self) -> Memory[MessageParamT]:
+        """Token-budgeted memory if max_history_tokens is set, otherwise unbounded memory."""
+        max_tokens = self.default_request_params.max_history_tokens
+        if max_tokens:
+            return TokenBudgetMemory[MessageParamT](max_tokens)
+        return SimpleMemory[MessageParamT]()
+
     def _initialize_default_params(self, kwargs: dict) -> RequestParams:
         """Initialize default parameters for the LLM.
         Should be overridden by provider implementations to set provider-specific defaults."""
@@ -217,6 +266,60 @@ class AugmentedLLM(ContextDependent, AugmentedLLMProtocol, Generic[MessageParamT
         self._message_history.append(assistant_response)
         return assistant_response
 
+    async def generate_stream(
+        self,
+        multipart_messages: List[PromptMessageMultipart],
+        request_params: RequestParams | None = None,
+    ) -> AsyncIterator[str | PromptMessageMultipart]:
+        """
+        Create a completion with the LLM, streaming the response.
+
+        Yields text deltas as the provider produces them, followed by the complete
+        response as a PromptMessageMultipart. Providers without streaming support
+        yield only the complete response.
+        """
+        async for item in self.stream_generation(
+            lambda params: self.generate(multipart_messages, params), request_params
+        ):
+            yield item
+
+    async def stream_generation(
+        self,
+        generate: Callable[[RequestParams], Awaitable[PromptMessageMultipart]],
+        request_params: RequestParams | None = None,
+    ) -> AsyncIterator[str | PromptMessageMultipart]:
+        """
+        Run a generation with streaming enabled and yield this LLM's text deltas as they arrive.
+
+        Args:
+            generate: Runs the generation with the supplied (streaming) request parameters
+            request_params: Optional parameters to configure the request
+
+        Yields:
+            Text deltas, then the PromptMessageMultipart returned by generate
+        """
+        params = (
+            request_params.model_copy(update={"stream": True})
+            if request_params
+            else RequestParams(stream=True)
+        )
+        queue: asyncio.Queue[str | None] = asyncio.Queue()
+        listener = StreamListener(self, queue.put_nowait)
+
+        async def run() -> PromptMessageMultipart:
+            # Set in the task's own context, so concurrent calls each get their own deltas
+            _stream_listener.set(listener)
+            return await generate(params)
+
+        task = asyncio.create_task(run())
+        task.add_done_callback(lambda _: queue.put_nowait(None))
+        try:
+            while (delta := await queue.get()) is not None:
+                yield delta
+            yield await task
+        finally:
+            task.cancel()
+
     @abstractmethod
     async def _apply_prompt_provider_specific(
         self,
@@ -415,6 +518,26 @@ class AugmentedLLM(ContextDependent, AugmentedLLMProtocol, Generic[MessageParamT
         # Many LLM implementations will allow the same type for input and output messages
         return cast("MessageParamT", message)
 
+    async def _provider_tools(
+        self, convert: Callable[[List[Tool]], ToolsT]
+    ) -> Tuple[ListToolsResult, ToolsT]:
+        """
+        Return the available tools together with their provider-specific conversion.
+
+        The aggregator returns the same tool list snapshot until its tool_list_version
+        changes, so the conversion is only repeated when the tools actually change.
+
+        Args:
+            convert: Converts MCP tool definitions to the provider's format
+
+        Returns:
+            Tuple of (tool list, converted tools)
+        """
+        tool_list = await self.aggregator.list_tools()
+        if self._provider_tools_cache is None or self._provider_tools_cache[0] is not tool_list:
+            self._provider_tools_cache = (tool_list, convert(tool_list.tools))
+        return tool_list, self._provider_tools_cache[1]
+
     def show_tool_result(self, result: CallToolResult) -> None:
         """Display a tool result in a formatted panel."""
         self.display.show_tool_result(result)
@@ -512,6 +635,99 @@ class AugmentedLLM(ContextDependent, AugmentedLLMProtocol, Generic[MessageParamT
                 ],
             )
 
+    async def call_tools(
+        self,
+        tool_calls: List[Tuple[str | None, CallToolRequest]],
+        request_params: RequestParams | None = None,
+    ) -> List[CallToolResult]:
+        """
+        Execute the tool calls requested in a single assistant turn.
+
+        Calls run concurrently, limited by max_parallel_tool_calls (or one at a time when
+        parallel_tool_calls is disabled). Each call goes through call_tool, so pre_tool_call
+        and post_tool_call still run for every request.
+
+        Args:
+            tool_calls: (tool_call_id, request) pairs in the order the model produced them
+            request_params: Request parameters for this turn
+
+        Returns:
+            The tool results, in the same order as tool_calls
+        """
+        params = self.get_request_params(request_params)
+        limit = params.max_parallel_tool_calls if params.parallel_tool_calls else 1
+
+        if limit == 1 or len(tool_calls) <= 1:
+            return [
+                await self.call_tool(request, tool_call_id) for tool_call_id, request in tool_calls
+            ]
+
+        semaphore = asyncio.Semaphore(limit)
+
+        async def run(tool_call_id: str | None, request: CallToolRequest) -> CallToolResult:
+            async with semaphore:
+                return await self.call_tool(request, tool_call_id)
+
+        tasks = [
+            asyncio.create_task(run(tool_call_id, request)) for tool_call_id, request in tool_calls
+        ]
+        try:
+            return list(await asyncio.gather(*tasks))
+        finally:
+            # call_tool only raises for PromptExitError - don't leave sibling calls running
+            for task in tasks:
+                task.cancel()
+
+    @contextmanager
+    def _stream_response(self, model: Optional[str] = None) -> Iterator[CompletionStream]:
+        """
+        Track one streamed provider response.
+
+        Text deltas passed to the yielded CompletionStream are rendered incrementally and
+        forwarded to any generate_stream() consumer. Each attempt of a request gets a new
+        live panel and stream. Time to first token and output throughput are logged as
+        progress events.
+        """
+        listener = self._active_stream_listener()
+        with self.display.streaming_assistant_message(name=self.name) as render:
+
+            def on_text(delta: str) -> None:
+                render(delta)
+                if listener:
+                    listener.text(delta)
+
+            stream = CompletionStream(
+                on_text=on_text,
+                on_first_token=lambda started: self._log_stream_progress(
+                    "First token received", started, model
+                ),
+            )
+            yield stream
+
+        if stream.finished is not None:
+            self._log_stream_progress("Stream finished", stream, model)
+
+    def _active_stream_listener(self) -> StreamListener | None:
+        """The listener of this LLM's generate_stream() call in progress, if any."""
+        listener = _stream_listener.get()
+        # Child tasks inherit the listener - ignore it in other agents' LLMs
+        return listener if listener is not None and listener.owner is self else None
+
+    def _log_stream_progress(
+        self, message: str, stream: CompletionStream, model: Optional[str] = None
+    ) -> None:
+        """Log streaming metrics (TTFT and tokens/sec) as a progress event"""
+        data = {
+            "progress_action": ProgressAction.STREAMING,
+            "model": model,
+            "agent_name": self.name,
+            "ttft_ms": round(stream.ttft * 1000) if stream.ttft is not None else None,
+        }
+        if stream.finished is not None:
+            data["output_tokens"] = stream.output_tokens
+            data["tokens_per_second"] = stream.tokens_per_second
+        self.logger.debug(message, data=data)
+
     def _log_chat_progress(
         self, chat_turn: Optional[int] = None, model: Optional[str] = None
     ) -> None:
@@ -637,6 +853,113 @@ class AugmentedLLM(ContextDependent, AugmentedLLMProtocol, Generic[MessageParamT
         """
         return self._message_history
 
+    def _provider_client(self, key: Tuple[Any, ...], factory: Callable[[], ClientT]) -> ClientT:
+        """
+        Return the shared SDK client for this provider and connection settings.
+
+        Clients are pooled on the Context so completions and agents reuse the same HTTP
+        connections. Falls back to a new client if the context has no client registry.
+        """
+        provider_clients = getattr(self.context, "provider_clients", None)
+        if provider_clients is None:
+            return factory()
+        return provider_clients.get((self.provider, *key), factory)
+
+    def _retry_settings(self) -> LLMRetrySettings:
+        """Retry settings from the config, overridden by the executor's retry_policy."""
+        settings = getattr(self.context.config, "llm_retry", None)
+        if not isinstance(settings, LLMRetrySettings):
+            settings = LLMRetrySettings()
+        policy = getattr(getattr(self.executor, "config", None), "retry_policy", None)
+        if isinstance(policy, dict) and policy:
+            settings = LLMRetrySettings.model_validate({**settings.model_dump(), **policy})
+        return settings
+
+    async def _send_request(
+        self,
+        attempt: Callable[[], Awaitable[ResultT]],
+        request_params: RequestParams | None = None,
+        payload: Any = None,
+    ) -> ResultT:
+        """
+        Await a provider request, sending it again after transient failures such as rate
+        limits or dropped connections. attempt must create a new request on every call.
+
+        Each attempt first waits for the client-side rate limit of the provider and model,
+        if one is configured, counting the tokens estimated from payload. When the completion
+        cache is enabled, payload (the final provider arguments) is also the cache key, and a
+        cached response is returned to the caller's tool loop like a fresh one.
+        """
+        params = request_params or self.default_request_params
+        name = self.provider.value if self.provider else type(self).__name__
+
+        listener = self._active_stream_listener()
+        if listener is not None:
+            listener.start_request()
+            request = attempt
+
+            async def streamed_attempt() -> ResultT:
+                # A retry streams the response from the start again
+                listener.start_attempt()
+                return await request()
+
+            attempt = streamed_attempt
+
+        cache = self._completion_cache(payload)
+        if cache is not None:
+            cache_key = completion_key(name, payload)
+            cached = cache.get(cache_key)
+            self.logger.debug(
+                f"Completion cache {'miss' if cached is None else 'hit'}",
+                data={"cache_hits": cache.hits, "cache_misses": cache.misses},
+            )
+            if cached is not None:
+                return cached
+
+        limiter = self._rate_limiter(params.model or self.default_request_params.model)
+        if limiter is None:
+            response = await call_with_retry(attempt, self._retry_settings(), name=name)
+        else:
+            tokens = 0 if payload is None else estimate_tokens(payload, params.maxTokens)
+
+            async def rate_limited_attempt() -> ResultT:
+                await limiter.acquire(tokens, params.priority)
+                return await attempt()
+
+            response = await call_with_retry(
+                rate_limited_attempt, self._retry_settings(), name=name
+            )
+
+        if cache is not None and isinstance(response, BaseModel):
+            cache.put(cache_key, response)
+        return response
+
+    def _completion_cache(self, payload: Any) -> CompletionCache | None:
+        """The context-wide completion cache, if it is enabled and applies to the request."""
+        settings = getattr(self.context.config, "completion_cache", None)
+        if payload is None or not isinstance(settings, LLMCompletionCacheSettings):
+            return None
+        if not settings.enabled or (settings.deterministic_only and not is_deterministic(payload)):
+            return None
+        # Created by initialize_context; created here for contexts built directly
+        if self.context.completion_cache is None:
+            self.context.completion_cache = create_completion_cache(settings)
+        return self.context.completion_cache
+
+    def _rate_limiter(self, model: str | None) -> RateLimiter | None:
+        """The shared rate limiter for this provider, API key and model, if one is configured."""
+        rate_limiters = getattr(self.context, "rate_limiters", None)
+        if not isinstance(rate_limiters, RateLimiters) or self.provider is None:
+            return None
+        settings = rate_limit_settings(self.context.config, self.provider.value, model)
+        if settings is None:
+            return None
+        try:
+            api_key = self._api_key()
+        except ProviderKeyError:
+            api_key = None
+        return rate_limiters.get(self.provider.value, api_key, model, settings)
+
     def _api_key(self):
         from mcp_agent.llm.provider_key_manager import ProviderKeyManager
 
@@ -0,0 +1,193 @@
+"""
+Exact-match cache of LLM completions, keyed by a hash of the final provider arguments.
+"""
+
+import hashlib
+import importlib
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+
+from mcp_agent.config import LLMCompletionCacheSettings
+from mcp_agent.logger.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _canonical(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json", exclude_none=True)
+    return str(value)
+
+
+def completion_key(provider: str, arguments: Any) -> str:
+    """Hash of a request; key order and formatting of the arguments do not matter."""
+    canonical = json.dumps(
+        {"provider": provider, "arguments": arguments},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=_canonical,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def is_deterministic(arguments: Any) -> bool:
+    """Whether a request asks for temperature 0, directly or in its generation config."""
+    if not isinstance(arguments, dict):
+        return False
+    temperature = arguments.get("temperature")
+    if temperature is None and arguments.get("config") is not None:
+        temperature = getattr(arguments["config"], "temperature", None)
+    return temperature == 0
+
+
+class MemoryCompletionCache:
+    """
+    Keeps completions in memory, evicting the least recently used one when full.
+    """
+
+    def __init__(self, max_entries: int = 1000, ttl_seconds: float | None = None) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, Tuple[float, BaseModel]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> BaseModel | None:
+        """Return a copy of the cached completion for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is not None and self.ttl_seconds and entry[0] + self.ttl_seconds <= time.time():
+            del self._entries[key]
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1].model_copy(deep=True)
+
+    def put(self, key: str, completion: BaseModel) -> None:
+        self._entries[key] = (time.time(), completion.model_copy(deep=True))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def close(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _type_name(model_type: Type[BaseModel]) -> str:
+    return f"{model_type.__module__}:{model_type.__qualname__}"
+
+
+def _resolve_type(name: str) -> Type[BaseModel] | None:
+    module_name, _, qualname = name.partition(":")
+    try:
+        value: Any = importlib.import_module(module_name)
+        for part in qualname.split("."):
+            value = getattr(value, part)
+    except (ImportError, AttributeError):
+        return None
+    return value if isinstance(value, type) and issubclass(value, BaseModel) else None
+
+
+class SqliteCompletionCache:
+    """
+    Keeps completions in a SQLite database, so they are reused across runs. Completions are
+    stored as JSON with the name of their response type.
+    """
+
+    def __init__(
+        self, path: str | Path, max_entries: int = 1000, ttl_seconds: float | None = None
+    ) -> None:
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS completions ("
+                "key TEXT PRIMARY KEY, type TEXT NOT NULL, body TEXT NOT NULL, "
+                "created REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+
+    def get(self, key: str) -> BaseModel | None:
+        """Return the cached completion for key, or None if missing, expired or unreadable."""
+        row = self._db.execute(
+            "SELECT type, body, created FROM completions WHERE key = ?", (key,)
+        ).fetchone()
+        completion = None
+        if row is not None:
+            type_name, body, created = row
+            if self.ttl_seconds and created + self.ttl_seconds <= time.time():
+                self._delete(key)
+            else:
+                completion = self._load(key, type_name, body)
+
+        if completion is None:
+            self.misses += 1
+            return None
+
+        with self._db:
+            self._db.execute(
+                "UPDATE completions SET accessed = ? WHERE key = ?", (time.time(), key)
+            )
+        self.hits += 1
+        return completion
+
+    def _load(self, key: str, type_name: str, body: str) -> BaseModel | None:
+        model_type = _resolve_type(type_name)
+        try:
+            if model_type is not None:
+                return model_type.model_validate_json(body)
+        except ValidationError as e:
+            logger.warning(f"Ignoring unreadable cached completion of type {type_name}: {e}")
+        self._delete(key)
+        return None
+
+    def _delete(self, key: str) -> None:
+        with self._db:
+            self._db.execute("DELETE FROM completions WHERE key = ?", (key,))
+
+    def put(self, key: str, completion: BaseModel) -> None:
+        now = time.time()
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO completions VALUES (?, ?, ?, ?, ?)",
+                (key, _type_name(type(completion)), completion.model_dump_json(), now, now),
+            )
+            self._db.execute(
+                "DELETE FROM completions WHERE key NOT IN "
+                "(SELECT key FROM completions ORDER BY accessed DESC, rowid DESC LIMIT ?)",
+                (self.max_entries,),
+            )
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM completions").fetchone()[0]
+
+
+CompletionCache = MemoryCompletionCache | SqliteCompletionCache
+
+
+def create_completion_cache(settings: LLMCompletionCacheSettings) -> CompletionCache:
+    """The cache backend selected by settings."""
+    if settings.backend == "sqlite":
+        return SqliteCompletionCache(settings.path, settings.max_entries, settings.ttl_seconds)
+    return MemoryCompletionCache(settings.max_entries, settings.ttl_seconds)
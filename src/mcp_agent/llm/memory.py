@@ -1,4 +1,6 @@
-from typing import Generic, List, Protocol, TypeVar
+from typing import Any, Callable, Generic, List, Protocol, TypeVar
+
+from mcp_agent.llm.token_estimator import estimate_tokens
 
 # Define our own type variable for implementation use
 MessageParamT = TypeVar("MessageParamT")
@@ -101,3 +103,112 @@ class SimpleMemory(Memory, Generic[MessageParamT]):
         self.history = []
         if clear_prompts:
             self.prompt_messages = []
+
+
+def _field(message: Any, name: str) -> Any:
+    return message.get(name) if isinstance(message, dict) else getattr(message, name, None)
+
+
+def starts_turn(message: Any) -> bool:
+    """
+    Whether a provider message is a user message that is not a tool result, so history can
+    be cut before it without separating a tool call from its result.
+    """
+    if _field(message, "role") != "user":
+        return False
+    content = _field(message, "content") or _field(message, "parts")
+    if isinstance(content, list):
+        for block in content:
+            # Anthropic tool_result blocks, Google function responses
+            if _field(block, "type") == "tool_result" or _field(block, "function_response"):
+                return False
+    return True
+
+
+class TokenBudgetMemory(SimpleMemory[MessageParamT]):
+    """
+    Memory that keeps prompt messages and conversation history within an estimated token
+    budget. When over budget, the oldest conversation turns are dropped whole, so a tool
+    call is never kept without its result. Prompt messages are always kept, as is the
+    latest turn.
+    """
+
+    def __init__(
+        self,
+        max_tokens: int,
+        estimate: Callable[[Any], int] = estimate_tokens,
+    ) -> None:
+        super().__init__()
+        self.max_tokens = max_tokens
+        self._estimate = estimate
+        self._prompt_tokens = 0
+        self._history_tokens: List[int] = []
+        self._history_total = 0
+
+    @property
+    def tokens(self) -> int:
+        """Estimated tokens of the prompt messages and history."""
+        return self._prompt_tokens + self._history_total
+
+    def extend(self, messages: List[MessageParamT], is_prompt: bool = False) -> None:
+        super().extend(messages, is_prompt)
+        self._count(messages, is_prompt)
+
+    def set(self, messages: List[MessageParamT], is_prompt: bool = False) -> None:
+        if is_prompt:
+            super().set(messages, is_prompt)
+            self._prompt_tokens = 0
+            self._count(messages, is_prompt)
+            return
+
+        # Providers set the whole history every turn - keep the estimates of the messages
+        # already held and only estimate the new ones
+        kept = 0
+        for current, message in zip(self.history, messages):
+            if current is not message:
+                break
+            kept += 1
+        super().set(messages, is_prompt)
+        del self._history_tokens[kept:]
+        self._history_total = sum(self._history_tokens)
+        self._count(messages[kept:], is_prompt)
+
+    def append(self, message: MessageParamT, is_prompt: bool = False) -> None:
+        super().append(message, is_prompt)
+        self._count([message], is_prompt)
+
+    def clear(self, clear_prompts: bool = False) -> None:
+        super().clear(clear_prompts)
+        self._history_tokens = []
+        self._history_total = 0
+        if clear_prompts:
+            self._prompt_tokens = 0
+
+    def _count(self, messages: List[MessageParamT], is_prompt: bool) -> None:
+        tokens = [self._estimate(message) for message in messages]
+        if is_prompt:
+            self._prompt_tokens += sum(tokens)
+        else:
+            self._history_tokens.extend(tokens)
+            self._history_total += sum(tokens)
+        self._trim()
+
+    def _trim(self) -> None:
+        """Drop the oldest turns of history while over budget."""
+        excess = self.tokens - self.max_tokens
+        if excess <= 0:
+            return
+
+        # Cut before the first turn that brings history within budget, or else the latest
+        cut = 0
+        dropped = 0
+        for index in range(1, len(self.history)):
+            dropped += self._history_tokens[index - 1]
+            if starts_turn(self.history[index]):
+                cut = index
+                if dropped >= excess:
+                    break
+        if cut:
+            del self.history[:cut]
+            self._history_total -= sum(self._history_tokens[:cut])
+            del self._history_tokens[:cut]
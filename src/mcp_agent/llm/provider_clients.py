@@ -0,0 +1,56 @@
+"""
+Long-lived provider SDK clients shared by the LLMs of an application context.
+"""
+
+from typing import Any, Callable, Dict, Hashable, Tuple, TypeVar
+
+from mcp_agent.logger.logger import get_logger
+
+logger = get_logger(__name__)
+
+ClientT = TypeVar("ClientT")
+
+
+class ProviderClients:
+    """
+    Registry of async provider SDK clients, keyed by provider and connection settings
+    (e.g. api key and base url).
+
+    Each SDK client owns an HTTP connection pool, so sharing one client between completions
+    and agents keeps connections alive instead of paying for a new TLS handshake per request.
+    Clients are bound to the event loop they are first used on and are closed when the
+    application shuts down.
+    """
+
+    def __init__(self) -> None:
+        self._clients: Dict[Tuple[Hashable, ...], Any] = {}
+
+    def get(self, key: Tuple[Hashable, ...], factory: Callable[[], ClientT]) -> ClientT:
+        """
+        Return the client registered for key, creating it with factory on first use.
+
+        Args:
+            key: Provider and connection settings identifying the client
+            factory: Creates the client if none exists for key
+
+        Returns:
+            The shared client
+        """
+        client = self._clients.get(key)
+        if client is None:
+            client = factory()
+            self._clients[key] = client
+        return client
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    async def aclose(self) -> None:
+        """Close all clients and their connection pools."""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            try:
+                await client.close()
+            except Exception as e:
+                logger.warning(f"Error closing provider client: {e}")
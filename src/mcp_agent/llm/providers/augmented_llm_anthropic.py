@@ -14,8 +14,8 @@ from mcp_agent._mcp_local_backup.interfaces import ModelT
 from mcp_agent._mcp_local_backup.prompt_message_multipart import PromptMessageMultipart
 
 if TYPE_CHECKING:
-    from mcp.types import ListToolsResult
-from anthropic import Anthropic, AuthenticationError
+    from mcp.types import Tool
+from anthropic import AsyncAnthropic, AuthenticationError
 from anthropic.types import (
     Message,
     MessageParam,
@@ -40,6 +40,9 @@ from mcp_agent.logger.logger import get_logger
 
 DEFAULT_ANTHROPIC_MODEL = "claude-3-7-sonnet-latest"
 
+# Anthropic prompt caching breakpoint
+CACHE_CONTROL = {"type": "ephemeral"}
+
 
 class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
     """
@@ -60,7 +63,12 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
         AugmentedLLM.PARAM_USE_HISTORY,
         AugmentedLLM.PARAM_MAX_ITERATIONS,
         AugmentedLLM.PARAM_PARALLEL_TOOL_CALLS,
+        AugmentedLLM.PARAM_MAX_PARALLEL_TOOL_CALLS,
         AugmentedLLM.PARAM_TEMPLATE_VARS,
+        AugmentedLLM.PARAM_STREAM,
+        AugmentedLLM.PARAM_PRIORITY,
+        AugmentedLLM.PARAM_MAX_HISTORY_TOKENS,
+        AugmentedLLM.PARAM_CACHE_MODE,
     }
 
     def __init__(self, *args, **kwargs) -> None:
@@ -86,6 +94,111 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
         assert self.context.config
         return self.context.config.anthropic.base_url if self.context.config.anthropic else None
 
+    def _anthropic_client(self) -> AsyncAnthropic:
+        api_key = self._api_key()
+        base_url = self._base_url()
+        if base_url and base_url.endswith("/v1"):
+            base_url = base_url.rstrip("/v1")
+
+        return self._provider_client(
+            (api_key, base_url),
+            # Retries are made by _send_request
+            lambda: AsyncAnthropic(api_key=api_key, base_url=base_url, max_retries=0),
+        )
+
+    async def _anthropic_stream(
+        self, anthropic: AsyncAnthropic, arguments: dict, model: str | None
+    ) -> Message:
+        """
+        Stream a completion, rendering text deltas as they arrive.
+        Tool use blocks are assembled from their streamed input JSON by the SDK's MessageStream.
+        """
+        with self._stream_response(model) as stream:
+            async with anthropic.messages.stream(**arguments) as message_stream:
+                async for event in message_stream:
+                    if event.type == "text":
+                        stream.text(event.text)
+                response = await message_stream.get_final_message()
+            stream.finish(response.usage.output_tokens)
+        return response
+
+    def _cache_mode(self, request_params: RequestParams | None = None) -> str:
+        """The request's prompt caching policy, falling back to the configured one."""
+        if request_params is not None and request_params.cache_mode is not None:
+            return request_params.cache_mode
+        anthropic_settings = self.context.config.anthropic if self.context.config else None
+        return anthropic_settings.cache_mode if anthropic_settings else "off"
+
+    @staticmethod
+    def _apply_cache_control(arguments: dict, cache_mode: str) -> None:
+        """
+        Place prompt cache breakpoints on the request arguments.
+
+        "prompt" marks the system prompt and the last tool definition. "auto" additionally
+        marks the final content block of the conversation, so the next iteration of the
+        tool loop reads the whole history prefix from the cache. The shared tool list and
+        the conversation messages are copied, not modified.
+        """
+        if cache_mode == "off":
+            return
+
+        system = arguments.get("system")
+        if isinstance(system, str) and system:
+            arguments["system"] = [
+                TextBlockParam(type="text", text=system, cache_control=CACHE_CONTROL)
+            ]
+
+        tools = arguments.get("tools")
+        if tools:
+            arguments["tools"] = [*tools[:-1], {**tools[-1], "cache_control": CACHE_CONTROL}]
+
+        messages = arguments.get("messages")
+        if cache_mode != "auto" or not messages:
+            return
+
+        last_message = messages[-1]
+        content = last_message["content"]
+        if isinstance(content, str):
+            blocks = [TextBlockParam(type="text", text=content)]
+        else:
+            blocks = list(content)
+        if not blocks or not isinstance(blocks[-1], dict):
+            return
+        # Empty text blocks cannot be cached
+        if blocks[-1].get("type") == "text" and not blocks[-1].get("text"):
+            return
+        blocks[-1] = {**blocks[-1], "cache_control": CACHE_CONTROL}
+        arguments["messages"] = [*messages[:-1], {**last_message, "content": blocks}]
+
+    def _log_usage(self, usage: Usage, model: str | None) -> None:
+        """Log token usage, including prompt cache reads and writes"""
+        cache_read = usage.cache_read_input_tokens or 0
+        cache_write = usage.cache_creation_input_tokens or 0
+        total_input = usage.input_tokens + cache_read + cache_write
+        self.logger.debug(
+            "Anthropic usage",
+            data={
+                "model": model,
+                "input_tokens": usage.input_tokens,
+                "output_tokens": usage.output_tokens,
+                "cache_creation_input_tokens": cache_write,
+                "cache_read_input_tokens": cache_read,
+                "cache_hit_rate": cache_read / total_input if total_input else 0.0,
+            },
+        )
+
+    @staticmethod
+    def _convert_tools(tools: List["Tool"]) -> List[ToolParam]:
+        """Convert MCP tool definitions to Anthropic tool parameters"""
+        return [
+            ToolParam(
+                name=tool.name,
+                description=tool.description or "",
+                input_schema=tool.inputSchema,
+            )
+            for tool in tools
+        ]
+
     async def _anthropic_completion(
         self,
         message_param,
@@ -96,13 +209,8 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
         Override this method to use a different LLM.
         """
 
-        api_key = self._api_key()
-        base_url = self._base_url()
-        if base_url and base_url.endswith("/v1"):
-            base_url = base_url.rstrip("/v1")
-
         try:
-            anthropic = Anthropic(api_key=api_key, base_url=base_url)
+            anthropic = self._anthropic_client()
             messages: List[MessageParam] = []
             params = self.get_request_params(request_params)
         except AuthenticationError as e:
@@ -117,15 +225,7 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
 
         messages.append(message_param)
 
-        tool_list: ListToolsResult = await self.aggregator.list_tools()
-        available_tools: List[ToolParam] = [
-            ToolParam(
-                name=tool.name,
-                description=tool.description or "",
-                input_schema=tool.inputSchema,
-            )
-            for tool in tool_list.tools
-        ]
+        _, available_tools = await self._provider_tools(self._convert_tools)
 
         responses: List[TextContent | ImageContent | EmbeddedResource] = []
 
@@ -149,10 +249,19 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
             arguments = self.prepare_provider_arguments(
                 base_args, params, self.ANTHROPIC_EXCLUDE_FIELDS
             )
+            self._apply_cache_control(arguments, self._cache_mode(params))
 
             self.logger.debug(f"{arguments}")
 
-            executor_result = await self.executor.execute(anthropic.messages.create, **arguments)
+            if params.stream:
+                completion = self._send_request(
+                    lambda: self._anthropic_stream(anthropic, arguments, model), params, arguments
+                )
+            else:
+                completion = self._send_request(
+                    lambda: anthropic.messages.create(**arguments), params, arguments
+                )
+            executor_result = await self.executor.execute(completion)
 
             response = executor_result[0]
 
@@ -189,6 +298,7 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
                 f"{model} response:",
                 data=response,
             )
+            self._log_usage(response.usage, model)
 
             response_as_message = self.convert_message_to_message_param(response)
             messages.append(response_as_message)
@@ -250,28 +360,31 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
                             style="dim green italic",
                         )
 
-                    # Process all tool calls and collect results
-                    tool_results = []
-                    for i, content in enumerate(tool_uses):
-                        tool_name = content.name
-                        tool_args = content.input
-                        tool_use_id = content.id
-
-                        if i == 0:  # Only show message for first tool use
-                            await self.show_assistant_message(message_text, tool_name)
-
-                        self.show_tool_call(available_tools, tool_name, tool_args)
-                        tool_call_request = CallToolRequest(
-                            method="tools/call",
-                            params=CallToolRequestParams(name=tool_name, arguments=tool_args),
+                    # Only show message for first tool use
+                    await self.show_assistant_message(message_text, tool_uses[0].name)
+
+                    tool_calls = []
+                    for content in tool_uses:
+                        self.show_tool_call(available_tools, content.name, content.input)
+                        tool_calls.append(
+                            (
+                                content.id,
+                                CallToolRequest(
+                                    method="tools/call",
+                                    params=CallToolRequestParams(
+                                        name=content.name, arguments=content.input
+                                    ),
+                                ),
+                            )
                         )
-                        # TODO -- support MCP isError etc.
-                        result = await self.call_tool(
-                            request=tool_call_request, tool_call_id=tool_use_id
-                        )
-                        self.show_tool_result(result)
 
-                        # Add each result to our collection
+                    # Run the turn's tool calls concurrently, results come back in tool_use order
+                    # TODO -- support MCP isError etc.
+                    results = await self.call_tools(tool_calls, params)
+
+                    tool_results = []
+                    for (tool_use_id, _), result in zip(tool_calls, results):
+                        self.show_tool_result(result)
                         tool_results.append((tool_use_id, result))
                         responses.extend(result.content)
 
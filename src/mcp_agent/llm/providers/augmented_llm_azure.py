@@ -1,4 +1,4 @@
-from openai import AuthenticationError, AzureOpenAI, OpenAI
+from openai import AsyncAzureOpenAI, AuthenticationError
 
 from mcp_agent.core.exceptions import ProviderKeyError
 from mcp_agent.llm.provider_types import Provider
@@ -93,34 +93,37 @@ class AzureOpenAIAugmentedLLM(OpenAIAugmentedLLM):
             if not self.resource_name and self.base_url:
                 self.resource_name = _extract_resource_name(self.base_url)
 
-    def _openai_client(self) -> OpenAI:
+    def _openai_client(self) -> AsyncAzureOpenAI:
         """
-        Returns an AzureOpenAI client, handling both API Key and DefaultAzureCredential.
+        Returns a shared AsyncAzureOpenAI client, handling both API Key and DefaultAzureCredential.
         """
         try:
+            if self.base_url is None:
+                raise ProviderKeyError(
+                    "Missing Azure endpoint",
+                    "azure_endpoint (base_url) is None at client creation time.",
+                )
             if self.use_default_cred:
-                if self.base_url is None:
-                    raise ProviderKeyError(
-                        "Missing Azure endpoint",
-                        "azure_endpoint (base_url) is None at client creation time.",
-                    )
-                return AzureOpenAI(
-                    azure_ad_token_provider=self.get_azure_token,
-                    azure_endpoint=self.base_url,
-                    api_version=self.api_version,
-                    azure_deployment=self.deployment_name,
+                return self._provider_client(
+                    ("default_credential", self.base_url, self.api_version, self.deployment_name),
+                    lambda: AsyncAzureOpenAI(
+                        azure_ad_token_provider=self.get_azure_token,
+                        azure_endpoint=self.base_url,
+                        api_version=self.api_version,
+                        azure_deployment=self.deployment_name,
+                        max_retries=0,
+                    ),
                 )
             else:
-                if self.base_url is None:
-                    raise ProviderKeyError(
-                        "Missing Azure endpoint",
-                        "azure_endpoint (base_url) is None at client creation time.",
-                    )
-                return AzureOpenAI(
-                    api_key=self.api_key,
-                    azure_endpoint=self.base_url,
-                    api_version=self.api_version,
-                    azure_deployment=self.deployment_name,
+                return self._provider_client(
+                    (self.api_key, self.base_url, self.api_version, self.deployment_name),
+                    lambda: AsyncAzureOpenAI(
+                        api_key=self.api_key,
+                        azure_endpoint=self.base_url,
+                        api_version=self.api_version,
+                        azure_deployment=self.deployment_name,
+                        max_retries=0,
+                    ),
                 )
         except AuthenticationError as e:
             if self.use_default_cred:
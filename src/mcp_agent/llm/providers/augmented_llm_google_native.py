@@ -90,10 +90,15 @@ class GoogleNativeAugmentedLLM(AugmentedLLM[types.Content, types.Content]):
 
         # Call Gemini API
         try:
-            api_response = await self._google_client.aio.models.generate_content(
-                model=request_params.model,
-                contents=conversation_history,
-                config=generate_content_config,
+            arguments = {
+                "model": request_params.model,
+                "contents": conversation_history,
+                "config": generate_content_config,
+            }
+            api_response = await self._send_request(
+                lambda: self._google_client.aio.models.generate_content(**arguments),
+                request_params,
+                arguments,
             )
         except Exception as e:
             self.logger.error(f"Error during Gemini structured call: {e}")
@@ -236,10 +241,9 @@ class GoogleNativeAugmentedLLM(AugmentedLLM[types.Content, types.Content]):
 
         for i in range(request_params.max_iterations):
             # 1. Get available tools
-            aggregator_response = await self.aggregator.list_tools()
-            available_tools = self._converter.convert_to_google_tools(
-                aggregator_response.tools
-            )  # Convert fast-agent tools to google.genai tools
+            aggregator_response, available_tools = await self._provider_tools(
+                self._converter.convert_to_google_tools
+            )  # Convert fast-agent tools to google.genai tools, cached per tool list version
 
             # 2. Prepare generate_content arguments
             generate_content_config = self._converter.convert_request_params_to_google_config(
@@ -257,10 +261,15 @@ class GoogleNativeAugmentedLLM(AugmentedLLM[types.Content, types.Content]):
             # 3. Call the google.genai API
             try:
                 # Use the async client
-                api_response = await self._google_client.aio.models.generate_content(
-                    model=request_params.model,
-                    contents=conversation_history,  # Pass the current turn's conversation history
-                    config=generate_content_config,
+                arguments = {
+                    "model": request_params.model,
+                    "contents": conversation_history,  # The current turn's conversation history
+                    "config": generate_content_config,
+                }
+                api_response = await self._send_request(
+                    lambda: self._google_client.aio.models.generate_content(**arguments),
+                    request_params,
+                    arguments,
                 )
                 self.logger.debug("Google generate_content response:", data=api_response)
 
@@ -324,9 +333,9 @@ class GoogleNativeAugmentedLLM(AugmentedLLM[types.Content, types.Content]):
 
             # 5. Handle tool calls if any
             if tool_calls_to_execute:
-                tool_results = []
+                tool_calls = []
                 for tool_call_params in tool_calls_to_execute:
-                    # Convert to CallToolRequest and execute
+                    # Convert to CallToolRequest
                     tool_call_request = CallToolRequest(
                         method="tools/call", params=tool_call_params
                     )
@@ -337,9 +346,14 @@ class GoogleNativeAugmentedLLM(AugmentedLLM[types.Content, types.Content]):
                             tool_call_request.params.arguments
                         ),  # Convert dict to string for display
                     )
+                    # google.genai does not provide a tool_call_id, pass None.
+                    tool_calls.append((None, tool_call_request))
+
+                # Execute the tool calls concurrently, results are returned in request order
+                results = await self.call_tools(tool_calls, request_params)
 
-                    # Execute the tool call. google.genai does not provide a tool_call_id, pass None.
-                    result = await self.call_tool(tool_call_request, None)
+                tool_results = []
+                for tool_call_params, result in zip(tool_calls_to_execute, results):
                     self.show_oai_tool_result(
                         str(result.content)
                     )  # Use show_oai_tool_result for consistency
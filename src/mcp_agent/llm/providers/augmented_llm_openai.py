@@ -7,16 +7,21 @@ from mcp.types import (
     EmbeddedResource,
     ImageContent,
     TextContent,
+    Tool,
 )
-from openai import AuthenticationError, OpenAI
+from openai import AsyncOpenAI, AuthenticationError
 
 # from openai.types.beta.chat import
 from openai.types.chat import (
+    ChatCompletion,
     ChatCompletionMessage,
     ChatCompletionMessageParam,
+    ChatCompletionMessageToolCall,
     ChatCompletionSystemMessageParam,
     ChatCompletionToolParam,
 )
+from openai.types.chat.chat_completion import Choice
+from openai.types.chat.chat_completion_message_tool_call import Function
 from pydantic_core import from_json
 from rich.text import Text
 
@@ -54,6 +59,7 @@ class OpenAIAugmentedLLM(AugmentedLLM[ChatCompletionMessageParam, ChatCompletion
         AugmentedLLM.PARAM_MAX_TOKENS,
         AugmentedLLM.PARAM_SYSTEM_PROMPT,
         AugmentedLLM.PARAM_PARALLEL_TOOL_CALLS,
+        AugmentedLLM.PARAM_MAX_PARALLEL_TOOL_CALLS,
         AugmentedLLM.PARAM_USE_HISTORY,
         AugmentedLLM.PARAM_MAX_ITERATIONS,
         AugmentedLLM.PARAM_TEMPLATE_VARS,
@@ -103,9 +109,15 @@ class OpenAIAugmentedLLM(AugmentedLLM[ChatCompletionMessageParam, ChatCompletion
     def _base_url(self) -> str:
         return self.context.config.openai.base_url if self.context.config.openai else None
 
-    def _openai_client(self) -> OpenAI:
+    def _openai_client(self) -> AsyncOpenAI:
         try:
-            return OpenAI(api_key=self._api_key(), base_url=self._base_url())
+            api_key = self._api_key()
+            base_url = self._base_url()
+            return self._provider_client(
+                (api_key, base_url),
+                # Retries are made by _send_request
+                lambda: AsyncOpenAI(api_key=api_key, base_url=base_url, max_retries=0),
+            )
         except AuthenticationError as e:
             raise ProviderKeyError(
                 "Invalid OpenAI API key",
@@ -113,6 +125,86 @@ class OpenAIAugmentedLLM(AugmentedLLM[ChatCompletionMessageParam, ChatCompletion
                 "Please check that your API key is valid and not expired.",
             ) from e
 
+    def _convert_tools(self, tools: List[Tool]) -> List[ChatCompletionToolParam] | None:
+        """Convert MCP tool definitions to OpenAI function tool parameters"""
+        available_tools: List[ChatCompletionToolParam] = [
+            ChatCompletionToolParam(
+                type="function",
+                function={
+                    "name": tool.name,
+                    "description": tool.description if tool.description else "",
+                    "parameters": self.adjust_schema(tool.inputSchema),
+                },
+            )
+            for tool in tools
+        ]
+
+        return available_tools or None  # deepseek does not allow empty array
+
+    async def _openai_stream(self, arguments: dict) -> ChatCompletion:
+        """
+        Stream a completion, rendering text deltas as they arrive.
+        Tool calls are assembled incrementally from their streamed fragments, and the
+        result is returned as a regular ChatCompletion.
+        """
+        content: List[str] = []
+        tool_calls: Dict[int, Dict[str, str]] = {}
+        finish_reason = None
+        usage = None
+        completion_id = ""
+        created = 0
+
+        with self._stream_response(self.default_request_params.model) as stream:
+            chunks = await self._openai_client().chat.completions.create(
+                **arguments, stream=True, stream_options={"include_usage": True}
+            )
+            async for chunk in chunks:
+                completion_id = chunk.id
+                created = chunk.created
+                if chunk.usage:
+                    usage = chunk.usage
+                if not chunk.choices:
+                    continue
+
+                choice = chunk.choices[0]
+                if choice.delta.content:
+                    content.append(choice.delta.content)
+                    stream.text(choice.delta.content)
+                for tool_call in choice.delta.tool_calls or []:
+                    call = tool_calls.setdefault(
+                        tool_call.index, {"id": "", "name": "", "arguments": ""}
+                    )
+                    if tool_call.id:
+                        call["id"] = tool_call.id
+                    if tool_call.function:
+                        call["name"] += tool_call.function.name or ""
+                        call["arguments"] += tool_call.function.arguments or ""
+                if choice.finish_reason:
+                    finish_reason = choice.finish_reason
+            stream.finish(usage.completion_tokens if usage else None)
+
+        message = ChatCompletionMessage(
+            role="assistant",
+            content="".join(content) or None,
+            tool_calls=[
+                ChatCompletionMessageToolCall(
+                    id=call["id"],
+                    type="function",
+                    function=Function(name=call["name"], arguments=call["arguments"]),
+                )
+                for _, call in sorted(tool_calls.items())
+            ]
+            or None,
+        )
+        return ChatCompletion(
+            id=completion_id,
+            created=created,
+            model=self.default_request_params.model or "",
+            object="chat.completion",
+            choices=[Choice(index=0, finish_reason=finish_reason or "stop", message=message)],
+            usage=usage,
+        )
+
     async def _openai_completion(
         self,
         message: OpenAIMessage,
@@ -137,21 +229,7 @@ class OpenAIAugmentedLLM(AugmentedLLM[ChatCompletionMessageParam, ChatCompletion
         messages.extend(self.history.get(include_completion_history=request_params.use_history))
         messages.append(message)
 
-        response = await self.aggregator.list_tools()
-        available_tools: List[ChatCompletionToolParam] | None = [
-            ChatCompletionToolParam(
-                type="function",
-                function={
-                    "name": tool.name,
-                    "description": tool.description if tool.description else "",
-                    "parameters": self.adjust_schema(tool.inputSchema),
-                },
-            )
-            for tool in response.tools
-        ]
-
-        if not available_tools:
-            available_tools = None  # deepseek does not allow empty array
+        _, available_tools = await self._provider_tools(self._convert_tools)
 
         # we do NOT send "stop sequences" as this causes errors with mutlimodal processing
         for i in range(request_params.max_iterations):
@@ -160,9 +238,17 @@ class OpenAIAugmentedLLM(AugmentedLLM[ChatCompletionMessageParam, ChatCompletion
 
             self._log_chat_progress(self.chat_turn(), model=self.default_request_params.model)
 
-            executor_result = await self.executor.execute(
-                self._openai_client().chat.completions.create, **arguments
-            )
+            if request_params.stream:
+                completion = self._send_request(
+                    lambda: self._openai_stream(arguments), request_params, arguments
+                )
+            else:
+                completion = self._send_request(
+                    lambda: self._openai_client().chat.completions.create(**arguments),
+                    request_params,
+                    arguments,
+                )
+            executor_result = await self.executor.execute(completion)
 
             response = executor_result[0]
 
@@ -212,7 +298,7 @@ class OpenAIAugmentedLLM(AugmentedLLM[ChatCompletionMessageParam, ChatCompletion
                         message.tool_calls[0].function.name,
                     )
 
-                tool_results = []
+                tool_calls = []
                 for tool_call in message.tool_calls:
                     self.show_tool_call(
                         available_tools,
@@ -229,10 +315,14 @@ class OpenAIAugmentedLLM(AugmentedLLM[ChatCompletionMessageParam, ChatCompletion
                             else from_json(tool_call.function.arguments, allow_partial=True),
                         ),
                     )
-                    result = await self.call_tool(tool_call_request, tool_call.id)
-                    self.show_oai_tool_result(str(result))
+                    tool_calls.append((tool_call.id, tool_call_request))
+
+                results = await self.call_tools(tool_calls, request_params)
 
-                    tool_results.append((tool_call.id, result))
+                tool_results = []
+                for (tool_call_id, _), result in zip(tool_calls, results):
+                    self.show_oai_tool_result(str(result))
+                    tool_results.append((tool_call_id, result))
                     responses.extend(result.content)
                 messages.extend(OpenAIConverter.convert_function_results_to_openai(tool_results))
 
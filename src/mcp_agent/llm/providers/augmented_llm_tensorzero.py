@@ -183,13 +183,18 @@ class TensorZeroAugmentedLLM(AugmentedLLM[Dict[str, Any], Any]):
                 t0_api_input_dict["messages"] = current_api_messages  # type: ignore
 
                 # [4] Call the TensorZero inference API
-                response_iter_or_completion = await gateway.inference(
-                    function_name=self._t0_function_name,
-                    input=t0_api_input_dict,
-                    additional_tools=available_tools,
-                    parallel_tool_calls=use_parallel_calls,
-                    stream=False,
-                    episode_id=current_t0_episode_id,
+                inference_arguments = {
+                    "function_name": self._t0_function_name,
+                    "input": t0_api_input_dict,
+                    "additional_tools": available_tools,
+                    "parallel_tool_calls": use_parallel_calls,
+                    "stream": False,
+                    "episode_id": current_t0_episode_id,
+                }
+                response_iter_or_completion = await self._send_request(
+                    lambda: gateway.inference(**inference_arguments),
+                    merged_params,
+                    inference_arguments,
                 )
 
                 if not isinstance(
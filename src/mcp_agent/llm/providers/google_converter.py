@@ -75,71 +75,78 @@ class GoogleConverter:
         """
         google_contents: List[types.Content] = []
         for message in messages:
-            parts: List[types.Part] = []
-            for part_content in message.content:  # renamed part to part_content to avoid conflict
-                if is_text_content(part_content):
-                    parts.append(types.Part.from_text(text=get_text(part_content) or ""))
-                elif is_image_content(part_content):
-                    assert isinstance(part_content, ImageContent)
-                    image_bytes = base64.b64decode(get_image_data(part_content) or "")
+            content = message.converted("google", self._convert_to_google_content)
+            if content is not None:
+                google_contents.append(content)
+        return google_contents
+
+    def _convert_to_google_content(self, message: PromptMessageMultipart) -> types.Content | None:
+        """Converts one message, or returns None if it has no convertible parts."""
+        parts: List[types.Part] = []
+        for part_content in message.content:  # renamed part to part_content to avoid conflict
+            if is_text_content(part_content):
+                parts.append(types.Part.from_text(text=get_text(part_content) or ""))
+            elif is_image_content(part_content):
+                assert isinstance(part_content, ImageContent)
+                image_bytes = base64.b64decode(get_image_data(part_content) or "")
+                parts.append(
+                    types.Part.from_bytes(mime_type=part_content.mimeType, data=image_bytes)
+                )
+            elif is_resource_content(part_content):
+                assert isinstance(part_content, EmbeddedResource)
+                if (
+                    "application/pdf" == part_content.resource.mimeType
+                    and hasattr(part_content.resource, "blob")
+                    and isinstance(part_content.resource, BlobResourceContents)
+                ):
+                    pdf_bytes = base64.b64decode(part_content.resource.blob)
                     parts.append(
-                        types.Part.from_bytes(mime_type=part_content.mimeType, data=image_bytes)
+                        types.Part.from_bytes(
+                            mime_type=part_content.resource.mimeType or "application/pdf",
+                            data=pdf_bytes,
+                        )
                     )
-                elif is_resource_content(part_content):
-                    assert isinstance(part_content, EmbeddedResource)
-                    if (
-                        "application/pdf" == part_content.resource.mimeType
-                        and hasattr(part_content.resource, "blob")
-                        and isinstance(part_content.resource, BlobResourceContents)
+                else:
+                    # Check if the resource itself has text content
+                    resource_text = None
+                    if hasattr(part_content.resource, "text"):  # Direct text attribute
+                        resource_text = part_content.resource.text
+                    # Example: if EmbeddedResource wraps a TextContent-like object in its 'resource' field
+                    elif (
+                        hasattr(part_content.resource, "type")
+                        and part_content.resource.type == "text"
+                        and hasattr(part_content.resource, "text")
                     ):
-                        pdf_bytes = base64.b64decode(part_content.resource.blob)
+                        resource_text = get_text(part_content.resource)
+
+                    if resource_text is not None:
+                        parts.append(types.Part.from_text(text=resource_text))
+                    else:
+                        # Fallback for other binary types or types without direct text
+                        uri_str = (
+                            part_content.resource.uri
+                            if hasattr(part_content.resource, "uri")
+                            else "unknown_uri"
+                        )
+                        mime_str = (
+                            part_content.resource.mimeType
+                            if hasattr(part_content.resource, "mimeType")
+                            else "unknown_mime"
+                        )
                         parts.append(
-                            types.Part.from_bytes(
-                                mime_type=part_content.resource.mimeType or "application/pdf",
-                                data=pdf_bytes,
+                            types.Part.from_text(
+                                text=f"[Resource: {uri_str}, MIME: {mime_str}]"
                             )
                         )
-                    else:
-                        # Check if the resource itself has text content
-                        resource_text = None
-                        if hasattr(part_content.resource, "text"):  # Direct text attribute
-                            resource_text = part_content.resource.text
-                        # Example: if EmbeddedResource wraps a TextContent-like object in its 'resource' field
-                        elif (
-                            hasattr(part_content.resource, "type")
-                            and part_content.resource.type == "text"
-                            and hasattr(part_content.resource, "text")
-                        ):
-                            resource_text = get_text(part_content.resource)
 
-                        if resource_text is not None:
-                            parts.append(types.Part.from_text(text=resource_text))
-                        else:
-                            # Fallback for other binary types or types without direct text
-                            uri_str = (
-                                part_content.resource.uri
-                                if hasattr(part_content.resource, "uri")
-                                else "unknown_uri"
-                            )
-                            mime_str = (
-                                part_content.resource.mimeType
-                                if hasattr(part_content.resource, "mimeType")
-                                else "unknown_mime"
-                            )
-                            parts.append(
-                                types.Part.from_text(
-                                    text=f"[Resource: {uri_str}, MIME: {mime_str}]"
-                                )
-                            )
-
-            if parts:
-                google_role = (
-                    "user"
-                    if message.role == "user"
-                    else ("model" if message.role == "assistant" else "tool")
-                )
-                google_contents.append(types.Content(role=google_role, parts=parts))
-        return google_contents
+        if parts:
+            google_role = (
+                "user"
+                if message.role == "user"
+                else ("model" if message.role == "assistant" else "tool")
+            )
+            return types.Content(role=google_role, parts=parts)
+        return None
 
     def convert_to_google_tools(self, tools: List[ToolDefinition]) -> List[types.Tool]:
         """
@@ -72,6 +72,10 @@ class AnthropicConverter:
         Returns:
             An Anthropic API MessageParam object
         """
+        return multipart_msg.converted("anthropic", AnthropicConverter._convert_to_anthropic)
+
+    @staticmethod
+    def _convert_to_anthropic(multipart_msg: PromptMessageMultipart) -> MessageParam:
         role = multipart_msg.role
 
         # Handle empty content case - create an empty list instead of a text block
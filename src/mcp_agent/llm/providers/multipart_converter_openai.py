@@ -65,6 +65,15 @@ class OpenAIConverter:
         Returns:
             An OpenAI API message object
         """
+        return multipart_msg.converted(
+            f"openai:{concatenate_text_blocks}",
+            lambda message: OpenAIConverter._convert_to_openai(message, concatenate_text_blocks),
+        )
+
+    @staticmethod
+    def _convert_to_openai(
+        multipart_msg: PromptMessageMultipart, concatenate_text_blocks: bool
+    ) -> Dict[str, str | ContentBlock | List[ContentBlock]]:
         role = multipart_msg.role
 
         # Handle empty content
@@ -404,8 +413,8 @@ class OpenAIConverter:
         # Process non-text content as a separate user message
         non_text_multipart = PromptMessageMultipart(role="user", content=non_text_content)
 
-        # Convert to OpenAI format
-        user_message = OpenAIConverter.convert_to_openai(non_text_multipart)
+        # Convert to OpenAI format; copied, as converted messages are shared
+        user_message = dict(OpenAIConverter.convert_to_openai(non_text_multipart))
 
         # We need to add tool_call_id manually
         user_message["tool_call_id"] = tool_call_id
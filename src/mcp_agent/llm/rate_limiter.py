@@ -0,0 +1,205 @@
+"""
+Client-side rate limits for LLM provider requests, shared by all agents of an application
+context so concurrent agents queue instead of tripping the provider's rate limits.
+"""
+
+import heapq
+import itertools
+import time
+from typing import Dict, Hashable, List, Tuple
+
+from anyio import Event, move_on_after
+from pydantic import BaseModel
+
+from mcp_agent.config import LLMRateLimitSettings, Settings
+from mcp_agent.logger.logger import get_logger
+
+logger = get_logger(__name__)
+
+class RateLimitStats(BaseModel):
+    """
+    Counters for the requests sent through one rate limiter.
+    """
+
+    requests: int = 0
+    """Requests that were let through."""
+
+    queued: int = 0
+    """Requests that had to wait for capacity."""
+
+    tokens: int = 0
+    """Estimated tokens of the requests let through."""
+
+    queue_depth: int = 0
+    """Requests currently waiting."""
+
+    wait_seconds_total: float = 0
+    """Time spent waiting for capacity, summed over all requests."""
+
+    wait_seconds_max: float = 0
+    """Longest time a request waited for capacity."""
+
+
+class _Bucket:
+    """Token bucket holding up to capacity, refilled at capacity per minute."""
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.level = float(capacity)
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.capacity / 60)
+        self._updated = now
+
+    def seconds_until(self, amount: int, now: float) -> float:
+        """Time until amount can be taken; larger amounts than capacity need a full bucket."""
+        self._refill(now)
+        missing = min(amount, self.capacity) - self.level
+        return max(missing * 60 / self.capacity, 0)
+
+    def take(self, amount: int, now: float) -> None:
+        self._refill(now)
+        # May go negative for requests larger than the bucket, delaying the next ones
+        self.level -= amount
+
+
+class _Waiter:
+    def __init__(self, priority: int, sequence: int, tokens: int) -> None:
+        self.sort_key = (-priority, sequence)
+        self.tokens = tokens
+        self.event = Event()
+
+    def __lt__(self, other: "_Waiter") -> bool:
+        return self.sort_key < other.sort_key
+
+
+class RateLimiter:
+    """
+    Lets requests through within a requests-per-minute and an estimated tokens-per-minute
+    budget. Requests that would exceed either wait in a queue ordered by priority, then
+    arrival, so interactive requests overtake queued batch requests.
+    """
+
+    def __init__(self, name: str, settings: LLMRateLimitSettings) -> None:
+        self.name = name
+        self.settings = settings
+        self._buckets: List[Tuple[_Bucket, bool]] = []
+        if settings.requests_per_minute:
+            self._buckets.append((_Bucket(settings.requests_per_minute), False))
+        if settings.tokens_per_minute:
+            self._buckets.append((_Bucket(settings.tokens_per_minute), True))
+        self._waiters: List[_Waiter] = []
+        self._sequence = itertools.count()
+        self._stats = RateLimitStats()
+
+    def stats(self) -> RateLimitStats:
+        return self._stats.model_copy(update={"queue_depth": len(self._waiters)})
+
+    def _seconds_until(self, tokens: int, now: float) -> float:
+        return max(
+            (
+                bucket.seconds_until(tokens if per_token else 1, now)
+                for bucket, per_token in self._buckets
+            ),
+            default=0,
+        )
+
+    def _take(self, tokens: int, now: float) -> None:
+        for bucket, per_token in self._buckets:
+            bucket.take(tokens if per_token else 1, now)
+
+    async def acquire(self, tokens: int = 0, priority: int = 0) -> float:
+        """
+        Wait until a request of an estimated number of tokens fits in the limits, and count
+        it against them.
+
+        Returns:
+            Seconds spent waiting
+        """
+        started = time.monotonic()
+        waited = 0.0
+        if self._waiters or self._seconds_until(tokens, started) > 0:
+            await self._wait(tokens, priority)
+            waited = time.monotonic() - started
+        self._take(tokens, time.monotonic())
+
+        self._stats.requests += 1
+        self._stats.tokens += tokens
+        self._stats.wait_seconds_total += waited
+        self._stats.wait_seconds_max = max(self._stats.wait_seconds_max, waited)
+        if waited:
+            logger.debug(
+                f"Rate limit for {self.name} delayed a request by {waited:.2f}s",
+                data={"wait_seconds": waited, "queue_depth": len(self._waiters)},
+            )
+        return waited
+
+    async def _wait(self, tokens: int, priority: int) -> None:
+        waiter = _Waiter(priority, next(self._sequence), tokens)
+        heapq.heappush(self._waiters, waiter)
+        self._stats.queued += 1
+        try:
+            while True:
+                if self._waiters[0] is waiter:
+                    delay = self._seconds_until(tokens, time.monotonic())
+                    if delay <= 0:
+                        return
+                    with move_on_after(delay):
+                        await waiter.event.wait()
+                else:
+                    await waiter.event.wait()
+                waiter.event = Event()
+        finally:
+            was_head = self._waiters[0] is waiter
+            self._waiters.remove(waiter)
+            heapq.heapify(self._waiters)
+            if was_head and self._waiters:
+                self._waiters[0].event.set()
+
+
+def rate_limit_settings(
+    config: Settings | None, provider: str, model: str | None
+) -> LLMRateLimitSettings | None:
+    """The configured rate limit for a provider's model, falling back to the provider's."""
+    rate_limits = getattr(config, "rate_limits", None)
+    if not isinstance(rate_limits, dict):
+        return None
+    return rate_limits.get(f"{provider}.{model}") or rate_limits.get(provider)
+
+
+class RateLimiters:
+    """
+    Registry of rate limiters, one per provider, API key and model, shared by the LLMs of
+    an application context.
+    """
+
+    def __init__(self) -> None:
+        self._limiters: Dict[Tuple[Hashable, ...], RateLimiter] = {}
+
+    def get(
+        self,
+        provider: str,
+        api_key: str | None,
+        model: str | None,
+        settings: LLMRateLimitSettings,
+    ) -> RateLimiter:
+        """Return the limiter for a provider, API key and model, creating it on first use."""
+        key = (provider, api_key, model)
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            limiter = RateLimiter(f"{provider}.{model}", settings)
+            self._limiters[key] = limiter
+        return limiter
+
+    def stats(self) -> Dict[str, RateLimitStats]:
+        """Statistics per limiter, keyed by provider and model ("#2" etc. for further keys)."""
+        stats: Dict[str, RateLimitStats] = {}
+        for limiter in self._limiters.values():
+            name = limiter.name
+            for number in itertools.count(2):
+                if name not in stats:
+                    break
+                name = f"{limiter.name}#{number}"
+            stats[name] = limiter.stats()
+        return stats
@@ -0,0 +1,153 @@
+"""
+Retrying of LLM provider requests that fail with a transient error, with exponential
+backoff, full jitter and support for the provider's Retry-After headers.
+"""
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, TypeVar
+
+import httpx
+from anyio import fail_after, sleep
+
+from mcp_agent.config import LLMRetrySettings
+from mcp_agent.logger.logger import get_logger
+
+logger = get_logger(__name__)
+
+R = TypeVar("R")
+
+# Error types reported in the body of a failed (possibly streamed) response
+RETRYABLE_ERROR_TYPES = {"overloaded_error", "rate_limit_error", "api_error"}
+
+# Network failures; SDKs raise their own connection errors from these
+CONNECTION_ERRORS = (httpx.TransportError, ConnectionError, TimeoutError)
+
+
+def status_code(error: BaseException) -> int | None:
+    """The HTTP status of a provider error, if it has one."""
+    for attribute in ("status_code", "code"):
+        value = getattr(error, attribute, None)
+        if isinstance(value, int):
+            return value
+    return None
+
+
+def _response(error: BaseException) -> httpx.Response | None:
+    # Read the instance attribute, as some SDKs deprecate a response property
+    response = getattr(error, "__dict__", {}).get("response")
+    return response if isinstance(response, httpx.Response) else None
+
+
+def _error_type(error: BaseException) -> str | None:
+    body = getattr(error, "body", None)
+    if isinstance(body, dict) and isinstance(body.get("error"), dict):
+        return body["error"].get("type")
+    return None
+
+
+def retry_after(error: BaseException, now: float | None = None) -> float | None:
+    """
+    Seconds the provider asked to wait before retrying, from the retry-after-ms or
+    Retry-After header (in seconds or as an HTTP date) of the error's response.
+    """
+    response = _response(error)
+    if response is None:
+        return None
+
+    milliseconds = response.headers.get("retry-after-ms")
+    if milliseconds:
+        try:
+            return max(float(milliseconds) / 1000, 0)
+        except ValueError:
+            pass
+
+    value = response.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - (time.time() if now is None else now), 0)
+
+
+def is_retryable(error: BaseException, settings: LLMRetrySettings) -> bool:
+    """Whether a request that failed with error may succeed if sent again."""
+    if isinstance(error, CONNECTION_ERRORS) or isinstance(error.__cause__, CONNECTION_ERRORS):
+        return True
+    if status_code(error) in settings.retry_on_status:
+        return True
+    return _error_type(error) in RETRYABLE_ERROR_TYPES
+
+
+def retry_delay(retry: int, settings: LLMRetrySettings, error: BaseException) -> float | None:
+    """
+    Delay before the given retry (counting from 1): the provider's Retry-After if it sent
+    one, otherwise a random delay up to the exponentially growing backoff ("full jitter").
+    None if the provider asked to wait longer than max_delay_seconds.
+    """
+    if settings.respect_retry_after:
+        requested = retry_after(error)
+        if requested is not None:
+            return requested if requested <= settings.max_delay_seconds else None
+    backoff = settings.initial_delay_seconds * 2 ** (retry - 1)
+    return random.uniform(0, min(backoff, settings.max_delay_seconds))
+
+
+async def call_with_retry(
+    attempt: Callable[[], Awaitable[R]],
+    settings: LLMRetrySettings,
+    name: str = "LLM",
+) -> R:
+    """
+    Await attempt() until it succeeds, fails with an error that is not transient, runs
+    out of attempts or passes the deadline. attempt must send the complete request again
+    each time it is called, so a retry re-sends the same request.
+
+    Raises:
+        The error of the last attempt, or TimeoutError once the deadline has passed
+    """
+    deadline = None
+    if settings.deadline_seconds is not None:
+        deadline = time.monotonic() + settings.deadline_seconds
+
+    number = 0
+    while True:
+        number += 1
+        try:
+            with fail_after(None if deadline is None else deadline - time.monotonic()):
+                return await attempt()
+        except Exception as e:
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(
+                    f"{name} request did not complete within {settings.deadline_seconds}s "
+                    f"({number} attempts)"
+                ) from e
+            if not is_retryable(e, settings):
+                raise
+            retries = settings.max_attempts - 1
+            if number > retries:
+                if retries:
+                    logger.warning(f"{name} request failed after {number} attempts: {e}")
+                raise
+
+            delay = retry_delay(number, settings, e)
+            if delay is None or (deadline is not None and time.monotonic() + delay >= deadline):
+                logger.warning(f"{name} request failed, cannot be retried in time: {e}")
+                raise
+            logger.warning(
+                f"{name} request failed ({e}), retry {number} of {retries} in {delay:.2f}s",
+                data={
+                    "attempt": number,
+                    "max_attempts": settings.max_attempts,
+                    "status_code": status_code(e),
+                    "delay_seconds": delay,
+                },
+            )
+        await sleep(delay)
@@ -0,0 +1,102 @@
+"""
+Support for streaming provider responses as text deltas.
+"""
+
+import time
+from typing import Callable, List
+
+
+class CompletionStream:
+    """
+    Tracks a single streamed provider response.
+
+    Text deltas are forwarded to on_text as they arrive, and the timings needed for
+    time to first token (TTFT) and output throughput are recorded along the way.
+    """
+
+    def __init__(
+        self,
+        on_text: Callable[[str], None] | None = None,
+        on_first_token: Callable[["CompletionStream"], None] | None = None,
+    ) -> None:
+        self._on_text = on_text
+        self._on_first_token = on_first_token
+        self._parts: List[str] = []
+        self.started: float = time.perf_counter()
+        self.first_token: float | None = None
+        self.finished: float | None = None
+        self.output_tokens: int | None = None
+
+    def text(self, delta: str) -> None:
+        """Record a text delta from the provider stream."""
+        if not delta:
+            return
+        if self.first_token is None:
+            self.first_token = time.perf_counter()
+            if self._on_first_token:
+                self._on_first_token(self)
+        self._parts.append(delta)
+        if self._on_text:
+            self._on_text(delta)
+
+    def finish(self, output_tokens: int | None = None) -> None:
+        """Mark the stream as complete, with the output token count reported by the provider."""
+        self.finished = time.perf_counter()
+        self.output_tokens = output_tokens
+
+    @property
+    def content(self) -> str:
+        """The text streamed so far."""
+        return "".join(self._parts)
+
+    @property
+    def ttft(self) -> float | None:
+        """Seconds from the request to the first text delta."""
+        if self.first_token is None:
+            return None
+        return self.first_token - self.started
+
+    @property
+    def tokens_per_second(self) -> float | None:
+        """Output tokens per second, measured from the first token to the end of the stream."""
+        if self.finished is None or not self.output_tokens:
+            return None
+        generation_start = self.first_token if self.first_token is not None else self.started
+        elapsed = self.finished - generation_start
+        if elapsed <= 0:
+            return None
+        return self.output_tokens / elapsed
+
+
+class StreamListener:
+    """
+    Forwards the text deltas of one streamed generation to its consumer.
+
+    Text is counted from the start of each provider request. A retried request streams its
+    response again from the start, so text the consumer already received from a failed
+    attempt is not forwarded a second time.
+    """
+
+    def __init__(self, owner: object, on_text: Callable[[str], None]) -> None:
+        self.owner = owner
+        self._on_text = on_text
+        self._sent = 0
+        self._position = 0
+
+    def start_request(self) -> None:
+        """A new provider request begins; all of its text is new."""
+        self._sent = 0
+        self._position = 0
+
+    def start_attempt(self) -> None:
+        """The current request is sent (again), streaming its response from the start."""
+        self._position = 0
+
+    def text(self, delta: str) -> None:
+        """Forward the part of a delta the consumer has not received yet."""
+        start = self._position
+        self._position += len(delta)
+        if self._position <= self._sent:
+            return
+        self._on_text(delta[max(0, self._sent - start) :])
+        self._sent = self._position
@@ -0,0 +1,18 @@
+"""
+Rough token estimates for provider payloads, for budgeting before a tokenizer is involved.
+"""
+
+import json
+from typing import Any
+
+# Rough number of characters per token, for estimating request sizes
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(payload: Any, max_output_tokens: int | None = None) -> int:
+    """
+    Estimate the tokens a request uses from the size of its payload, plus the output
+    tokens it may generate, as providers count those against their limits too.
+    """
+    size = len(json.dumps(payload, default=str))
+    return size // CHARS_PER_TOKEN + (max_output_tokens or 0)
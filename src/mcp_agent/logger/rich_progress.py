@@ -73,12 +73,14 @@ class RichProgressDisplay:
             ProgressAction.LOADED: "dim green",
             ProgressAction.INITIALIZED: "dim green",
             ProgressAction.CHATTING: "bold blue",
+            ProgressAction.STREAMING: "bold blue",
             ProgressAction.ROUTING: "bold blue",
             ProgressAction.PLANNING: "bold blue",
             ProgressAction.READY: "dim green",
             ProgressAction.CALLING_TOOL: "bold magenta",
             ProgressAction.FINISHED: "black on green",
             ProgressAction.SHUTDOWN: "black on red",
+            ProgressAction.RECONNECTING: "bold yellow",
             ProgressAction.AGGREGATOR_INITIALIZED: "bold green",
             ProgressAction.FATAL_ERROR: "black on red",
         }.get(action, "white")
@@ -321,20 +321,31 @@ class AsyncEventBus:
         self._running = True
         self._task = asyncio.create_task(self._process_events())
 
-    async def stop(self) -> None:
-        """Stop the event bus and all lifecycle-aware listeners."""
+    async def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stop the event bus and all lifecycle-aware listeners.
+
+        Args:
+            timeout: Overall deadline in seconds for delivering queued events, stopping
+                the processing task and stopping listeners
+        """
         if not self._running:
             return
 
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        def remaining() -> float:
+            return max(deadline - loop.time(), 0)
+
         # Signal processing to stop
         self._running = False
         self._stop_event.set()
 
-        # Try to process remaining items with a timeout
+        # Try to process remaining items before the deadline
         if not self._queue.empty():
             try:
-                # Give some time for remaining items to be processed
-                await asyncio.wait_for(self._queue.join(), timeout=5.0)
+                await asyncio.wait_for(self._queue.join(), timeout=remaining())
             except asyncio.TimeoutError:
                 # If we timeout, drain the queue to prevent deadlock
                 while not self._queue.empty():
@@ -346,12 +357,11 @@ class AsyncEventBus:
             except Exception as e:
                 print(f"Error during queue cleanup: {e}")
 
-        # Cancel and wait for task with timeout
+        # Cancel and wait for task until the deadline
         if self._task and not self._task.done():
             self._task.cancel()
             try:
-                # Wait for task to complete with timeout
-                await asyncio.wait_for(self._task, timeout=5.0)
+                await asyncio.wait_for(self._task, timeout=remaining())
             except (asyncio.CancelledError, asyncio.TimeoutError):
                 pass  # Task was cancelled or timed out
             except Exception as e:
@@ -359,15 +369,27 @@ class AsyncEventBus:
             finally:
                 self._task = None
 
-        # Stop each lifecycle-aware listener
-        for listener in self.listeners.values():
-            if isinstance(listener, LifecycleAwareListener):
-                try:
-                    await asyncio.wait_for(listener.stop(), timeout=3.0)
-                except asyncio.TimeoutError:
-                    print(f"Timeout stopping listener: {listener}")
-                except Exception as e:
-                    print(f"Error stopping listener: {e}")
+        # Stop all lifecycle-aware listeners concurrently
+        listeners = [
+            listener
+            for listener in self.listeners.values()
+            if isinstance(listener, LifecycleAwareListener)
+        ]
+
+        async def stop_listener(listener: LifecycleAwareListener) -> None:
+            try:
+                await listener.stop()
+            except Exception as e:
+                print(f"Error stopping listener: {e}")
+
+        if listeners:
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(*(stop_listener(listener) for listener in listeners)),
+                    timeout=max(remaining(), 0.1),
+                )
+            except asyncio.TimeoutError:
+                print(f"Timeout stopping listeners after {timeout}s")
 
     async def emit(self, event: Event) -> None:
         """Emit an event to all listeners and transport."""
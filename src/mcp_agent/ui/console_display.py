@@ -1,12 +1,16 @@
-from typing import Optional, Union
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional, Union
 
 from mcp.types import CallToolResult
+from rich.errors import LiveError
+from rich.live import Live
 from rich.panel import Panel
 from rich.text import Text
 
 from mcp_agent import console
 from mcp_agent._mcp_local_backup.common import SEP
 from mcp_agent._mcp_local_backup.mcp_aggregator import MCPAggregator
+from mcp_agent.progress_display import progress_display
 
 # Constants
 HUMAN_INPUT_TOOL_NAME = "__human_input__"
@@ -203,6 +207,48 @@ class ConsoleDisplay:
         console.console.print(panel, markup=self._markup)
         console.console.print("\n")
 
+    @contextmanager
+    def streaming_assistant_message(
+        self,
+        title: str = "ASSISTANT",
+        name: Optional[str] = None,
+    ) -> Iterator[Callable[[str], None]]:
+        """
+        Render an assistant message incrementally while it is being streamed.
+
+        Yields a callback that appends a text delta to a live panel. The live panel is
+        transient - the completed message is displayed by show_assistant_message as usual.
+        Only one message can be live at a time; while another is streaming, deltas are not
+        rendered.
+        """
+        if not self.config or not self.config.logger.show_chat:
+            yield lambda delta: None
+            return
+
+        text = Text()
+        panel = Panel(
+            text,
+            title=f"[{title}]{f' ({name})' if name else ''}",
+            title_align="left",
+            style="green",
+            border_style="bold white",
+            padding=(1, 2),
+        )
+
+        with progress_display.paused():
+            live = Live(panel, console=console.console, transient=True, refresh_per_second=10)
+            try:
+                live.start(refresh=True)
+            except LiveError:
+                # Another response is streaming concurrently and holds the live display
+                yield lambda delta: None
+                return
+            try:
+                # The live display re-renders the panel, so appending to its text is enough
+                yield text.append
+            finally:
+                live.stop()
+
     def show_user_message(
         self, message, model: Optional[str], chat_turn: int, name: Optional[str] = None
     ) -> None:
@@ -1,15 +1,17 @@
 import os
-import json
+import re
 import time
+import heapq
 import difflib
-from typing import List, Dict, Any
-from googleapiclient.discovery import build
-from google.oauth2 import service_account
+from typing import List, Dict, Set
 
 # Performance optimizations
 SEARCH_CACHE = {}
 CACHE_SIZE_LIMIT = 100
-TIMEOUT_SECONDS = 45  # Stay under Vercel's 60s limit
+
+# Index candidate selection: only the best pre-scored rows get full (fuzzy) scoring
+MAX_SCORED_CANDIDATES = 200
+FUZZY_TOKEN_CUTOFF = 0.8
 
 # Optimized semantic mappings - REDUCED for performance
 SEMANTIC_MAPPINGS = {
@@ -188,101 +190,169 @@ def search_column(expanded_queries, column_text, column_name, config, row):
     return matches
 
 
-def hierarchical_search(query, sheets_data):
-    """OPTIMIZED: Performance-focused hierarchical search with early exits"""
-    start_time = time.time()
-    expanded_queries = expand_search_terms(query)
-    all_matches = []
-    processed_rows = 0
+def tokenize(text):
+    """Split text into lowercase alphanumeric tokens"""
+    return re.findall(r"[a-z0-9]+", str(text).lower())
 
-    # PERFORMANCE: Process maximum 500 rows to prevent timeout
-    max_rows = min(len(sheets_data), 500)
 
-    for row in sheets_data[:max_rows]:
-        processed_rows += 1
+class SheetIndex:
+    """Token-level inverted index over the searchable columns of the sheet.
 
-        # TIMEOUT CHECK: Every 50 rows
-        if processed_rows % 50 == 0:
-            if time.time() - start_time > TIMEOUT_SECONDS:
-                break
+    Built once when the sheet is (re)loaded. Each column maps token -> row ids, so a
+    query only scores rows sharing (or closely matching) one of its tokens instead of
+    walking the whole sheet. Column weights from SEARCH_HIERARCHY are applied when
+    candidates are ranked, not when the index is built.
+    """
 
-        # EARLY EXIT: Stop after finding 8 good matches
-        if len(all_matches) >= 8:
-            break
+    def __init__(self, rows):
+        self.rows = rows
+        self.postings: Dict[str, Dict[str, Set[int]]] = {column: {} for column in SEARCH_HIERARCHY}
+        for row_id, row in enumerate(rows):
+            for column, postings in self.postings.items():
+                for token in set(tokenize(row.get(column, ""))):
+                    postings.setdefault(token, set()).add(row_id)
 
-        row_matches = []
+        self.vocabulary = sorted(
+            set().union(*(postings.keys() for postings in self.postings.values()))
+        )
+        self._token_matches: Dict[str, List[str]] = {}
+
+    def __len__(self):
+        return len(self.rows)
+
+    def matching_tokens(self, query_token):
+        """Indexed tokens a query token can match: itself, tokens it is part of (or
+        that are part of it) and close spellings"""
+        matches = self._token_matches.get(query_token)
+        if matches is None:
+            related = {
+                token
+                for token in self.vocabulary
+                if len(token) >= 3 and (query_token in token or token in query_token)
+            }
+            related.update(
+                difflib.get_close_matches(
+                    query_token, self.vocabulary, n=5, cutoff=FUZZY_TOKEN_CUTOFF
+                )
+            )
+            if len(query_token) < 3 and query_token in self.vocabulary:
+                related.add(query_token)
+            matches = sorted(related)
+            self._token_matches[query_token] = matches
+        return matches
+
+    def candidates(self, expanded_queries, limit=MAX_SCORED_CANDIDATES):
+        """Row ids sharing tokens with the query, best weighted token overlap first"""
+        query_tokens = {
+            token
+            for term in expanded_queries
+            for token in tokenize(term)
+            if len(token) >= 2
+        }
+
+        scores: Dict[int, int] = {}
+        for column, postings in self.postings.items():
+            weight = SEARCH_HIERARCHY[column]["weight"]
+            for query_token in query_tokens:
+                rows: Set[int] = set()
+                for token in self.matching_tokens(query_token):
+                    rows.update(postings.get(token, ()))
+                for row_id in rows:
+                    scores[row_id] = scores.get(row_id, 0) + weight
+
+        if len(scores) > limit:
+            return heapq.nlargest(limit, scores, key=lambda row_id: (scores[row_id], -row_id))
+        return sorted(scores, key=lambda row_id: (-scores[row_id], row_id))
+
+
+def score_row(expanded_queries, row):
+    """Best MatchResult for a row across the search hierarchy, or None"""
+    row_matches = []
+
+    # Level 1: Search Description first (highest priority)
+    description_matches = search_column(
+        expanded_queries,
+        str(row.get("Description", "")),
+        "Description",
+        SEARCH_HIERARCHY["Description"],
+        row,
+    )
+
+    # EARLY EXIT: If exact match found in Description, use it and skip other columns
+    exact_description = [
+        m for m in description_matches if m["match_type"] in ["exact_full", "exact_contains"]
+    ]
+    if exact_description:
+        best_match = max(exact_description, key=lambda x: x["total_score"])
+        return MatchResult(
+            row=row,
+            column_triggered=best_match["column"],
+            match_type=best_match["match_type"],
+            similarity_score=best_match["similarity_score"],
+            total_score=best_match["total_score"],
+        )
 
-        # Level 1: Search Description first (highest priority)
-        description_matches = search_column(
+    row_matches.extend(description_matches)
+
+    # Level 2: Search Demographic
+    demographic_matches = search_column(
+        expanded_queries,
+        str(row.get("Demographic", "")),
+        "Demographic",
+        SEARCH_HIERARCHY["Demographic"],
+        row,
+    )
+    row_matches.extend(demographic_matches)
+
+    # Level 3: Search Grouping
+    grouping_matches = search_column(
+        expanded_queries,
+        str(row.get("Grouping", "")),
+        "Grouping",
+        SEARCH_HIERARCHY["Grouping"],
+        row,
+    )
+    row_matches.extend(grouping_matches)
+
+    # Level 4: Search Category (only if no good matches yet)
+    if not any(m["total_score"] > 80 for m in row_matches):
+        category_matches = search_column(
             expanded_queries,
-            str(row.get("Description", "")),
-            "Description",
-            SEARCH_HIERARCHY["Description"],
+            str(row.get("Category", "")),
+            "Category",
+            SEARCH_HIERARCHY["Category"],
             row,
         )
-
-        # EARLY EXIT: If exact match found in Description, use it and skip other columns
-        exact_description = [
-            m for m in description_matches if m["match_type"] in ["exact_full", "exact_contains"]
-        ]
-        if exact_description:
-            best_match = max(exact_description, key=lambda x: x["total_score"])
-            match_result = MatchResult(
+        row_matches.extend(category_matches)
+
+    # Create MatchResult for best match in this row
+    if row_matches:
+        best_match = max(row_matches, key=lambda x: x["total_score"])
+        # Only add matches above minimum threshold
+        if best_match["total_score"] > 30:
+            return MatchResult(
                 row=row,
                 column_triggered=best_match["column"],
                 match_type=best_match["match_type"],
                 similarity_score=best_match["similarity_score"],
                 total_score=best_match["total_score"],
             )
-            all_matches.append(match_result)
-            continue  # Skip other columns for this row
 
-        row_matches.extend(description_matches)
+    return None
 
-        # Level 2: Search Demographic
-        demographic_matches = search_column(
-            expanded_queries,
-            str(row.get("Demographic", "")),
-            "Demographic",
-            SEARCH_HIERARCHY["Demographic"],
-            row,
-        )
-        row_matches.extend(demographic_matches)
 
-        # Level 3: Search Grouping
-        grouping_matches = search_column(
-            expanded_queries,
-            str(row.get("Grouping", "")),
-            "Grouping",
-            SEARCH_HIERARCHY["Grouping"],
-            row,
-        )
-        row_matches.extend(grouping_matches)
-
-        # Level 4: Search Category (only if no good matches yet)
-        if not any(m["total_score"] > 80 for m in row_matches):
-            category_matches = search_column(
-                expanded_queries,
-                str(row.get("Category", "")),
-                "Category",
-                SEARCH_HIERARCHY["Category"],
-                row,
-            )
-            row_matches.extend(category_matches)
-
-        # Create MatchResult for best match in this row
-        if row_matches:
-            best_match = max(row_matches, key=lambda x: x["total_score"])
-            # Only add matches above minimum threshold
-            if best_match["total_score"] > 30:
-                match_result = MatchResult(
-                    row=row,
-                    column_triggered=best_match["column"],
-                    match_type=best_match["match_type"],
-                    similarity_score=best_match["similarity_score"],
-                    total_score=best_match["total_score"],
-                )
-                all_matches.append(match_result)
+def hierarchical_search(query, sheets_data, index=None):
+    """Indexed hierarchical search: only rows sharing tokens with the query are scored"""
+    if index is None:
+        index = SheetIndex(sheets_data)
+
+    expanded_queries = expand_search_terms(query)
+    all_matches = []
+
+    for row_id in index.candidates(expanded_queries):
+        match_result = score_row(expanded_queries, index.rows[row_id])
+        if match_result:
+            all_matches.append(match_result)
 
     # Sort by total score and return top 3 matches
     all_matches.sort(key=lambda x: x.total_score, reverse=True)
@@ -325,11 +395,16 @@ class SheetsSearcher:
         self.service = None
         self.sheet_id = None
         self.sheets_data_cache = None
+        self.sheets_index = None
         self.cache_timestamp = None
         self._setup_sheets_api()
 
     def _setup_sheets_api(self):
         """Initialize Google Sheets API with service account credentials"""
+        # Imported here so the search index can be used without the Google client
+        from google.oauth2 import service_account
+        from googleapiclient.discovery import build
+
         try:
             client_email = os.getenv("GOOGLE_CLIENT_EMAIL")
             private_key = os.getenv("GOOGLE_PRIVATE_KEY", "").replace("\\n", "\n")
@@ -425,8 +500,9 @@ class SheetsSearcher:
             ):
                 sheets_data.append(row_dict)
 
-        # Cache the results
+        # Cache the results and index them for searching
         self.sheets_data_cache = sheets_data
+        self.sheets_index = SheetIndex(sheets_data)
         self.cache_timestamp = current_time
 
         return sheets_data
@@ -452,8 +528,8 @@ class SheetsSearcher:
                     "response": "I'm unable to access the targeting database right now. Please try again or contact ernesto@artemistargeting.com for assistance.",
                 }
 
-            # Perform hierarchical search with timeout protection
-            matches = hierarchical_search(query, sheets_data)
+            # Perform indexed hierarchical search
+            matches = hierarchical_search(query, sheets_data, self.sheets_index)
 
             # Process matches and format response
             if matches:
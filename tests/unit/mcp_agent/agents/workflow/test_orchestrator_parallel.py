@@ -0,0 +1,161 @@
+"""Unit tests for concurrent task execution in OrchestratorAgent steps."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from mcp.types import TextContent
+
+from mcp_agent._mcp_local_backup.prompt_message_multipart import PromptMessageMultipart
+from mcp_agent.agents.workflow.orchestrator_agent import OrchestratorAgent
+from mcp_agent.agents.workflow.orchestrator_models import AgentTask, PlanResult, Step
+from mcp_agent.core.request_params import RequestParams
+from mcp_agent.llm.augmented_llm_slow import SlowLLM
+
+
+def make_slow_agent(name: str) -> MagicMock:
+    agent = MagicMock()
+    agent.name = name
+    agent.generate = SlowLLM(name=name).generate
+    return agent
+
+
+def make_step(*agent_names: str) -> Step:
+    return Step(
+        description="Test step",
+        tasks=[AgentTask(description=f"Task for {name}", agent=name) for name in agent_names],
+    )
+
+
+def create_orchestrator(agents, **kwargs) -> OrchestratorAgent:
+    config = MagicMock()
+    config.name = "orchestrator"
+    return OrchestratorAgent(config=config, agents=agents, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_step_tasks_run_concurrently():
+    agents = [make_slow_agent(f"agent{index}") for index in range(3)]
+    orchestrator = create_orchestrator(agents)
+    plan_result = PlanResult(objective="Test objective", step_results=[])
+
+    start = time.perf_counter()
+    step_result = await orchestrator._execute_step(
+        make_step("agent0", "agent1", "agent2"), plan_result, RequestParams()
+    )
+    elapsed = time.perf_counter() - start
+
+    # Each SlowLLM takes 3 seconds: close to the slowest task, not the 9 second sum
+    assert elapsed < 4.5
+    assert [result.agent for result in step_result.task_results] == ["agent0", "agent1", "agent2"]
+    assert all("Task for" in result.result for result in step_result.task_results)
+
+
+@pytest.mark.asyncio
+async def test_step_results_follow_plan_order_with_failures():
+    async def slow_response(messages):
+        await asyncio.sleep(0.2)
+        return PromptMessageMultipart(
+            role="assistant", content=[TextContent(type="text", text="slow response")]
+        )
+
+    slow = MagicMock()
+    slow.name = "slow"
+    slow.generate = slow_response
+
+    failing = MagicMock()
+    failing.name = "failing"
+    failing.generate = AsyncMock(side_effect=RuntimeError("boom"))
+
+    orchestrator = create_orchestrator([slow, failing])
+    plan_result = PlanResult(objective="Test objective", step_results=[])
+
+    step_result = await orchestrator._execute_step(
+        make_step("slow", "missing", "failing"), plan_result, RequestParams()
+    )
+
+    results = step_result.task_results
+    assert [result.agent for result in results] == ["slow", "missing", "failing"]
+    assert results[0].result == "slow response"
+    assert "not found" in results[1].result
+    assert results[2].result == "ERROR: boom"
+
+
+@pytest.mark.asyncio
+async def test_step_task_timeout():
+    orchestrator = create_orchestrator([make_slow_agent("slow")], task_timeout_seconds=0.1)
+    plan_result = PlanResult(objective="Test objective", step_results=[])
+
+    start = time.perf_counter()
+    step_result = await orchestrator._execute_step(make_step("slow"), plan_result, RequestParams())
+
+    assert time.perf_counter() - start < 1
+    assert "timed out" in step_result.task_results[0].result
+
+
+@pytest.mark.asyncio
+async def test_step_concurrency_cap():
+    running = 0
+    peak = 0
+
+    async def tracked_response(messages):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.05)
+        running -= 1
+        return PromptMessageMultipart(
+            role="assistant", content=[TextContent(type="text", text="done")]
+        )
+
+    agents = []
+    for index in range(5):
+        agent = MagicMock()
+        agent.name = f"worker{index}"
+        agent.generate = tracked_response
+        agents.append(agent)
+
+    orchestrator = create_orchestrator(agents, max_parallel_tasks=2)
+    plan_result = PlanResult(objective="Test objective", step_results=[])
+
+    step_result = await orchestrator._execute_step(
+        make_step(*(agent.name for agent in agents)), plan_result, RequestParams()
+    )
+
+    assert len(step_result.task_results) == 5
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_tasks_for_the_same_agent_run_one_at_a_time():
+    running = {"shared": 0, "other": 0}
+    peak = {"shared": 0, "other": 0}
+
+    def tracked_agent(name: str) -> MagicMock:
+        async def tracked_response(messages):
+            running[name] += 1
+            peak[name] = max(peak[name], running[name])
+            await asyncio.sleep(0.1)
+            running[name] -= 1
+            return PromptMessageMultipart(
+                role="assistant", content=[TextContent(type="text", text=name)]
+            )
+
+        agent = MagicMock()
+        agent.name = name
+        agent.generate = tracked_response
+        return agent
+
+    orchestrator = create_orchestrator([tracked_agent("shared"), tracked_agent("other")])
+    plan_result = PlanResult(objective="Test objective", step_results=[])
+
+    start = time.perf_counter()
+    step_result = await orchestrator._execute_step(
+        make_step("shared", "other", "shared"), plan_result, RequestParams()
+    )
+
+    # The shared agent's tasks did not overlap, but ran alongside the other agent's task
+    assert peak == {"shared": 1, "other": 1}
+    assert time.perf_counter() - start < 0.3
+    assert [result.result for result in step_result.task_results] == ["shared", "other", "shared"]
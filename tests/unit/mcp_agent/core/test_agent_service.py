@@ -0,0 +1,113 @@
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+
+import pytest
+
+from mcp_agent.core.agent_service import AgentService
+
+
+class FakeAgentApp:
+    def __init__(self):
+        self.loops = set()
+
+    async def send(self, message, agent_name=None):
+        self.loops.add(asyncio.get_running_loop())
+        await asyncio.sleep(0)
+        return f"{agent_name}: {message}"
+
+
+class FakeFastAgent:
+    name = "fake"
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.entered = 0
+        self.exited = 0
+        self.app = FakeAgentApp()
+
+    @asynccontextmanager
+    async def run(self):
+        self.entered += 1
+        if self.fail:
+            raise ValueError("bad config")
+        try:
+            yield self.app
+        finally:
+            self.exited += 1
+
+
+def test_agents_initialised_once_and_reused_across_requests():
+    fast = FakeFastAgent()
+    with AgentService(fast) as service:
+        responses = [service.send(f"hello {i}", agent_name="artemis") for i in range(5)]
+        assert fast.entered == 1
+        assert fast.exited == 0
+
+    assert responses == [f"artemis: hello {i}" for i in range(5)]
+    assert len(fast.app.loops) == 1
+    assert fast.exited == 1
+    assert not service.is_running
+
+
+def test_concurrent_requests_from_threads_share_one_loop():
+    fast = FakeFastAgent()
+    service = AgentService(fast)
+    service.start()
+    results = []
+
+    def worker(i):
+        results.append(service.send(str(i)))
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    service.stop()
+
+    assert sorted(results) == sorted(f"None: {i}" for i in range(8))
+    assert fast.entered == 1
+    assert len(fast.app.loops) == 1
+
+
+def test_startup_errors_are_raised_from_start():
+    service = AgentService(FakeFastAgent(fail=True))
+    with pytest.raises(ValueError, match="bad config"):
+        service.start()
+    assert not service.is_running
+    with pytest.raises(RuntimeError):
+        service.send("hello")
+
+
+class HangingFastAgent(FakeFastAgent):
+    @asynccontextmanager
+    async def run(self):
+        self.entered += 1
+        try:
+            await asyncio.Event().wait()
+            yield self.app
+        finally:
+            self.exited += 1
+
+
+def test_stop_after_startup_timeout_does_not_hang():
+    fast = HangingFastAgent()
+    service = AgentService(fast)
+    errors = []
+
+    def start():
+        try:
+            service.start(timeout=0.1)
+        except Exception as e:
+            errors.append(e)
+
+    starter = threading.Thread(target=start, daemon=True)
+    starter.start()
+    starter.join(timeout=5)
+
+    assert not starter.is_alive()
+    assert len(errors) == 1 and isinstance(errors[0], TimeoutError)
+    assert fast.exited == 1
+    assert not service.is_running
+    service.stop()
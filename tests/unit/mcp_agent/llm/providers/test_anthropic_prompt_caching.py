@@ -0,0 +1,114 @@
+from anthropic.types import Usage
+
+from mcp_agent.config import AnthropicSettings, Settings
+from mcp_agent.context import Context
+from mcp_agent.core.request_params import RequestParams
+from mcp_agent.llm.providers.augmented_llm_anthropic import (
+    CACHE_CONTROL,
+    AnthropicAugmentedLLM,
+)
+
+
+def make_arguments() -> dict:
+    return {
+        "system": "You are a helpful assistant",
+        "tools": [
+            {"name": "first", "description": "", "input_schema": {"type": "object"}},
+            {"name": "second", "description": "", "input_schema": {"type": "object"}},
+        ],
+        "messages": [
+            {"role": "user", "content": "hello"},
+            {"role": "assistant", "content": [{"type": "text", "text": "hi"}]},
+            {
+                "role": "user",
+                "content": [{"type": "tool_result", "tool_use_id": "1", "content": []}],
+            },
+        ],
+    }
+
+
+def test_auto_mode_places_all_breakpoints():
+    arguments = make_arguments()
+    original = make_arguments()
+    tools, messages = arguments["tools"], arguments["messages"]
+
+    AnthropicAugmentedLLM._apply_cache_control(arguments, "auto")
+
+    assert arguments["system"] == [
+        {"type": "text", "text": "You are a helpful assistant", "cache_control": CACHE_CONTROL}
+    ]
+    assert "cache_control" not in arguments["tools"][0]
+    assert arguments["tools"][1]["cache_control"] == CACHE_CONTROL
+    assert arguments["messages"][-1]["content"][-1]["cache_control"] == CACHE_CONTROL
+    assert arguments["messages"][:-1] == original["messages"][:-1]
+
+    # The shared tool list and the conversation are left untouched
+    assert tools == original["tools"]
+    assert messages == original["messages"]
+
+
+def test_string_message_content_is_converted_to_block():
+    arguments = {"messages": [{"role": "user", "content": "hello"}]}
+
+    AnthropicAugmentedLLM._apply_cache_control(arguments, "auto")
+
+    assert arguments["messages"][0]["content"] == [
+        {"type": "text", "text": "hello", "cache_control": CACHE_CONTROL}
+    ]
+
+
+def test_prompt_mode_skips_history():
+    arguments = make_arguments()
+
+    AnthropicAugmentedLLM._apply_cache_control(arguments, "prompt")
+
+    assert arguments["system"][0]["cache_control"] == CACHE_CONTROL
+    assert arguments["tools"][-1]["cache_control"] == CACHE_CONTROL
+    assert arguments["messages"] == make_arguments()["messages"]
+
+
+def test_off_mode_leaves_arguments_unchanged():
+    arguments = make_arguments()
+
+    AnthropicAugmentedLLM._apply_cache_control(arguments, "off")
+
+    assert arguments == make_arguments()
+
+
+def test_cache_mode_from_config():
+    context = Context(config=Settings(anthropic=AnthropicSettings(cache_mode="prompt")))
+    llm = AnthropicAugmentedLLM(context=context)
+    assert llm._cache_mode() == "prompt"
+
+    # Off unless configured, as cache writes cost more than regular input tokens
+    assert AnthropicAugmentedLLM(context=Context(config=Settings()))._cache_mode() == "off"
+
+
+def test_cache_mode_from_request_params():
+    context = Context(config=Settings(anthropic=AnthropicSettings(cache_mode="prompt")))
+    llm = AnthropicAugmentedLLM(context=context)
+
+    assert llm._cache_mode(RequestParams(cache_mode="auto")) == "auto"
+    assert llm._cache_mode(RequestParams(cache_mode="off")) == "off"
+    assert llm._cache_mode(RequestParams()) == "prompt"
+    assert "cache_mode" in AnthropicAugmentedLLM.ANTHROPIC_EXCLUDE_FIELDS
+
+
+def test_usage_reports_cache_tokens(monkeypatch):
+    llm = AnthropicAugmentedLLM(context=Context(config=Settings()))
+    logged = {}
+    monkeypatch.setattr(llm.logger, "debug", lambda message, data=None: logged.update(data))
+
+    llm._log_usage(
+        Usage(
+            input_tokens=100,
+            output_tokens=20,
+            cache_creation_input_tokens=0,
+            cache_read_input_tokens=900,
+        ),
+        model="claude",
+    )
+
+    assert logged["cache_read_input_tokens"] == 900
+    assert logged["cache_creation_input_tokens"] == 0
+    assert logged["cache_hit_rate"] == 0.9
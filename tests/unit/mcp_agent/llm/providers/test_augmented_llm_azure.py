@@ -41,14 +41,14 @@ def test_openai_client_with_base_url_only():
     llm = AzureOpenAIAugmentedLLM(context=ctx)
     client = llm._openai_client()
     assert hasattr(client, "chat")
-    # Should be AzureOpenAI instance
+    # Should be AsyncAzureOpenAI instance
 
 
 @pytest.mark.asyncio
 async def test_openai_client_with_default_azure_credential(monkeypatch):
     """
     Test AzureOpenAIAugmentedLLM with use_default_azure_credential: True.
-    Mocks DefaultAzureCredential and AzureOpenAI to ensure correct integration.
+    Mocks DefaultAzureCredential and AsyncAzureOpenAI to ensure correct integration.
     """
 
     class DummyToken:
@@ -80,7 +80,7 @@ async def test_openai_client_with_default_azure_credential(monkeypatch):
                 )
             )
 
-    monkeypatch.setattr(azure_mod, "AzureOpenAI", DummyAzureOpenAI)
+    monkeypatch.setattr(azure_mod, "AsyncAzureOpenAI", DummyAzureOpenAI)
 
     class DACfg:
         def __init__(self):
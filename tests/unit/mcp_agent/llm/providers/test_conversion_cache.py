@@ -0,0 +1,92 @@
+"""Unit tests for reusing provider conversions of history messages."""
+
+from mcp.types import BlobResourceContents, EmbeddedResource, ImageContent, TextContent
+
+from mcp_agent._mcp_local_backup.prompt_message_multipart import PromptMessageMultipart
+from mcp_agent.llm.providers.google_converter import GoogleConverter
+from mcp_agent.llm.providers.multipart_converter_anthropic import AnthropicConverter
+from mcp_agent.llm.providers.multipart_converter_openai import OpenAIConverter
+
+
+def create_message() -> PromptMessageMultipart:
+    return PromptMessageMultipart(
+        role="user",
+        content=[
+            TextContent(type="text", text="What is in this image?"),
+            ImageContent(type="image", data="aW1hZ2U=", mimeType="image/png"),
+        ],
+    )
+
+
+def test_converted_messages_are_reused():
+    message = create_message()
+
+    first = GoogleConverter().convert_to_google_content([message])
+    second = GoogleConverter().convert_to_google_content([message])
+    assert first[0] is second[0]
+
+    anthropic = AnthropicConverter.convert_to_anthropic(message)
+    assert AnthropicConverter.convert_to_anthropic(message) is anthropic
+    assert OpenAIConverter.convert_to_openai(message) is OpenAIConverter.convert_to_openai(message)
+
+
+def test_formats_and_options_are_cached_separately():
+    message = create_message()
+
+    concatenated = OpenAIConverter.convert_to_openai(message, concatenate_text_blocks=True)
+    separate = OpenAIConverter.convert_to_openai(message)
+
+    assert concatenated is not separate
+    assert OpenAIConverter.convert_to_openai(message, True) is concatenated
+
+
+def test_changed_content_is_converted_again():
+    message = create_message()
+    before = AnthropicConverter.convert_to_anthropic(message)
+
+    message.content.append(TextContent(type="text", text="And this one?"))
+    after = AnthropicConverter.convert_to_anthropic(message)
+    assert after is not before
+    assert len(after["content"]) == 3
+
+    message.content[0] = TextContent(type="text", text="Describe the image.")
+    replaced = AnthropicConverter.convert_to_anthropic(message)
+    assert replaced["content"][0]["text"] == "Describe the image."
+
+
+def test_blocks_edited_in_place_are_converted_again():
+    message = create_message()
+    before = AnthropicConverter.convert_to_anthropic(message)
+
+    message.content[0].text = "Describe the image."
+    after = AnthropicConverter.convert_to_anthropic(message)
+
+    assert after is not before
+    assert after["content"][0]["text"] == "Describe the image."
+    assert before["content"][0]["text"] == "What is in this image?"
+
+
+def test_nested_resource_edits_are_converted_again():
+    resource = BlobResourceContents(
+        uri="file:///report.pdf", mimeType="application/pdf", blob="cmVwb3J0"
+    )
+    message = PromptMessageMultipart(
+        role="user", content=[EmbeddedResource(type="resource", resource=resource)]
+    )
+    before = AnthropicConverter.convert_to_anthropic(message)
+
+    resource.blob = "dXBkYXRlZA=="
+    after = AnthropicConverter.convert_to_anthropic(message)
+
+    assert after is not before
+    assert after["content"][0]["source"]["data"] == "dXBkYXRlZA=="
+
+
+def test_copied_messages_share_conversions_until_changed():
+    message = create_message()
+    converted = GoogleConverter().convert_to_google_content([message])[0]
+
+    copy = message.model_copy(update={"role": "assistant"})
+    assert GoogleConverter().convert_to_google_content([copy])[0].role == "model"
+    assert GoogleConverter().convert_to_google_content([message])[0].role == "user"
+    assert converted.role == "user"
@@ -0,0 +1,136 @@
+"""Unit tests for the exact-match LLM completion cache."""
+
+import time
+
+import pytest
+from anthropic.types import Message
+
+from mcp_agent.config import AnthropicSettings, LLMCompletionCacheSettings, Settings
+from mcp_agent.context import Context
+from mcp_agent.executor.executor import AsyncioExecutor
+from mcp_agent.llm.completion_cache import (
+    MemoryCompletionCache,
+    SqliteCompletionCache,
+    completion_key,
+    is_deterministic,
+)
+from mcp_agent.llm.providers.augmented_llm_anthropic import AnthropicAugmentedLLM
+
+
+def message(text: str) -> Message:
+    return Message.model_validate(
+        {
+            "id": "msg_1",
+            "type": "message",
+            "role": "assistant",
+            "model": "claude-test",
+            "content": [{"type": "text", "text": text}],
+            "stop_reason": "end_turn",
+            "usage": {"input_tokens": 1, "output_tokens": 1},
+        }
+    )
+
+
+def test_key_ignores_argument_order():
+    first = {"model": "m", "temperature": 0, "messages": [{"role": "user", "content": "hi"}]}
+    second = {"messages": [{"content": "hi", "role": "user"}], "temperature": 0, "model": "m"}
+
+    assert completion_key("anthropic", first) == completion_key("anthropic", second)
+    assert completion_key("anthropic", first) != completion_key("openai", first)
+    assert completion_key("anthropic", first) != completion_key("anthropic", {**first, "top_k": 1})
+
+
+def test_only_temperature_zero_is_deterministic():
+    assert is_deterministic({"temperature": 0})
+    assert not is_deterministic({"temperature": 0.7})
+    assert not is_deterministic({"model": "m"})
+
+
+def test_memory_cache_evicts_least_recently_used_and_expires():
+    cache = MemoryCompletionCache(max_entries=2, ttl_seconds=60)
+    cache.put("a", message("a"))
+    cache.put("b", message("b"))
+    assert cache.get("a").content[0].text == "a"
+    cache.put("c", message("c"))
+
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+    cache._entries["a"] = (time.time() - 61, message("a"))
+    assert cache.get("a") is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_sqlite_cache_persists_completions_across_instances(tmp_path):
+    path = tmp_path / "cache" / "completions.sqlite"
+    cache = SqliteCompletionCache(path, max_entries=2)
+    cache.put("a", message("a"))
+    cache.put("b", message("b"))
+    cache.get("a")
+    cache.put("c", message("c"))
+    cache.close()
+
+    reopened = SqliteCompletionCache(path, max_entries=2)
+    cached = reopened.get("a")
+    assert isinstance(cached, Message)
+    assert cached.content[0].text == "a"
+    # b was the least recently used entry
+    assert reopened.get("b") is None
+    assert len(reopened) == 2
+
+
+def test_sqlite_cache_expires_entries(tmp_path):
+    cache = SqliteCompletionCache(tmp_path / "completions.sqlite", ttl_seconds=60)
+    cache.put("a", message("a"))
+    cache._db.execute("UPDATE completions SET created = ?", (time.time() - 61,))
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def create_llm(**cache_settings) -> AnthropicAugmentedLLM:
+    config = Settings(
+        anthropic=AnthropicSettings(api_key="test-key"),
+        completion_cache=LLMCompletionCacheSettings(enabled=True, **cache_settings),
+    )
+    context = Context(config=config)
+    context.executor = AsyncioExecutor()
+    return AnthropicAugmentedLLM(context=context)
+
+
+@pytest.mark.asyncio
+async def test_identical_deterministic_requests_are_sent_once():
+    llm = create_llm()
+    sent = []
+
+    async def completion():
+        sent.append(1)
+        return message(f"response {len(sent)}")
+
+    arguments = {"model": "claude-test", "temperature": 0, "messages": []}
+    first = await llm._send_request(completion, payload=arguments)
+    second = await llm._send_request(completion, payload=dict(arguments))
+    assert first.content[0].text == second.content[0].text == "response 1"
+
+    # Not deterministic: always sent
+    sampled = {**arguments, "temperature": 1}
+    await llm._send_request(completion, payload=sampled)
+    await llm._send_request(completion, payload=sampled)
+    assert len(sent) == 3
+
+
+@pytest.mark.asyncio
+async def test_cache_can_include_sampled_requests(tmp_path):
+    llm = create_llm(
+        deterministic_only=False, backend="sqlite", path=str(tmp_path / "completions.sqlite")
+    )
+    sent = []
+
+    async def completion():
+        sent.append(1)
+        return message("cached")
+
+    arguments = {"model": "claude-test", "messages": []}
+    await llm._send_request(completion, payload=arguments)
+    await llm._send_request(completion, payload=arguments)
+    assert len(sent) == 1
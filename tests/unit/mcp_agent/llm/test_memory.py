@@ -0,0 +1,119 @@
+"""Unit tests for token-budgeted conversation memory."""
+
+from google.genai import types
+
+from mcp_agent.config import AnthropicSettings, Settings
+from mcp_agent.context import Context
+from mcp_agent.core.request_params import RequestParams
+from mcp_agent.llm.memory import SimpleMemory, TokenBudgetMemory, starts_turn
+from mcp_agent.llm.providers.augmented_llm_anthropic import AnthropicAugmentedLLM
+
+
+def user(text: str) -> dict:
+    return {"role": "user", "content": text}
+
+
+def assistant(text: str) -> dict:
+    return {"role": "assistant", "content": text}
+
+
+def tool_use(tool_id: str) -> dict:
+    return {"role": "assistant", "content": [{"type": "tool_use", "id": tool_id, "input": {}}]}
+
+
+def tool_result(tool_id: str) -> dict:
+    return {"role": "user", "content": [{"type": "tool_result", "tool_use_id": tool_id}]}
+
+
+def create_memory(max_tokens: int) -> TokenBudgetMemory:
+    # Every message counts as 10 tokens
+    return TokenBudgetMemory(max_tokens, estimate=lambda message: 10)
+
+
+def test_oldest_turns_are_dropped_to_stay_within_budget():
+    memory = create_memory(max_tokens=40)
+    memory.extend([user("one"), assistant("1"), user("two"), assistant("2")])
+    assert memory.tokens == 40
+
+    memory.extend([user("three"), assistant("3")])
+
+    assert memory.get() == [user("two"), assistant("2"), user("three"), assistant("3")]
+    assert memory.tokens == 40
+
+
+def test_tool_calls_are_kept_with_their_results():
+    memory = create_memory(max_tokens=50)
+    memory.extend([user("one"), tool_use("a"), tool_result("a"), assistant("1")])
+    memory.extend([user("two"), tool_use("b"), tool_result("b"), assistant("2")])
+
+    # The first turn is dropped whole, not just up to the tool result
+    assert memory.get() == [user("two"), tool_use("b"), tool_result("b"), assistant("2")]
+
+
+def test_prompt_messages_and_latest_turn_are_always_kept():
+    memory = create_memory(max_tokens=30)
+    memory.extend([user("template"), assistant("ok")], is_prompt=True)
+    memory.extend([user("one"), assistant("1")])
+    memory.extend([user("two"), tool_use("a"), tool_result("a"), assistant("2")])
+
+    assert memory.get() == [
+        user("template"),
+        assistant("ok"),
+        user("two"),
+        tool_use("a"),
+        tool_result("a"),
+        assistant("2"),
+    ]
+    assert memory.get(include_completion_history=False) == [user("template"), assistant("ok")]
+
+
+def test_set_and_clear_reset_the_running_estimate():
+    memory = create_memory(max_tokens=100)
+    memory.extend([user("one"), assistant("1")])
+    memory.set([user("two")])
+    assert memory.tokens == 10
+
+    memory.clear()
+    assert memory.tokens == 0
+
+
+def test_google_function_responses_do_not_start_a_turn():
+    response = types.Content(
+        role="user",
+        parts=[types.Part.from_function_response(name="search", response={"ok": True})],
+    )
+
+    assert not starts_turn(response)
+    assert starts_turn(types.Content(role="user", parts=[types.Part.from_text(text="hi")]))
+    assert not starts_turn({"role": "tool", "content": "result"})
+
+
+def test_llm_uses_token_budgeted_memory_when_configured():
+    context = Context(config=Settings(anthropic=AnthropicSettings(api_key="test-key")))
+
+    bounded = AnthropicAugmentedLLM(
+        context=context, request_params=RequestParams(max_history_tokens=1000)
+    )
+    assert isinstance(bounded.history, TokenBudgetMemory)
+    assert bounded.history.max_tokens == 1000
+
+    unbounded = AnthropicAugmentedLLM(context=context)
+    assert type(unbounded.history) is SimpleMemory
+
+
+def test_set_only_estimates_new_messages():
+    estimated = []
+
+    def estimate(message):
+        estimated.append(message)
+        return 10
+
+    memory = TokenBudgetMemory(max_tokens=1000, estimate=estimate)
+    history = [user("one"), assistant("1")]
+    memory.set(history)
+
+    # Providers set the whole conversation after each turn
+    memory.set(history + [user("two"), assistant("2")])
+
+    assert estimated == [user("one"), assistant("1"), user("two"), assistant("2")]
+    assert memory.tokens == 40
@@ -0,0 +1,58 @@
+import pytest
+from openai import AsyncOpenAI
+
+from mcp_agent.config import OpenAISettings, Settings
+from mcp_agent.context import Context
+from mcp_agent.llm.provider_clients import ProviderClients
+from mcp_agent.llm.providers.augmented_llm_openai import OpenAIAugmentedLLM
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def test_client_created_once_per_key():
+    clients = ProviderClients()
+    created = []
+
+    def factory():
+        created.append(FakeClient())
+        return created[-1]
+
+    first = clients.get(("anthropic", "key", None), factory)
+    assert clients.get(("anthropic", "key", None), factory) is first
+    assert clients.get(("anthropic", "other-key", None), factory) is not first
+    assert len(created) == 2
+    assert len(clients) == 2
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_all_clients():
+    clients = ProviderClients()
+    first = clients.get(("a",), FakeClient)
+    second = clients.get(("b",), FakeClient)
+
+    await clients.aclose()
+
+    assert first.closed and second.closed
+    assert len(clients) == 0
+
+
+@pytest.mark.asyncio
+async def test_openai_llms_share_async_client():
+    context = Context(config=Settings(openai=OpenAISettings(api_key="test-key")))
+    first = OpenAIAugmentedLLM(context=context)
+    second = OpenAIAugmentedLLM(context=context)
+
+    client = first._openai_client()
+
+    assert isinstance(client, AsyncOpenAI)
+    assert second._openai_client() is client
+    assert len(context.provider_clients) == 1
+
+    await context.provider_clients.aclose()
+    assert client.is_closed()
@@ -0,0 +1,36 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from mcp.types import ListToolsResult, Tool
+
+from mcp_agent.llm.augmented_llm_passthrough import PassthroughLLM
+
+
+def make_tool_list(*names: str) -> ListToolsResult:
+    return ListToolsResult(
+        tools=[Tool(name=name, inputSchema={"type": "object"}) for name in names]
+    )
+
+
+@pytest.mark.asyncio
+async def test_provider_tools_converted_once_per_snapshot():
+    llm = PassthroughLLM()
+    snapshot = make_tool_list("alpha", "beta")
+    llm.aggregator.list_tools = AsyncMock(return_value=snapshot)
+    conversions = []
+
+    def convert(tools):
+        conversions.append(tools)
+        return [tool.name for tool in tools]
+
+    for _ in range(5):
+        tool_list, converted = await llm._provider_tools(convert)
+        assert tool_list is snapshot
+        assert converted == ["alpha", "beta"]
+    assert len(conversions) == 1
+
+    # A new snapshot (tool list version changed) is converted again
+    llm.aggregator.list_tools = AsyncMock(return_value=make_tool_list("gamma"))
+    _, converted = await llm._provider_tools(convert)
+    assert converted == ["gamma"]
+    assert len(conversions) == 2
@@ -0,0 +1,121 @@
+"""Unit tests for client-side LLM provider rate limits."""
+
+import asyncio
+import time
+
+import pytest
+
+from mcp_agent.config import LLMRateLimitSettings, OpenAISettings, Settings
+from mcp_agent.context import Context
+from mcp_agent.core.request_params import RequestParams
+from mcp_agent.executor.executor import AsyncioExecutor
+from mcp_agent.llm.providers.augmented_llm_openai import OpenAIAugmentedLLM
+from mcp_agent.llm.rate_limiter import RateLimiter, rate_limit_settings
+from mcp_agent.llm.token_estimator import estimate_tokens
+
+
+def create_limiter(**settings) -> RateLimiter:
+    return RateLimiter("openai.gpt-4.1", LLMRateLimitSettings(**settings))
+
+
+@pytest.mark.asyncio
+async def test_tokens_per_minute_delays_requests_until_refilled():
+    # 100 tokens per second
+    limiter = create_limiter(tokens_per_minute=6000)
+
+    assert await limiter.acquire(tokens=6000) == 0
+    waited = await limiter.acquire(tokens=10)
+
+    assert 0.08 <= waited < 0.3
+    stats = limiter.stats()
+    assert (stats.requests, stats.queued, stats.tokens) == (2, 1, 6010)
+    assert stats.wait_seconds_max == waited
+
+
+@pytest.mark.asyncio
+async def test_requests_per_minute_limits_request_count():
+    limiter = create_limiter(requests_per_minute=600)
+    start = time.monotonic()
+
+    await asyncio.gather(*(limiter.acquire() for _ in range(602)))
+
+    # Two requests beyond the burst, at 10 per second
+    assert 0.15 <= time.monotonic() - start < 0.5
+    assert limiter.stats().queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_higher_priority_requests_overtake_queued_ones():
+    limiter = create_limiter(requests_per_minute=600)
+    for _ in range(600):
+        await limiter.acquire()
+    order = []
+
+    async def request(name, priority):
+        await limiter.acquire(priority=priority)
+        order.append(name)
+
+    batch = [asyncio.create_task(request(f"batch-{n}", -1)) for n in range(3)]
+    await asyncio.sleep(0)
+    interactive = asyncio.create_task(request("interactive", 1))
+    await asyncio.gather(*batch, interactive)
+
+    assert order == ["interactive", "batch-0", "batch-1", "batch-2"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_request_leaves_the_queue():
+    limiter = create_limiter(requests_per_minute=600)
+    for _ in range(600):
+        await limiter.acquire()
+
+    first = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    second = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    first.cancel()
+
+    await asyncio.wait_for(second, timeout=1)
+    assert limiter.stats().queue_depth == 0
+
+
+def test_model_limits_take_precedence_over_provider_limits():
+    config = Settings(
+        rate_limits={
+            "anthropic": {"requests_per_minute": 50},
+            "anthropic.claude-opus-4-0": {"requests_per_minute": 5},
+        }
+    )
+
+    assert rate_limit_settings(config, "anthropic", "claude-opus-4-0").requests_per_minute == 5
+    assert rate_limit_settings(config, "anthropic", "claude-haiku").requests_per_minute == 50
+    assert rate_limit_settings(config, "openai", "gpt-4.1") is None
+
+
+def test_estimate_includes_output_tokens():
+    assert estimate_tokens({"messages": "x" * 400}, max_output_tokens=100) > 200
+    assert estimate_tokens({}) == 0
+
+
+@pytest.mark.asyncio
+async def test_llms_share_a_limiter_per_provider_key_and_model():
+    config = Settings(
+        openai=OpenAISettings(api_key="test-key"),
+        rate_limits={"openai": {"requests_per_minute": 100}},
+    )
+    context = Context(config=config)
+    context.executor = AsyncioExecutor()
+    first = OpenAIAugmentedLLM(context=context, model="gpt-4.1")
+    second = OpenAIAugmentedLLM(context=context, model="gpt-4.1")
+
+    async def completion():
+        return "done"
+
+    params = RequestParams(model="gpt-4.1", maxTokens=10, priority=1)
+    assert await first._send_request(completion, params, {"messages": []}) == "done"
+    assert await second._send_request(completion, params, {"messages": []}) == "done"
+    await second._send_request(completion, RequestParams(model="gpt-4.1-mini"))
+
+    stats = context.rate_limiters.stats()
+    assert stats["openai.gpt-4.1"].requests == 2
+    assert stats["openai.gpt-4.1-mini"].requests == 1
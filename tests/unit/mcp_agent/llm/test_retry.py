@@ -0,0 +1,217 @@
+"""Unit tests for retrying LLM provider requests, against a local fake HTTP server."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+from anthropic import AsyncAnthropic, BadRequestError
+from openai import AsyncOpenAI
+
+from mcp_agent.config import LLMRetrySettings, OpenAISettings, Settings
+from mcp_agent.context import Context
+from mcp_agent.executor.executor import AsyncioExecutor, ExecutorConfig
+from mcp_agent.llm.providers.augmented_llm_openai import OpenAIAugmentedLLM
+from mcp_agent.llm.retry import call_with_retry, retry_after, retry_delay
+
+ANTHROPIC_MESSAGE = {
+    "id": "msg_1",
+    "type": "message",
+    "role": "assistant",
+    "model": "claude-test",
+    "content": [{"type": "text", "text": "hello"}],
+    "stop_reason": "end_turn",
+    "usage": {"input_tokens": 1, "output_tokens": 1},
+}
+
+OPENAI_COMPLETION = {
+    "id": "chatcmpl-1",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "gpt-test",
+    "choices": [
+        {
+            "index": 0,
+            "message": {"role": "assistant", "content": "hello"},
+            "finish_reason": "stop",
+        }
+    ],
+}
+
+
+class FakeProvider(ThreadingHTTPServer):
+    """Answers POST requests with a scripted list of (status, headers, body, delay)."""
+
+    def __init__(self, responses):
+        super().__init__(("127.0.0.1", 0), FakeProviderHandler)
+        self.responses = list(responses)
+        self.requests = []
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class FakeProviderHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.requests.append(json.loads(body))
+        status, headers, payload, delay = self.server.responses.pop(0)
+        time.sleep(delay)
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def fake_provider():
+    servers = []
+
+    def start(*responses):
+        server = FakeProvider(responses)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def error(status, error_type, headers=None, delay=0.0):
+    return status, headers or {}, {"type": "error", "error": {"type": error_type}}, delay
+
+
+def settings(**overrides) -> LLMRetrySettings:
+    return LLMRetrySettings(**{"initial_delay_seconds": 0.01, **overrides})
+
+
+def anthropic_attempt(server):
+    client = AsyncAnthropic(api_key="test", base_url=server.base_url, max_retries=0)
+    return lambda: client.messages.create(
+        model="claude-test", max_tokens=10, messages=[{"role": "user", "content": "hi"}]
+    )
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_request_is_retried_after_retry_after(fake_provider):
+    server = fake_provider(
+        error(429, "rate_limit_error", {"retry-after": "0.2"}),
+        error(529, "overloaded_error"),
+        (200, {}, ANTHROPIC_MESSAGE, 0),
+    )
+
+    start = time.monotonic()
+    message = await call_with_retry(anthropic_attempt(server), settings(), name="anthropic")
+
+    assert message.content[0].text == "hello"
+    assert time.monotonic() - start >= 0.2
+    # Every attempt re-sent the same request
+    assert len(server.requests) == 3
+    assert server.requests[0] == server.requests[2]
+
+
+@pytest.mark.asyncio
+async def test_openai_server_error_is_retried(fake_provider):
+    server = fake_provider(
+        (503, {"retry-after-ms": "10"}, {"error": {"message": "unavailable"}}, 0),
+        (200, {}, OPENAI_COMPLETION, 0),
+    )
+    client = AsyncOpenAI(api_key="test", base_url=server.base_url, max_retries=0)
+
+    completion = await call_with_retry(
+        lambda: client.chat.completions.create(
+            model="gpt-test", messages=[{"role": "user", "content": "hi"}]
+        ),
+        settings(),
+    )
+
+    assert completion.choices[0].message.content == "hello"
+    assert len(server.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_request_errors_are_not_retried(fake_provider):
+    server = fake_provider(error(400, "invalid_request_error"))
+
+    with pytest.raises(BadRequestError):
+        await call_with_retry(anthropic_attempt(server), settings())
+    assert len(server.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_max_attempts(fake_provider):
+    server = fake_provider(*[error(529, "overloaded_error")] * 3)
+
+    with pytest.raises(Exception) as exc_info:
+        await call_with_retry(anthropic_attempt(server), settings(max_attempts=3))
+    assert getattr(exc_info.value, "status_code", None) == 529
+    assert len(server.requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_deadline_covers_all_attempts(fake_provider):
+    server = fake_provider(
+        error(500, "api_error", delay=0.1),
+        (200, {}, ANTHROPIC_MESSAGE, 1.0),
+    )
+
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        await call_with_retry(anthropic_attempt(server), settings(deadline_seconds=0.3))
+    assert time.monotonic() - start < 0.6
+
+
+@pytest.mark.asyncio
+async def test_retry_after_beyond_max_delay_is_not_waited_for(fake_provider):
+    server = fake_provider(error(429, "rate_limit_error", {"retry-after": "120"}))
+
+    with pytest.raises(Exception):
+        await call_with_retry(anthropic_attempt(server), settings(max_delay_seconds=10))
+    assert len(server.requests) == 1
+
+
+def test_backoff_uses_full_jitter_up_to_max_delay():
+    policy = LLMRetrySettings(initial_delay_seconds=1, max_delay_seconds=5)
+    no_header = ConnectionError()
+
+    delays = [retry_delay(3, policy, no_header) for _ in range(50)]
+    assert all(0 <= delay <= 4 for delay in delays)
+    assert len(set(delays)) > 1
+    assert all(retry_delay(10, policy, no_header) <= 5 for _ in range(50))
+
+
+def test_retry_after_accepts_http_dates():
+    class StatusError(Exception):
+        def __init__(self, headers):
+            self.response = httpx.Response(429, headers=headers)
+
+    now = 1_700_000_000
+    date = "Tue, 14 Nov 2023 22:13:30 GMT"  # now + 10s
+    assert retry_after(StatusError({"retry-after": date}), now=now) == 10
+    assert retry_after(StatusError({"retry-after": "soon"})) is None
+    assert retry_after(ConnectionError()) is None
+
+
+def test_executor_retry_policy_overrides_config():
+    config = Settings(openai=OpenAISettings(api_key="test"), llm_retry={"max_attempts": 2})
+    context = Context(config=config)
+    context.executor = AsyncioExecutor()
+    assert OpenAIAugmentedLLM(context=context)._retry_settings().max_attempts == 2
+
+    context.executor = AsyncioExecutor(
+        config=ExecutorConfig(retry_policy={"max_attempts": 6, "deadline_seconds": 60})
+    )
+    retry_settings = OpenAIAugmentedLLM(context=context)._retry_settings()
+    assert (retry_settings.max_attempts, retry_settings.deadline_seconds) == (6, 60)
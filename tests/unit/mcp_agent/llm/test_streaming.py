@@ -0,0 +1,218 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from mcp.types import ListToolsResult
+from openai.types.chat import ChatCompletionChunk
+from openai.types.completion_usage import CompletionUsage
+
+from mcp_agent._mcp_local_backup.prompt_message_multipart import PromptMessageMultipart
+from mcp_agent.config import LLMRetrySettings, OpenAISettings, Settings
+from mcp_agent.context import Context
+from mcp_agent.core.prompt import Prompt
+from mcp_agent.executor.executor import AsyncioExecutor
+from mcp_agent.llm.providers.augmented_llm_openai import OpenAIAugmentedLLM
+from mcp_agent.llm.streaming import CompletionStream
+
+
+def make_chunk(
+    content: str | None = None,
+    tool_calls: list | None = None,
+    finish_reason: str | None = None,
+    usage: CompletionUsage | None = None,
+) -> ChatCompletionChunk:
+    choices = []
+    if content is not None or tool_calls is not None or finish_reason is not None:
+        choices.append(
+            {
+                "index": 0,
+                "delta": {"content": content, "tool_calls": tool_calls},
+                "finish_reason": finish_reason,
+            }
+        )
+    return ChatCompletionChunk(
+        id="chunk",
+        created=0,
+        model="test-model",
+        object="chat.completion.chunk",
+        choices=choices,
+        usage=usage,
+    )
+
+
+def create_llm(chunks: list[ChatCompletionChunk]) -> tuple[OpenAIAugmentedLLM, dict]:
+    context = Context(
+        config=Settings(openai=OpenAISettings(api_key="test-key")), executor=AsyncioExecutor()
+    )
+    llm = OpenAIAugmentedLLM(context=context, instruction="You are a helpful assistant")
+    llm.aggregator.list_tools = AsyncMock(return_value=ListToolsResult(tools=[]))
+    requests = {}
+
+    async def create(**kwargs):
+        requests.update(kwargs)
+
+        async def stream():
+            for chunk in chunks:
+                yield chunk
+
+        return stream()
+
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    llm._openai_client = lambda: client
+    return llm, requests
+
+
+def test_completion_stream_metrics():
+    received = []
+    first_tokens = []
+    stream = CompletionStream(on_text=received.append, on_first_token=first_tokens.append)
+
+    stream.text("")
+    assert stream.ttft is None
+
+    stream.text("Hello")
+    stream.text(" world")
+    stream.finish(output_tokens=2)
+
+    assert received == ["Hello", " world"]
+    assert first_tokens == [stream]
+    assert stream.content == "Hello world"
+    assert stream.ttft is not None and stream.ttft >= 0
+    assert stream.tokens_per_second is not None and stream.tokens_per_second > 0
+
+
+@pytest.mark.asyncio
+async def test_openai_stream_assembles_tool_calls():
+    llm, requests = create_llm(
+        [
+            make_chunk(content="Checking"),
+            make_chunk(
+                tool_calls=[
+                    {
+                        "index": 0,
+                        "id": "call_1",
+                        "type": "function",
+                        "function": {"name": "weather-forecast", "arguments": '{"ci'},
+                    }
+                ]
+            ),
+            make_chunk(tool_calls=[{"index": 0, "function": {"arguments": 'ty": "Paris"}'}}]),
+            make_chunk(
+                tool_calls=[
+                    {
+                        "index": 1,
+                        "id": "call_2",
+                        "type": "function",
+                        "function": {"name": "time-now", "arguments": "{}"},
+                    }
+                ]
+            ),
+            make_chunk(finish_reason="tool_calls"),
+            make_chunk(
+                usage=CompletionUsage(prompt_tokens=5, completion_tokens=12, total_tokens=17)
+            ),
+        ]
+    )
+
+    completion = await llm._openai_stream({"model": "test-model", "messages": []})
+
+    assert requests["stream"] is True
+    choice = completion.choices[0]
+    assert choice.finish_reason == "tool_calls"
+    assert choice.message.content == "Checking"
+    assert [
+        (call.id, call.function.name, call.function.arguments)
+        for call in choice.message.tool_calls
+    ] == [
+        ("call_1", "weather-forecast", '{"city": "Paris"}'),
+        ("call_2", "time-now", "{}"),
+    ]
+    assert completion.usage.completion_tokens == 12
+
+
+@pytest.mark.asyncio
+async def test_generate_stream_yields_deltas_then_final_message():
+    llm, requests = create_llm(
+        [
+            make_chunk(content="Hel"),
+            make_chunk(content="lo"),
+            make_chunk(finish_reason="stop"),
+        ]
+    )
+
+    items = [item async for item in llm.generate_stream([Prompt.user("hi")])]
+
+    assert items[:-1] == ["Hel", "lo"]
+    assert isinstance(items[-1], PromptMessageMultipart)
+    assert items[-1].first_text() == "Hello"
+    assert "stream" not in llm.default_request_params.model_dump(exclude_unset=True)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_streams_on_one_llm_get_their_own_deltas():
+    llm, _ = create_llm([])
+
+    async def create(**kwargs):
+        reply = kwargs["messages"][-1]["content"].upper()
+
+        async def stream():
+            for char in reply:
+                await asyncio.sleep(0.01)
+                yield make_chunk(content=char)
+            yield make_chunk(finish_reason="stop")
+
+        return stream()
+
+    llm._openai_client().chat.completions.create = create
+
+    async def consume(text):
+        return [item async for item in llm.generate_stream([Prompt.user(text)])]
+
+    first, second = await asyncio.gather(consume("abc"), consume("xyz"))
+
+    assert first[:-1] == ["A", "B", "C"]
+    assert second[:-1] == ["X", "Y", "Z"]
+
+
+@pytest.mark.asyncio
+async def test_retried_stream_does_not_repeat_deltas():
+    llm, _ = create_llm([])
+    llm.context.config.llm_retry = LLMRetrySettings(initial_delay_seconds=0)
+    attempts = []
+
+    async def create(**kwargs):
+        attempts.append(kwargs)
+
+        async def stream():
+            yield make_chunk(content="Hel")
+            if len(attempts) == 1:
+                raise ConnectionError("connection dropped")
+            yield make_chunk(content="lo")
+            yield make_chunk(finish_reason="stop")
+
+        return stream()
+
+    llm._openai_client().chat.completions.create = create
+
+    items = [item async for item in llm.generate_stream([Prompt.user("hi")])]
+
+    assert len(attempts) == 2
+    assert items[:-1] == ["Hel", "lo"]
+    assert items[-1].first_text() == "Hello"
+
+
+@pytest.mark.asyncio
+async def test_generate_without_stream_does_not_stream():
+    llm, requests = create_llm([])
+    completion = SimpleNamespace(choices=[])
+
+    async def create(**kwargs):
+        requests.update(kwargs)
+        return completion
+
+    llm._openai_client().chat.completions.create = create
+
+    await llm.generate([Prompt.user("hi")])
+
+    assert "stream" not in requests
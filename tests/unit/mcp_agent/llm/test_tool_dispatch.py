@@ -0,0 +1,107 @@
+import asyncio
+import time
+
+import pytest
+from mcp.types import CallToolRequest, CallToolRequestParams, CallToolResult, TextContent
+
+from mcp_agent.core.request_params import RequestParams
+from mcp_agent.llm.augmented_llm_passthrough import PassthroughLLM
+
+
+class SlowToolLLM(PassthroughLLM):
+    """Records hook calls and tracks how many tools run at the same time"""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.hook_calls: list[tuple[str, str | None]] = []
+        self.running = 0
+        self.peak = 0
+
+        async def call_tool(name, arguments):
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+            await asyncio.sleep(arguments["delay"])
+            self.running -= 1
+            return CallToolResult(content=[TextContent(type="text", text=name)])
+
+        self.aggregator.call_tool = call_tool
+
+    async def pre_tool_call(self, tool_call_id, request):
+        self.hook_calls.append(("pre", tool_call_id))
+        return request
+
+    async def post_tool_call(self, tool_call_id, request, result):
+        self.hook_calls.append(("post", tool_call_id))
+        return result
+
+
+def make_calls(*delays: float) -> list[tuple[str, CallToolRequest]]:
+    return [
+        (
+            f"id{index}",
+            CallToolRequest(
+                method="tools/call",
+                params=CallToolRequestParams(name=f"tool{index}", arguments={"delay": delay}),
+            ),
+        )
+        for index, delay in enumerate(delays)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_run_concurrently_in_order():
+    llm = SlowToolLLM()
+    # The first call is the slowest - results must still come back in request order
+    calls = make_calls(0.3, 0.1, 0.2)
+
+    start = time.perf_counter()
+    results = await llm.call_tools(calls)
+    elapsed = time.perf_counter() - start
+
+    assert [result.content[0].text for result in results] == ["tool0", "tool1", "tool2"]
+    assert elapsed < 0.5
+    assert llm.peak == 3
+    for tool_call_id, _ in calls:
+        assert ("pre", tool_call_id) in llm.hook_calls
+        assert ("post", tool_call_id) in llm.hook_calls
+
+
+@pytest.mark.asyncio
+async def test_tool_call_concurrency_is_limited():
+    llm = SlowToolLLM()
+
+    results = await llm.call_tools(
+        make_calls(*[0.05] * 6), RequestParams(max_parallel_tool_calls=2)
+    )
+
+    assert len(results) == 6
+    assert llm.peak == 2
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_sequential_without_parallel_tool_calls():
+    llm = SlowToolLLM()
+
+    await llm.call_tools(make_calls(0.01, 0.01, 0.01), RequestParams(parallel_tool_calls=False))
+
+    assert llm.peak == 1
+    assert llm.hook_calls == [
+        ("pre", "id0"),
+        ("post", "id0"),
+        ("pre", "id1"),
+        ("post", "id1"),
+        ("pre", "id2"),
+        ("post", "id2"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_failed_tool_call_does_not_affect_others():
+    llm = SlowToolLLM()
+    calls = make_calls(0.01, 0.01)
+    calls[0][1].params.arguments = {}  # KeyError inside the tool
+
+    results = await llm.call_tools(calls)
+
+    assert results[0].isError
+    assert not results[1].isError
@@ -0,0 +1,249 @@
+"""Unit tests for MCP server reconnection and circuit breaking."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import anyio
+import pytest
+from anyio import ClosedResourceError
+from mcp.types import CallToolResult, TextContent
+
+from mcp_agent._mcp_local_backup.circuit_breaker import CircuitBreaker, CircuitState
+from mcp_agent._mcp_local_backup.mcp_aggregator import MCPAggregator
+from mcp_agent._mcp_local_backup.mcp_connection_manager import (
+    MCPConnectionManager,
+    ServerConnection,
+)
+from mcp_agent.config import MCPReconnectSettings, MCPServerSettings
+from mcp_agent.core.exceptions import ServerInitializationError, ServerUnavailableError
+
+
+def create_breaker(**settings) -> CircuitBreaker:
+    settings = {"initial_delay_seconds": 1, "jitter": 0, **settings}
+    return CircuitBreaker(MCPReconnectSettings(**settings))
+
+
+def test_breaker_opens_after_threshold_and_fails_fast():
+    breaker = create_breaker(failure_threshold=3)
+
+    breaker.record_failure(now=0)
+    breaker.record_failure(now=0)
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.allow_attempt(now=0)
+
+    breaker.record_failure(now=0)
+    assert breaker.state == CircuitState.OPEN
+    # Third failure: 1s * 2**2
+    assert breaker.retry_in(now=0) == 4
+    assert not breaker.allow_attempt(now=3.9)
+
+
+def test_breaker_allows_one_trial_when_half_open():
+    breaker = create_breaker(failure_threshold=1)
+    breaker.record_failure(now=0)
+
+    assert breaker.allow_attempt(now=1)
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert not breaker.allow_attempt(now=1)
+
+    breaker.record_success()
+    assert breaker.health().state == CircuitState.CLOSED
+    assert breaker.health().consecutive_failures == 0
+
+
+def test_failed_trial_reopens_with_longer_delay():
+    breaker = create_breaker(failure_threshold=1, max_delay_seconds=3)
+    breaker.record_failure(now=0)
+    assert breaker.allow_attempt(now=1)
+
+    breaker.record_failure(now=1)
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.retry_in(now=1) == 2
+
+    breaker.allow_attempt(now=3)
+    breaker.record_failure(now=3)
+    # Capped at max_delay_seconds
+    assert breaker.retry_in(now=3) == 3
+
+
+def test_backoff_jitter_stays_within_bounds():
+    breaker = create_breaker(jitter=0.5)
+    breaker.record_failure(now=0)
+    for _ in range(20):
+        assert 1 <= breaker.backoff_delay() <= 1.5
+
+
+class FakeTransport:
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+
+    async def __aenter__(self):
+        if self.fail:
+            raise ConnectionError("connection refused")
+        return None, None, None
+
+    async def __aexit__(self, *args):
+        return False
+
+
+class FakeSession:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    async def initialize(self):
+        return MagicMock(capabilities=None)
+
+
+def create_manager(
+    fail_starts: int = 0, **reconnect
+) -> tuple[MCPConnectionManager, list[ServerConnection]]:
+    """A manager whose connections to "flaky" fail to start fail_starts times after the first."""
+    reconnect = {"initial_delay_seconds": 0.01, "jitter": 0, **reconnect}
+    config = MCPServerSettings(reconnect=MCPReconnectSettings(**reconnect))
+    registry = MagicMock()
+    registry.registry = {"flaky": config}
+    manager = MCPConnectionManager(server_registry=registry, context=MagicMock())
+    created = []
+
+    def fake_create_connection(server_name, client_session_factory, init_hook=None):
+        fail = 0 < len(created) <= fail_starts
+        conn = ServerConnection(
+            server_name=server_name,
+            server_config=config,
+            transport_context_factory=lambda: FakeTransport(fail),
+            client_session_factory=FakeSession,
+        )
+        created.append(conn)
+        return conn
+
+    manager._create_connection = fake_create_connection
+    return manager, created
+
+
+async def wait_for(predicate, timeout: float = 2) -> None:
+    async def poll():
+        while not predicate():
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(poll(), timeout)
+
+
+@pytest.mark.asyncio
+async def test_dropped_connection_reconnects_in_the_background():
+    manager, created = create_manager(fail_starts=1)
+    async with manager:
+        first = await manager.get_server("flaky", client_session_factory=FakeSession)
+        manager.connection_failed("flaky", first.session, ClosedResourceError())
+        assert not first.is_healthy()
+
+        await wait_for(lambda: manager.server_health("flaky").consecutive_failures == 0)
+        # One failed reconnection attempt, then a successful one
+        assert len(created) == 3
+        server_conn = await manager.get_server("flaky", client_session_factory=FakeSession)
+        assert server_conn is created[-1]
+        assert server_conn.is_healthy()
+
+
+class DroppingTransport:
+    """Transport whose reader fails once dropped is set, like a server process exiting."""
+
+    def __init__(self) -> None:
+        self.dropped = anyio.Event()
+
+    async def __aenter__(self):
+        self._tg = anyio.create_task_group()
+        await self._tg.__aenter__()
+        self._tg.start_soon(self._read)
+        return None, None, None
+
+    async def _read(self):
+        await self.dropped.wait()
+        raise ConnectionError("server process exited")
+
+    async def __aexit__(self, *args):
+        return await self._tg.__aexit__(*args)
+
+
+@pytest.mark.asyncio
+async def test_connection_ending_unexpectedly_is_reconnected():
+    manager, created = create_manager()
+    transport = DroppingTransport()
+    create_connection = manager._create_connection
+
+    def first_connection_drops(*args, **kwargs):
+        conn = create_connection(*args, **kwargs)
+        if len(created) == 1:
+            conn._transport_context_factory = lambda: transport
+        return conn
+
+    manager._create_connection = first_connection_drops
+    async with manager:
+        first = await manager.get_server("flaky", client_session_factory=FakeSession)
+        transport.dropped.set()
+
+        await wait_for(lambda: len(created) == 2 and created[1].is_healthy())
+        assert not first.is_healthy()
+        assert manager.server_health("flaky").state == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_other_errors_do_not_drop_the_connection():
+    manager, created = create_manager()
+    async with manager:
+        server_conn = await manager.get_server("flaky", client_session_factory=FakeSession)
+        manager.connection_failed("flaky", server_conn.session, ValueError("bad arguments"))
+        assert server_conn.is_healthy()
+        assert manager.server_health("flaky").consecutive_failures == 0
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_fails_fast_without_connecting():
+    manager, created = create_manager(fail_starts=10, failure_threshold=2, enabled=False)
+    async with manager:
+        first = await manager.get_server("flaky", client_session_factory=FakeSession)
+        manager.connection_failed("flaky", first.session, ClosedResourceError())
+
+        with pytest.raises(ServerInitializationError):
+            await manager.get_server("flaky", client_session_factory=FakeSession)
+        assert manager.server_health("flaky").state == CircuitState.OPEN
+
+        attempts = len(created)
+        with pytest.raises(ServerUnavailableError):
+            await manager.get_server("flaky", client_session_factory=FakeSession)
+        assert len(created) == attempts
+
+
+@pytest.mark.asyncio
+async def test_aggregator_returns_error_result_while_circuit_is_open():
+    context = MagicMock()
+    context.server_request_limiters = {}
+    aggregator = MCPAggregator(
+        server_names=["flaky"], connection_persistence=True, context=context
+    )
+    manager = MagicMock()
+
+    def unavailable(*args, **kwargs):
+        raise ServerUnavailableError("MCP Server 'flaky' is unavailable", "next attempt in 5.0s")
+
+    manager.session = unavailable
+    aggregator._persistent_connection_manager = manager
+
+    result = await aggregator._execute_on_server(
+        server_name="flaky",
+        operation_type="tool",
+        operation_name="echo",
+        method_name="call_tool",
+        method_args={"name": "echo", "arguments": {}},
+        error_factory=lambda msg: CallToolResult(
+            isError=True, content=[TextContent(type="text", text=msg)]
+        ),
+    )
+
+    assert result.isError
+    assert "unavailable" in result.content[0].text
@@ -0,0 +1,242 @@
+"""Unit tests for the on-disk cache of server tool and prompt listings."""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from unittest.mock import MagicMock
+
+import pytest
+from mcp.types import (
+    CallToolResult,
+    ListPromptsResult,
+    ListToolsResult,
+    Prompt,
+    ServerCapabilities,
+    TextContent,
+    Tool,
+)
+
+from mcp_agent._mcp_local_backup.listing_cache import ListingCache, ServerListing
+from mcp_agent._mcp_local_backup.mcp_aggregator import MCPAggregator
+from mcp_agent._mcp_local_backup.mcp_connection_manager import (
+    MCPConnectionManager,
+    ServerConnection,
+    ServerStartupReport,
+)
+from mcp_agent._mcp_local_backup.single_flight import SingleFlight
+from mcp_agent._mcp_local_backup.tool_result_cache import ToolResultCache
+from mcp_agent.config import MCPServerSettings
+
+
+def tool(name: str) -> Tool:
+    return Tool(name=name, inputSchema={"type": "object"})
+
+
+def test_listing_round_trip_and_config_keying(tmp_path):
+    cache = ListingCache(tmp_path)
+    config = MCPServerSettings(command="server", args=["--port", "1"])
+    listing = ServerListing(
+        tools=[tool("search")],
+        prompts=[Prompt(name="summarize")],
+        capabilities=ServerCapabilities(prompts={}),
+    )
+
+    assert cache.load("docs", config) is None
+    cache.save("docs", config, listing)
+
+    loaded = cache.load("docs", config)
+    assert loaded.same_tools(listing)
+    assert loaded.same_prompts(listing)
+    assert loaded.capabilities.prompts is not None
+
+    # A changed configuration does not reuse the old listing
+    assert cache.load("docs", MCPServerSettings(command="server", args=["--port", "2"])) is None
+
+
+def test_unreadable_listing_is_ignored(tmp_path):
+    cache = ListingCache(tmp_path)
+    config = MCPServerSettings(command="server")
+    cache.path("docs", config).write_text("{not json")
+
+    assert cache.load("docs", config) is None
+
+
+class FakeServer:
+    """Persistent connection manager stand-in for one slow-starting server."""
+
+    def __init__(self, tools: list[str], startup_delay: float = 0.3):
+        self.tools = tools
+        self.startup_delay = startup_delay
+        self.list_tools_calls = 0
+        self.connects = 0
+        self.client = MagicMock()
+        self.client.list_tools = self.list_tools
+        self.client.list_prompts = self.list_prompts
+        self.client.call_tool = self.call_tool
+
+    async def list_tools(self):
+        self.list_tools_calls += 1
+        return ListToolsResult(tools=[tool(name) for name in self.tools])
+
+    async def list_prompts(self):
+        return ListPromptsResult(prompts=[Prompt(name="summarize")])
+
+    async def call_tool(self, name, arguments=None):
+        return CallToolResult(content=[TextContent(type="text", text=name)])
+
+    async def launch_servers(self, server_names, client_session_factory):
+        self.connects += len(server_names)
+        await asyncio.sleep(self.startup_delay)
+        return ServerStartupReport(started={name: self.startup_delay for name in server_names})
+
+    async def get_server(self, server_name, client_session_factory):
+        return MagicMock(session=self.client, server_capabilities=ServerCapabilities(prompts={}))
+
+    @asynccontextmanager
+    async def session(self, server_name, client_session_factory):
+        self.connects += 1
+        yield self.client
+
+
+def create_aggregator(tmp_path, server: FakeServer, **config) -> MCPAggregator:
+    context = MagicMock()
+    context.config.mcp.listing_cache_dir = str(tmp_path)
+    context.server_registry.registry = {
+        "docs": MCPServerSettings(command="docs-server", **config)
+    }
+    context.tool_result_cache = ToolResultCache()
+    context.tool_call_flights = SingleFlight()
+    context.server_request_limiters = {}
+    aggregator = MCPAggregator(server_names=["docs"], connection_persistence=True, context=context)
+    aggregator._persistent_connection_manager = server
+    return aggregator
+
+
+async def tool_names(aggregator: MCPAggregator) -> list[str]:
+    return [t.name for t in (await aggregator.list_tools()).tools]
+
+
+@pytest.mark.asyncio
+async def test_startup_uses_cached_listing_and_refreshes_in_background(tmp_path):
+    # First start: nothing cached, the listing is fetched and saved
+    await create_aggregator(tmp_path, FakeServer(["search"])).load_servers()
+
+    # The server has since gained a tool
+    server = FakeServer(["search", "fetch"])
+    aggregator = create_aggregator(tmp_path, server)
+
+    start = time.perf_counter()
+    await aggregator.load_servers()
+    # Returned from the cache without waiting for the server to start
+    assert time.perf_counter() - start < server.startup_delay
+    assert await tool_names(aggregator) == ["docs-search"]
+    assert [p.name for p in aggregator._prompt_cache["docs"]] == ["summarize"]
+
+    await aggregator._listing_refresh_task
+    assert await tool_names(aggregator) == ["docs-search", "docs-fetch"]
+
+    # The fresh listing replaced the cached one
+    cache = ListingCache(tmp_path)
+    listing = cache.load("docs", MCPServerSettings(command="docs-server"))
+    assert [t.name for t in listing.tools] == ["search", "fetch"]
+
+
+@pytest.mark.asyncio
+async def test_unchanged_listing_is_not_refreshed(tmp_path):
+    await create_aggregator(tmp_path, FakeServer(["search"])).load_servers()
+
+    server = FakeServer(["search"], startup_delay=0)
+    aggregator = create_aggregator(tmp_path, server)
+    await aggregator.load_servers()
+    await aggregator._listing_refresh_task
+
+    # Listed once in the background, no extra refresh
+    assert server.list_tools_calls == 1
+    assert await tool_names(aggregator) == ["docs-search"]
+
+
+@pytest.mark.asyncio
+async def test_lazy_server_connects_on_first_call(tmp_path):
+    # Listing is cached by a first, connected start
+    await create_aggregator(tmp_path, FakeServer(["search"]), lazy_connect=True).load_servers()
+
+    server = FakeServer(["search"])
+    aggregator = create_aggregator(tmp_path, server, lazy_connect=True)
+    await aggregator.load_servers()
+
+    assert await tool_names(aggregator) == ["docs-search"]
+    assert aggregator._listing_refresh_task is None
+    assert server.connects == 0
+
+    result = await aggregator.call_tool("docs-search", {})
+    assert result.content[0].text == "search"
+    assert server.connects == 1
+
+
+class SlowStartingSession:
+    """Client session for a server that takes a while to initialize."""
+
+    def __init__(self, *args, **kwargs):
+        self.calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    async def initialize(self):
+        await asyncio.sleep(0.2)
+        return MagicMock(capabilities=ServerCapabilities(prompts={}))
+
+    async def list_tools(self):
+        return ListToolsResult(tools=[tool("search")])
+
+    async def list_prompts(self):
+        return ListPromptsResult(prompts=[Prompt(name="summarize")])
+
+    async def call_tool(self, name, arguments=None):
+        self.calls.append(name)
+        return CallToolResult(content=[TextContent(type="text", text=name)])
+
+
+class FakeTransport:
+    async def __aenter__(self):
+        return None, None, None
+
+    async def __aexit__(self, *args):
+        return False
+
+
+@pytest.mark.asyncio
+async def test_tool_call_during_background_refresh_shares_the_launch(tmp_path):
+    await create_aggregator(tmp_path, FakeServer(["search"])).load_servers()
+
+    aggregator = create_aggregator(tmp_path, FakeServer([]))
+    registry = aggregator.context.server_registry
+    registry.init_hooks = {}
+    manager = MCPConnectionManager(server_registry=registry, context=MagicMock())
+    created = []
+
+    def create_connection(server_name, client_session_factory, init_hook=None):
+        conn = ServerConnection(
+            server_name=server_name,
+            server_config=registry.registry[server_name],
+            transport_context_factory=FakeTransport,
+            client_session_factory=SlowStartingSession,
+        )
+        created.append(conn)
+        return conn
+
+    manager._create_connection = create_connection
+    aggregator._persistent_connection_manager = manager
+    async with manager:
+        await aggregator.load_servers()
+        # Called while the refresh is still starting the server
+        result = await aggregator.call_tool("docs-search", {})
+        await aggregator._listing_refresh_task
+
+        assert result.content[0].text == "search"
+        assert len(created) == 1
+        assert created[0].is_healthy()
+        assert created[0].session.calls == ["search"]
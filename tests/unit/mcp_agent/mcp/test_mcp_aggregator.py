@@ -0,0 +1,181 @@
+"""Unit tests for MCPAggregator tool routing."""
+
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from mcp.types import CallToolResult, ListToolsResult, TextContent, Tool
+
+from mcp_agent._mcp_local_backup.mcp_aggregator import MCPAggregator
+from mcp_agent._mcp_local_backup.mcp_connection_manager import IdleConnectionManager
+from mcp_agent.config import MCPSettings, Settings
+
+
+def make_tool(name: str) -> Tool:
+    return Tool(name=name, description=f"{name} tool", inputSchema={"type": "object"})
+
+
+def create_aggregator(tools_by_server: dict[str, list[str]]) -> MCPAggregator:
+    aggregator = MCPAggregator(
+        server_names=list(tools_by_server),
+        connection_persistence=False,
+        context=MagicMock(),
+    )
+    for server_name, tool_names in tools_by_server.items():
+        aggregator._index_server_tools(server_name, [make_tool(name) for name in tool_names])
+    aggregator.initialized = True
+    return aggregator
+
+
+@pytest.mark.asyncio
+async def test_routes_bare_tool_name_to_owning_server():
+    aggregator = create_aggregator({"weather": ["forecast"], "files": ["read_file"]})
+
+    assert await aggregator._parse_resource_name("read_file", "tool") == ("files", "read_file")
+    assert await aggregator._parse_resource_name("weather-forecast", "tool") == (
+        "weather",
+        "forecast",
+    )
+
+
+@pytest.mark.asyncio
+async def test_ambiguous_bare_tool_name_is_an_error():
+    aggregator = create_aggregator({"one": ["search"], "two": ["search"]})
+    aggregator._execute_on_server = AsyncMock()
+
+    with pytest.raises(ValueError) as exc_info:
+        await aggregator._parse_resource_name("search", "tool")
+    assert "one-search" in str(exc_info.value)
+    assert "two-search" in str(exc_info.value)
+
+    result = await aggregator.call_tool("search", {})
+    assert result.isError
+    aggregator._execute_on_server.assert_not_called()
+
+    # Namespaced names remain unambiguous
+    assert await aggregator._parse_resource_name("two-search", "tool") == ("two", "search")
+
+
+@pytest.mark.asyncio
+async def test_index_follows_tool_refresh():
+    aggregator = create_aggregator({"one": ["alpha", "beta"], "two": ["beta"]})
+
+    aggregator._index_server_tools("one", [make_tool("alpha"), make_tool("gamma")])
+
+    assert await aggregator._parse_resource_name("beta", "tool") == ("two", "beta")
+    assert await aggregator._parse_resource_name("gamma", "tool") == ("one", "gamma")
+    assert "one-beta" not in aggregator._namespaced_tool_map
+
+    aggregator._index_server_tools("one", [])
+    assert "alpha" not in aggregator._tool_name_index
+
+
+@pytest.mark.asyncio
+async def test_call_tool_uses_index():
+    aggregator = create_aggregator({"one": ["alpha"], "two": ["beta"]})
+    aggregator._execute_on_server = AsyncMock(
+        return_value=CallToolResult(content=[TextContent(type="text", text="ok")])
+    )
+
+    result = await aggregator.call_tool("beta", {"x": 1})
+
+    assert not result.isError
+    call = aggregator._execute_on_server.call_args.kwargs
+    assert call["server_name"] == "two"
+    assert call["method_args"] == {"name": "beta", "arguments": {"x": 1}}
+
+
+@pytest.mark.asyncio
+async def test_tool_routing_microbenchmark():
+    """1,000 tools across 20 servers - bare name lookups must not scan every tool."""
+    tools_by_server = {
+        f"server{s}": [f"tool_{s}_{t}" for t in range(50)] for s in range(20)
+    }
+    aggregator = create_aggregator(tools_by_server)
+    assert len(aggregator._namespaced_tool_map) == 1000
+
+    # Worst case for a linear scan - the last tool of the last server
+    lookups = 20_000
+    start = time.perf_counter()
+    for _ in range(lookups):
+        server_name, _ = await aggregator._parse_resource_name("tool_19_49", "tool")
+    elapsed = time.perf_counter() - start
+
+    assert server_name == "server19"
+    # A full scan costs ~1000 comparisons per lookup; the index is a single dict access
+    assert elapsed < 1.0
+
+
+@pytest.mark.asyncio
+async def test_list_tools_snapshot_is_reused_until_tools_change():
+    aggregator = create_aggregator({"one": ["alpha"], "two": ["beta"]})
+
+    first = await aggregator.list_tools()
+    version = aggregator.tool_list_version
+    assert await aggregator.list_tools() is first
+    assert [tool.name for tool in first.tools] == ["one-alpha", "two-beta"]
+
+    aggregator._index_server_tools("two", [make_tool("gamma")])
+    aggregator._invalidate_tool_list()
+
+    second = await aggregator.list_tools()
+    assert second is not first
+    assert aggregator.tool_list_version > version
+    assert [tool.name for tool in second.tools] == ["one-alpha", "two-gamma"]
+
+
+class FakeClientSession:
+    def __init__(self, read_stream, write_stream, read_timeout, **kwargs):
+        self.kwargs = kwargs
+
+
+class ReconnectingConnectionManager:
+    """Fake persistent connection manager that creates sessions as ServerConnection does."""
+
+    def __init__(self, tools: list[Tool]):
+        self.tools = tools
+        self.sessions = []
+
+    async def get_server(self, server_name, client_session_factory):
+        self.sessions.append(client_session_factory(None, None, None, server_config=MagicMock()))
+        list_tools = AsyncMock(return_value=ListToolsResult(tools=self.tools))
+        return SimpleNamespace(session=SimpleNamespace(list_tools=list_tools))
+
+
+@pytest.mark.asyncio
+async def test_tool_list_change_reconnects_persistent_server(monkeypatch):
+    monkeypatch.setattr(
+        "mcp_agent._mcp_local_backup.mcp_aggregator.MCPAgentClientSession", FakeClientSession
+    )
+    aggregator = create_aggregator({"one": ["alpha"]})
+    aggregator.connection_persistence = True
+    manager = ReconnectingConnectionManager([make_tool("gamma")])
+    aggregator._persistent_connection_manager = manager
+
+    await aggregator._refresh_server_tools("one")
+
+    # The connection manager passes server_config, which the session factory must accept
+    assert manager.sessions[0].kwargs["server_name"] == "one"
+    assert "server_config" in manager.sessions[0].kwargs
+    assert "one-gamma" in aggregator._namespaced_tool_map
+    assert "one-alpha" not in aggregator._namespaced_tool_map
+
+
+@pytest.mark.asyncio
+async def test_non_persistent_aggregator_shares_idle_connection_manager():
+    context = MagicMock()
+    context.idle_connection_manager = None
+    context.config = Settings(mcp=MCPSettings(idle_connection_ttl_seconds=30))
+    first = MCPAggregator(server_names=["tools"], connection_persistence=False, context=context)
+    second = MCPAggregator(server_names=["tools"], connection_persistence=False, context=context)
+
+    manager = first._idle_connection_manager()
+    assert isinstance(manager, IdleConnectionManager)
+    assert manager.idle_ttl == 30
+    assert second._idle_connection_manager() is manager
+
+    context.config = Settings()
+    assert MCPAggregator(
+        server_names=["tools"], connection_persistence=False, context=context
+    )._idle_connection_manager() is None
@@ -0,0 +1,294 @@
+"""Unit tests for concurrent cross-server resource and prompt resolution in MCPAggregator."""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from unittest.mock import MagicMock
+
+import pytest
+from mcp.types import (
+    GetPromptResult,
+    ListPromptsResult,
+    ListResourcesResult,
+    Prompt,
+    PromptMessage,
+    ReadResourceResult,
+    Resource,
+    ServerCapabilities,
+    TextContent,
+    TextResourceContents,
+)
+
+from mcp_agent._mcp_local_backup.mcp_aggregator import MCPAggregator
+
+DELAY = 0.1
+
+
+def create_aggregator(server_names: list[str]) -> MCPAggregator:
+    aggregator = MCPAggregator(
+        server_names=server_names, connection_persistence=False, context=MagicMock()
+    )
+    aggregator.initialized = True
+    return aggregator
+
+
+def read_result(uri: str, text: str) -> ReadResourceResult:
+    return ReadResourceResult(contents=[TextResourceContents(uri=uri, text=text)])
+
+
+class FakeServers:
+    """Fake _execute_on_server: each server serves its resources and prompts after a delay."""
+
+    def __init__(self, resources: dict[str, list[str]], prompts: dict[str, list[str]] = {}):
+        self.resources = resources
+        self.prompts = prompts
+        self.calls: list[tuple[str, str]] = []
+        self.cancelled: list[str] = []
+        self.delays: dict[str, float] = {}
+
+    async def __call__(self, server_name, operation_type, operation_name, method_name, **kwargs):
+        self.calls.append((server_name, method_name))
+        error_factory = kwargs.get("error_factory")
+        try:
+            await asyncio.sleep(self.delays.get(server_name, DELAY))
+        except asyncio.CancelledError:
+            self.cancelled.append(server_name)
+            raise
+
+        if method_name == "read_resource":
+            uri = str(kwargs["method_args"]["uri"])
+            if uri in self.resources.get(server_name, []):
+                return read_result(uri, server_name)
+            raise ValueError(f"{uri} not found")
+        if method_name == "list_resources":
+            return ListResourcesResult(
+                resources=[
+                    Resource(uri=uri, name=uri) for uri in self.resources.get(server_name, [])
+                ]
+            )
+        if method_name == "list_prompts":
+            return ListPromptsResult(
+                prompts=[Prompt(name=name) for name in self.prompts.get(server_name, [])]
+            )
+        if method_name == "get_prompt":
+            name = kwargs["method_args"]["name"]
+            if name in self.prompts.get(server_name, []):
+                message = PromptMessage(
+                    role="user", content=TextContent(type="text", text=server_name)
+                )
+                return GetPromptResult(messages=[message])
+            return error_factory("not found")
+        raise AssertionError(method_name)
+
+
+@pytest.mark.asyncio
+async def test_get_resource_searches_servers_concurrently():
+    servers = [f"server{i}" for i in range(6)]
+    aggregator = create_aggregator(servers)
+    fake = FakeServers({"server5": ["resource://data/items"]})
+    aggregator._execute_on_server = fake
+
+    start = time.perf_counter()
+    result = await aggregator.get_resource("resource://data/items")
+    elapsed = time.perf_counter() - start
+
+    assert result.contents[0].text == "server5"
+    # Six sequential misses would take 6 * DELAY
+    assert elapsed < 3 * DELAY
+
+
+@pytest.mark.asyncio
+async def test_get_resource_prefers_server_priority_and_cancels_the_rest():
+    aggregator = create_aggregator(["first", "second", "third"])
+    fake = FakeServers(
+        {"first": ["resource://a", "resource://c"], "second": ["resource://a"]}
+    )
+    fake.delays = {"second": 5 * DELAY, "third": 5 * DELAY}
+    aggregator._execute_on_server = fake
+
+    result = await aggregator.get_resource("resource://a")
+    assert result.contents[0].text == "first"
+
+    # The lower priority attempts were cancelled rather than left running
+    assert fake.cancelled == ["second", "third"]
+
+    aggregator.max_parallel_server_requests = 1
+    fake.calls.clear()
+    fake.cancelled.clear()
+    assert (await aggregator.get_resource("resource://c")).contents[0].text == "first"
+    # With one request at a time, queued lower priority attempts never reach their server
+    assert "third" not in [name for name, _ in fake.calls]
+
+
+@pytest.mark.asyncio
+async def test_get_resource_not_found_anywhere():
+    aggregator = create_aggregator(["one", "two"])
+    aggregator._execute_on_server = FakeServers({})
+
+    with pytest.raises(ValueError, match="not found on any server"):
+        await aggregator.get_resource("resource://missing")
+
+
+@pytest.mark.asyncio
+async def test_resource_index_skips_search_after_lookup():
+    aggregator = create_aggregator(["one", "two", "three"])
+    fake = FakeServers({"three": ["file:///docs/readme.md", "file:///docs/guide.md"]})
+    aggregator._execute_on_server = fake
+
+    await aggregator.get_resource("file:///docs/readme.md")
+    fake.calls.clear()
+
+    # A sibling URI under the same prefix goes straight to the indexed server
+    result = await aggregator.get_resource("file:///docs/guide.md")
+    assert result.contents[0].text == "three"
+    assert fake.calls == [("three", "read_resource")]
+
+
+@pytest.mark.asyncio
+async def test_list_resources_runs_concurrently_and_feeds_index():
+    aggregator = create_aggregator(["one", "two", "three"])
+    fake = FakeServers(
+        {"one": ["notes://a/1"], "two": ["notes://b/1", "notes://b/2"], "three": []}
+    )
+    aggregator._execute_on_server = fake
+
+    start = time.perf_counter()
+    results = await aggregator.list_resources()
+    elapsed = time.perf_counter() - start
+
+    assert results == {"one": ["notes://a/1"], "two": ["notes://b/1", "notes://b/2"], "three": []}
+    assert list(results) == ["one", "two", "three"]
+    assert elapsed < 2 * DELAY
+
+    assert aggregator._server_for_resource("notes://b/3") == "two"
+    assert aggregator._server_for_resource("notes://a/2") == "one"
+    # Shared prefixes are ambiguous and fall back to searching
+    assert aggregator._server_for_resource("notes://c/1") is None
+
+
+@pytest.mark.asyncio
+async def test_file_trees_on_different_servers_are_not_routed_to_each_other():
+    aggregator = create_aggregator(["one", "two"])
+    fake = FakeServers({"one": ["file:///a/x"], "two": ["file:///b/y", "file:///b/z"]})
+    aggregator._execute_on_server = fake
+
+    await aggregator.get_resource("file:///a/x")
+    fake.calls.clear()
+
+    # Knowing where file:///a/ lives says nothing about file:///b/
+    assert aggregator._server_for_resource("file:///b/y") is None
+    result = await aggregator.get_resource("file:///b/y")
+    assert result.contents[0].text == "two"
+    assert sorted(fake.calls) == [("one", "read_resource"), ("two", "read_resource")]
+
+    fake.calls.clear()
+    assert (await aggregator.get_resource("file:///b/z")).contents[0].text == "two"
+    assert (await aggregator.get_resource("file:///a/x")).contents[0].text == "one"
+    assert fake.calls == [("two", "read_resource"), ("one", "read_resource")]
+
+
+def test_resource_uri_prefixes():
+    assert MCPAggregator._resource_uri_prefixes("file:///docs/guide/intro.md") == [
+        "file:///docs/guide/intro.md",
+        "file:///docs/guide/",
+        "file:///docs/",
+    ]
+    assert MCPAggregator._resource_uri_prefixes("resource://weather/today") == [
+        "resource://weather/today",
+        "resource://weather/",
+        "resource://weather",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_prompt_fallback_search_runs_concurrently():
+    servers = [f"server{i}" for i in range(5)]
+    aggregator = create_aggregator(servers)
+    aggregator._execute_on_server = FakeServers({}, prompts={"server3": ["summarize"]})
+
+    async def get_capabilities(server_name):
+        return MagicMock(prompts=True)
+
+    aggregator.get_capabilities = get_capabilities
+
+    start = time.perf_counter()
+    result = await aggregator.get_prompt("summarize")
+    elapsed = time.perf_counter() - start
+
+    assert result.messages[0].content.text == "server3"
+    assert result.namespaced_name == "server3-summarize"
+    # The fallback search and the cache update after it, not one request per server
+    assert elapsed < 4 * DELAY
+    assert [p.name for p in aggregator._prompt_cache["server3"]] == ["summarize"]
+
+
+@pytest.mark.asyncio
+async def test_list_prompts_runs_concurrently():
+    servers = [f"server{i}" for i in range(5)]
+    aggregator = create_aggregator(servers)
+    aggregator._execute_on_server = FakeServers({}, prompts={"server1": ["a"], "server4": ["b"]})
+
+    async def get_capabilities(server_name):
+        return MagicMock(prompts=server_name != "server0")
+
+    aggregator.get_capabilities = get_capabilities
+
+    start = time.perf_counter()
+    results = await aggregator.list_prompts()
+    elapsed = time.perf_counter() - start
+
+    assert [p.name for p in results["server4"]] == ["b"]
+    assert results["server0"] == []
+    assert elapsed < 2 * DELAY
+
+
+class FakeConnections:
+    """Persistent connection manager stand-in whose sessions serve prompts."""
+
+    def __init__(self, prompts: dict[str, list[str]]):
+        self.prompts = prompts
+
+    async def get_server(self, server_name, client_session_factory):
+        return MagicMock(server_capabilities=ServerCapabilities(prompts={}))
+
+    @asynccontextmanager
+    async def session(self, server_name, client_session_factory):
+        names = self.prompts.get(server_name, [])
+
+        async def list_prompts():
+            return ListPromptsResult(prompts=[Prompt(name=name) for name in names])
+
+        async def get_prompt(name, arguments=None):
+            message = PromptMessage(role="user", content=TextContent(type="text", text=name))
+            return GetPromptResult(messages=[message] if name in names else [])
+
+        yield MagicMock(list_prompts=list_prompts, get_prompt=get_prompt)
+
+
+@pytest.mark.asyncio
+async def test_prompts_are_listed_through_the_server_sessions():
+    context = MagicMock()
+    context.server_request_limiters = {}
+    aggregator = MCPAggregator(
+        server_names=["one", "two"], connection_persistence=True, context=context
+    )
+    aggregator.initialized = True
+    aggregator._persistent_connection_manager = FakeConnections(
+        {"one": ["summarize"], "two": ["translate"]}
+    )
+
+    results = await aggregator.list_prompts(server_name="two")
+    assert [p.name for p in results["two"]] == ["translate"]
+
+    # Not in the prompt cache: found by searching, then cached
+    aggregator._prompt_cache.clear()
+    result = await aggregator.get_prompt("summarize")
+    assert result.namespaced_name == "one-summarize"
+    assert [p.name for p in aggregator._prompt_cache["one"]] == ["summarize"]
+
+    aggregator._prompt_cache.clear()
+    results = await aggregator.list_prompts()
+    assert {name: [p.name for p in prompts] for name, prompts in results.items()} == {
+        "one": ["summarize"],
+        "two": ["translate"],
+    }
@@ -0,0 +1,485 @@
+"""Unit tests for MCPConnectionManager server startup."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from mcp_agent._mcp_local_backup.mcp_connection_manager import (
+    IdleConnectionManager,
+    MCPConnectionManager,
+    ServerConnection,
+)
+from mcp_agent.config import MCPServerPoolSettings, MCPServerSettings
+from mcp_agent.core.exceptions import ServerInitializationError
+
+
+def create_manager() -> MCPConnectionManager:
+    return MCPConnectionManager(server_registry=MagicMock(), context=MagicMock())
+
+
+@pytest.mark.asyncio
+async def test_launch_servers_runs_concurrently():
+    manager = create_manager()
+    delays = {"one": 0.2, "two": 0.2, "three": 0.2, "four": 0.2}
+
+    async def fake_get_server(server_name, client_session_factory, init_hook=None):
+        await asyncio.sleep(delays[server_name])
+        return MagicMock()
+
+    manager.get_server = fake_get_server
+
+    start = time.perf_counter()
+    report = await manager.launch_servers(list(delays), client_session_factory=lambda name: None)
+    elapsed = time.perf_counter() - start
+
+    assert set(report.started) == set(delays)
+    assert report.failed == {}
+    # Concurrent startup costs the slowest server, not the sum of all of them
+    assert elapsed < 0.5
+
+
+@pytest.mark.asyncio
+async def test_launch_servers_isolates_failures():
+    manager = create_manager()
+
+    async def fake_get_server(server_name, client_session_factory, init_hook=None):
+        if server_name == "broken":
+            raise ServerInitializationError("broken failed")
+        return MagicMock()
+
+    manager.get_server = fake_get_server
+
+    report = await manager.launch_servers(
+        ["good", "broken", "other"], client_session_factory=lambda name: None
+    )
+
+    assert set(report.started) == {"good", "other"}
+    assert list(report.failed) == ["broken"]
+    assert "broken failed" in report.failed["broken"]
+
+
+@pytest.mark.asyncio
+async def test_launch_servers_passes_per_server_session_factory():
+    manager = create_manager()
+    received = {}
+
+    async def fake_get_server(server_name, client_session_factory, init_hook=None):
+        received[server_name] = client_session_factory
+        return MagicMock()
+
+    manager.get_server = fake_get_server
+
+    await manager.launch_servers(["a", "b"], client_session_factory=lambda name: f"factory-{name}")
+
+    assert received == {"a": "factory-a", "b": "factory-b"}
+
+
+@pytest.mark.asyncio
+async def test_get_server_startup_timeout():
+    manager = create_manager()
+    server_conn = ServerConnection(
+        server_name="slow",
+        server_config=MCPServerSettings(startup_timeout_seconds=0.1),
+        transport_context_factory=MagicMock(),
+        client_session_factory=MagicMock(),
+    )
+
+    async def fake_launch_server(server_name, client_session_factory, init_hook=None):
+        manager.running_servers[server_name] = server_conn
+        return server_conn
+
+    manager.launch_server = AsyncMock(side_effect=fake_launch_server)
+
+    with pytest.raises(ServerInitializationError) as exc_info:
+        await manager.get_server("slow", client_session_factory=MagicMock())
+
+    assert "Timed out" in exc_info.value.details
+    assert "slow" not in manager.running_servers
+    assert not server_conn.is_healthy()
+
+
+class FakeTransport:
+    async def __aenter__(self):
+        return None, None, None
+
+    async def __aexit__(self, *args):
+        return False
+
+
+class FakeSession:
+    def __init__(self, *args, **kwargs):
+        self.calls = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    async def initialize(self):
+        return MagicMock(capabilities=None)
+
+    async def call_tool(self, name, arguments=None):
+        self.calls += 1
+        await asyncio.sleep(0.2 if name == "slow" else 0)
+        return name
+
+
+class SlowSession(FakeSession):
+    """Session whose initialize() takes a while, like a server process starting up."""
+
+    async def initialize(self):
+        await asyncio.sleep(0.1)
+        return await super().initialize()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_calls_share_one_launch():
+    config = MCPServerSettings()
+    registry = MagicMock()
+    registry.registry = {"slow": config}
+    registry.init_hooks = {}
+    manager = MCPConnectionManager(server_registry=registry, context=MagicMock())
+    created = []
+
+    def fake_create_connection(server_name, client_session_factory, init_hook=None):
+        conn = ServerConnection(
+            server_name=server_name,
+            server_config=config,
+            transport_context_factory=FakeTransport,
+            client_session_factory=SlowSession,
+        )
+        created.append(conn)
+        return conn
+
+    manager._create_connection = fake_create_connection
+    async with manager:
+        first = asyncio.create_task(manager.get_server("slow", client_session_factory=SlowSession))
+        # Later callers arrive while the session exists but has not initialized yet
+        await asyncio.sleep(0.05)
+        assert created[0].session is not None and not created[0].is_healthy()
+        others = await asyncio.gather(
+            *(manager.get_server("slow", client_session_factory=SlowSession) for _ in range(2))
+        )
+
+        assert len(created) == 1
+        assert all(conn is created[0] for conn in [await first, *others])
+        assert created[0].is_healthy()
+        assert not created[0]._shutdown_event.is_set()
+
+
+def create_pooled_manager(session_factory=FakeSession, **pool_settings) -> MCPConnectionManager:
+    config = MCPServerSettings(pool=MCPServerPoolSettings(**pool_settings))
+    registry = MagicMock()
+    registry.registry = {"pooled": config}
+    registry.init_hooks = {}
+    manager = MCPConnectionManager(server_registry=registry, context=MagicMock())
+
+    def fake_create_connection(server_name, client_session_factory, init_hook=None):
+        return ServerConnection(
+            server_name=server_name,
+            server_config=config,
+            transport_context_factory=FakeTransport,
+            client_session_factory=session_factory,
+        )
+
+    manager._create_connection = fake_create_connection
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_pool_spreads_concurrent_calls_across_sessions():
+    async with create_pooled_manager(max_sessions=3) as manager:
+
+        async def call(tool_name):
+            async with manager.session("pooled", client_session_factory=FakeSession) as session:
+                return await session.call_tool(tool_name)
+
+        first = asyncio.create_task(call("slow"))
+        await asyncio.sleep(0.01)
+        # Every session is busy: the pool grows
+        assert await call("fast") == "fast"
+        await asyncio.sleep(0.01)
+
+        second = asyncio.create_task(call("slow"))
+        await asyncio.sleep(0.01)
+        pool = manager._pools["pooled"]
+        # The second slow call went to the new, idle session
+        assert [pooled.in_flight for pooled in pool.sessions] == [1, 1]
+        await asyncio.gather(first, second)
+
+        stats = manager.pool_stats()["pooled"]
+        assert stats.sessions == 2
+        assert stats.sessions_created == 1
+        assert stats.checkouts == 3
+        assert stats.peak_in_flight == 2
+        assert stats.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_pool_grows_without_making_the_call_wait():
+    async with create_pooled_manager(session_factory=SlowSession, max_sessions=2) as manager:
+
+        async def call(tool_name):
+            async with manager.session("pooled", client_session_factory=SlowSession) as session:
+                return await session.call_tool(tool_name)
+
+        # Connect the primary session
+        await call("fast")
+
+        slow = asyncio.create_task(call("slow"))
+        await asyncio.sleep(0.01)
+        start = time.perf_counter()
+        assert await call("fast") == "fast"
+        # Served by the busy primary session, not after the new session's 0.1s startup
+        assert time.perf_counter() - start < 0.05
+        assert manager.pool_stats()["pooled"].sessions == 1
+
+        await slow
+        stats = manager.pool_stats()["pooled"]
+        assert stats.sessions == 2
+        assert stats.sessions_created == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_reuses_idle_sessions_and_respects_max():
+    async with create_pooled_manager(max_sessions=2) as manager:
+
+        async def call(tool_name):
+            async with manager.session("pooled", client_session_factory=FakeSession) as session:
+                return await session.call_tool(tool_name)
+
+        # Sequential calls stay on the primary session
+        for _ in range(3):
+            await call("fast")
+        assert manager.pool_stats()["pooled"].sessions == 1
+
+        await asyncio.gather(*(call("slow") for _ in range(5)))
+        stats = manager.pool_stats()["pooled"]
+        assert stats.sessions == 2
+        assert stats.peak_in_flight == 5
+
+
+@pytest.mark.asyncio
+async def test_pool_reaps_idle_sessions_down_to_min():
+    async with create_pooled_manager(min_sessions=1, max_sessions=3) as manager:
+
+        async def call(tool_name):
+            async with manager.session("pooled", client_session_factory=FakeSession) as session:
+                return await session.call_tool(tool_name)
+
+        await asyncio.gather(*(call("slow") for _ in range(3)))
+        pool = manager._pools["pooled"]
+        assert len(pool.sessions) == 3
+
+        # Nothing is reaped before the idle timeout
+        assert pool.reap_idle() == 0
+        assert pool.reap_idle(now=time.monotonic() + 600) == 2
+        assert len(pool.sessions) == 1
+        assert manager.pool_stats()["pooled"].sessions_reaped == 2
+
+
+@pytest.mark.asyncio
+async def test_session_without_pool_uses_the_persistent_connection():
+    manager = create_manager()
+    manager.server_registry.registry = {"plain": MCPServerSettings()}
+    server_conn = MagicMock()
+    manager.get_server = AsyncMock(return_value=server_conn)
+
+    async with manager.session("plain", client_session_factory=FakeSession) as session:
+        assert session is server_conn.session
+
+    assert manager.pool_stats() == {}
+
+
+def create_idle_manager(
+    idle_ttl: float, session_factory=FakeSession
+) -> tuple[IdleConnectionManager, list]:
+    registry = MagicMock()
+    registry.registry = {"tools": MCPServerSettings()}
+    manager = IdleConnectionManager(server_registry=registry, idle_ttl=idle_ttl)
+    created = []
+
+    def fake_create_connection(server_name, client_session_factory, init_hook=None):
+        conn = ServerConnection(
+            server_name=server_name,
+            server_config=MCPServerSettings(),
+            transport_context_factory=FakeTransport,
+            client_session_factory=session_factory,
+        )
+        created.append(conn)
+        return conn
+
+    manager._create_connection = fake_create_connection
+    return manager, created
+
+
+@pytest.mark.asyncio
+async def test_idle_connection_is_reused_within_ttl():
+    manager, created = create_idle_manager(idle_ttl=60)
+    try:
+        for _ in range(5):
+            async with manager.session("tools", client_session_factory=FakeSession) as session:
+                await session.call_tool("fast")
+
+        # One connection (process spawn and handshake) for the whole burst
+        assert len(created) == 1
+        assert created[0].session.calls == 5
+
+        # Still warm before the TTL expires
+        assert await manager.close_idle() == []
+        assert "tools" in manager.running_servers
+    finally:
+        await manager.__aexit__(None, None, None)
+
+
+@pytest.mark.asyncio
+async def test_idle_connection_closes_after_ttl_and_reopens_on_demand():
+    manager, created = create_idle_manager(idle_ttl=60)
+    try:
+        async with manager.session("tools", client_session_factory=FakeSession) as session:
+            await session.call_tool("fast")
+            # In-use connections are never closed
+            assert await manager.close_idle(now=time.monotonic() + 600) == []
+
+        assert await manager.close_idle(now=time.monotonic() + 600) == ["tools"]
+        assert "tools" not in manager.running_servers
+
+        async with manager.session("tools", client_session_factory=FakeSession) as session:
+            await session.call_tool("fast")
+        assert len(created) == 2
+    finally:
+        await manager.__aexit__(None, None, None)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_sessions_on_a_cold_server_share_one_launch():
+    manager, created = create_idle_manager(idle_ttl=60, session_factory=SlowSession)
+    try:
+
+        async def call():
+            async with manager.session("tools", client_session_factory=SlowSession) as session:
+                return session, await session.call_tool("fast")
+
+        results = await asyncio.gather(*(call() for _ in range(5)))
+
+        assert len(created) == 1
+        assert all(session is created[0].session for session, _ in results)
+        assert created[0].session.calls == 5
+    finally:
+        await manager.__aexit__(None, None, None)
+
+
+@pytest.mark.asyncio
+async def test_idle_connections_are_reaped_in_the_background():
+    manager, created = create_idle_manager(idle_ttl=0.1)
+    try:
+        async with manager.session("tools", client_session_factory=FakeSession) as session:
+            await session.call_tool("fast")
+        await asyncio.sleep(0.3)
+        assert "tools" not in manager.running_servers
+    finally:
+        await manager.__aexit__(None, None, None)
+
+
+@pytest.mark.asyncio
+async def test_persistent_server_shuts_down_when_idle_and_reconnects_on_use():
+    config = MCPServerSettings(idle_shutdown_seconds=60)
+    registry = MagicMock()
+    registry.registry = {"browser": config}
+    manager = MCPConnectionManager(server_registry=registry, context=MagicMock())
+    created = []
+
+    def fake_create_connection(server_name, client_session_factory, init_hook=None):
+        conn = ServerConnection(
+            server_name=server_name,
+            server_config=config,
+            transport_context_factory=FakeTransport,
+            client_session_factory=FakeSession,
+        )
+        created.append(conn)
+        return conn
+
+    manager._create_connection = fake_create_connection
+    async with manager:
+        async with manager.session("browser", client_session_factory=FakeSession) as session:
+            await session.call_tool("fast")
+            assert await manager.close_idle(now=time.monotonic() + 600) == []
+
+        assert await manager.close_idle() == []
+        assert await manager.close_idle(now=time.monotonic() + 600) == ["browser"]
+        assert "browser" not in manager.running_servers
+
+        async with manager.session("browser", client_session_factory=FakeSession) as session:
+            await session.call_tool("fast")
+        assert len(created) == 2
+
+
+@pytest.mark.asyncio
+async def test_servers_without_idle_shutdown_stay_connected():
+    manager = create_pooled_manager()
+    async with manager:
+        async with manager.session("pooled", client_session_factory=FakeSession) as session:
+            await session.call_tool("fast")
+        assert await manager.close_idle(now=time.monotonic() + 600) == []
+        assert "pooled" in manager.running_servers
+
+
+class StubbornTransport(FakeTransport):
+    """Transport that only closes when cancelled, like a process ignoring SIGTERM."""
+
+    async def __aexit__(self, *args):
+        await asyncio.sleep(3600)
+
+
+def create_shutdown_manager(transports: dict, shutdown_timeout: float) -> MCPConnectionManager:
+    registry = MagicMock()
+    registry.registry = {name: MCPServerSettings() for name in transports}
+    manager = MCPConnectionManager(
+        server_registry=registry, context=MagicMock(), shutdown_timeout=shutdown_timeout
+    )
+
+    def fake_create_connection(server_name, client_session_factory, init_hook=None):
+        return ServerConnection(
+            server_name=server_name,
+            server_config=registry.registry[server_name],
+            transport_context_factory=transports[server_name],
+            client_session_factory=FakeSession,
+        )
+
+    manager._create_connection = fake_create_connection
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_shutdown_waits_for_servers_instead_of_sleeping():
+    manager = create_shutdown_manager(
+        {"one": FakeTransport, "two": FakeTransport, "three": FakeTransport}, shutdown_timeout=5
+    )
+    async with manager:
+        await manager.launch_servers(["one", "two", "three"], lambda name: FakeSession)
+        start = time.perf_counter()
+
+    assert time.perf_counter() - start < 0.2
+    report = manager.shutdown_report
+    assert set(report.stopped) == {"one", "two", "three"}
+    assert report.killed == {}
+    assert manager.running_servers == {}
+
+
+@pytest.mark.asyncio
+async def test_shutdown_kills_servers_that_do_not_exit_by_the_deadline():
+    manager = create_shutdown_manager(
+        {"good": FakeTransport, "stubborn": StubbornTransport}, shutdown_timeout=0.2
+    )
+    async with manager:
+        await manager.launch_servers(["good", "stubborn"], lambda name: FakeSession)
+        start = time.perf_counter()
+
+    assert time.perf_counter() - start < 1
+    report = manager.shutdown_report
+    assert list(report.stopped) == ["good"]
+    assert list(report.killed) == ["stubborn"]
+    assert report.unresponsive == []
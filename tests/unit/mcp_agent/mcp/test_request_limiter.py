@@ -0,0 +1,181 @@
+"""Unit tests for per-server request concurrency limits."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import MagicMock
+
+import pytest
+from mcp.types import CallToolResult, TextContent
+
+from mcp_agent._mcp_local_backup.mcp_aggregator import MCPAggregator
+from mcp_agent._mcp_local_backup.request_limiter import ServerRequestLimiter
+from mcp_agent.config import MCPServerSettings
+from mcp_agent.core.exceptions import ServerBusyError
+
+
+@pytest.mark.asyncio
+async def test_limits_concurrent_requests():
+    limiter = ServerRequestLimiter("db", max_concurrent=2)
+    running = 0
+    peak = 0
+
+    async def request():
+        nonlocal running, peak
+        async with limiter.slot():
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+
+    await asyncio.gather(*(request() for _ in range(8)))
+
+    assert peak == 2
+    stats = limiter.stats()
+    assert stats.requests == 8
+    assert stats.queued == 6
+    assert stats.in_flight == 0
+    assert stats.queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_queued_requests_are_served_in_arrival_order():
+    limiter = ServerRequestLimiter("db", max_concurrent=1)
+    order = []
+    release = asyncio.Event()
+
+    async def holder():
+        async with limiter.slot():
+            await release.wait()
+
+    async def request(name):
+        async with limiter.slot():
+            order.append(name)
+
+    tasks = [asyncio.create_task(holder())]
+    await asyncio.sleep(0)
+    for name in ["a", "b", "c"]:
+        tasks.append(asyncio.create_task(request(name)))
+        await asyncio.sleep(0)
+
+    release.set()
+    # A request arriving as the slot is freed queues behind the waiting ones
+    tasks.append(asyncio.create_task(request("late")))
+    await asyncio.gather(*tasks)
+
+    assert order == ["a", "b", "c", "late"]
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_immediately():
+    limiter = ServerRequestLimiter("db", max_concurrent=1, max_queued=1)
+
+    async def request():
+        async with limiter.slot():
+            await asyncio.sleep(0.05)
+
+    tasks = [asyncio.create_task(request()) for _ in range(2)]
+    await asyncio.sleep(0)
+
+    with pytest.raises(ServerBusyError):
+        async with limiter.slot():
+            pass
+
+    await asyncio.gather(*tasks)
+    assert limiter.stats().rejected == 1
+
+
+@pytest.mark.asyncio
+async def test_queue_timeout_and_wait_time_is_recorded_separately():
+    limiter = ServerRequestLimiter("db", max_concurrent=1, queue_timeout=0.05)
+
+    async def request(duration):
+        async with limiter.slot() as queue_seconds:
+            await asyncio.sleep(duration)
+            return queue_seconds
+
+    slow = asyncio.create_task(request(0.2))
+    await asyncio.sleep(0)
+    with pytest.raises(ServerBusyError) as exc_info:
+        await request(0)
+    assert "Timed out" in exc_info.value.details
+    await slow
+
+    # With the slot free again, no time is spent queueing
+    assert await request(0.01) < 0.01
+
+    stats = limiter.stats()
+    assert stats.timed_out == 1
+    assert stats.requests == 2
+    assert stats.execution_seconds_total >= 0.2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_its_slot():
+    limiter = ServerRequestLimiter("db", max_concurrent=1)
+
+    async def request():
+        async with limiter.slot():
+            await asyncio.sleep(0.02)
+
+    holder = asyncio.create_task(request())
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(request())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    await holder
+
+    await asyncio.wait_for(request(), timeout=1)
+    assert limiter.stats().in_flight == 0
+
+
+def test_no_limiter_without_max_concurrent_requests():
+    assert ServerRequestLimiter.from_config("db", MCPServerSettings()) is None
+    limiter = ServerRequestLimiter.from_config(
+        "db", MCPServerSettings(max_concurrent_requests=4, max_queued_requests=10)
+    )
+    assert (limiter.max_concurrent, limiter.max_queued) == (4, 10)
+
+
+@pytest.mark.asyncio
+async def test_aggregator_returns_error_result_when_server_is_busy():
+    context = MagicMock()
+    context.server_request_limiters = {}
+    context.server_registry.registry = {
+        "browser": MCPServerSettings(max_concurrent_requests=1, max_queued_requests=0)
+    }
+    aggregator = MCPAggregator(
+        server_names=["browser"], connection_persistence=True, context=context
+    )
+
+    session = MagicMock()
+
+    async def call_tool(name, arguments):
+        await asyncio.sleep(0.05)
+        return CallToolResult(content=[TextContent(type="text", text="done")])
+
+    session.call_tool = call_tool
+
+    @asynccontextmanager
+    async def fake_session(server_name, client_session_factory):
+        yield session
+
+    aggregator._persistent_connection_manager = MagicMock(session=fake_session)
+
+    def call():
+        return aggregator._execute_on_server(
+            server_name="browser",
+            operation_type="tool",
+            operation_name="navigate",
+            method_name="call_tool",
+            method_args={"name": "navigate", "arguments": {}},
+            error_factory=lambda msg: CallToolResult(
+                isError=True, content=[TextContent(type="text", text=msg)]
+            ),
+        )
+
+    first, second = await asyncio.gather(call(), call())
+
+    assert not first.isError
+    assert second.isError
+    assert "busy" in second.content[0].text
+    assert aggregator.request_stats()["browser"].rejected == 1
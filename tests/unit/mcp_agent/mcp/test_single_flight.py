@@ -0,0 +1,170 @@
+"""Unit tests for single-flight deduplication of concurrent tool calls."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from mcp.types import CallToolResult, TextContent, Tool, ToolAnnotations
+
+from mcp_agent._mcp_local_backup.mcp_aggregator import MCPAggregator
+from mcp_agent._mcp_local_backup.single_flight import SingleFlight
+from mcp_agent._mcp_local_backup.tool_result_cache import ToolResultCache
+from mcp_agent.config import MCPServerSettings
+
+
+class SlowBackend:
+    def __init__(self, delay: float = 0.1, error: Exception | None = None):
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self.cancelled = False
+
+    async def request(self, value: str = "result"):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error:
+            raise self.error
+        return value
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_calls_share_one_request():
+    flights = SingleFlight()
+    backend = SlowBackend()
+
+    results = await asyncio.gather(*(flights.do("key", backend.request) for _ in range(5)))
+
+    assert results == ["result"] * 5
+    assert backend.calls == 1
+    assert flights.shared == 4
+    assert len(flights) == 0
+
+    # Once complete, the next call starts a new request
+    await flights.do("key", backend.request)
+    assert backend.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_different_keys_are_not_shared():
+    flights = SingleFlight()
+    backend = SlowBackend()
+
+    await asyncio.gather(flights.do("a", backend.request), flights.do("b", backend.request))
+    assert backend.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_errors_are_shared_by_all_waiters():
+    flights = SingleFlight()
+    backend = SlowBackend(error=RuntimeError("backend down"))
+
+    results = await asyncio.gather(
+        *(flights.do("key", backend.request) for _ in range(3)), return_exceptions=True
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert backend.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_others():
+    flights = SingleFlight()
+    backend = SlowBackend()
+
+    first = asyncio.create_task(flights.do("key", backend.request))
+    second = asyncio.create_task(flights.do("key", backend.request))
+    await asyncio.sleep(0.01)
+    first.cancel()
+
+    assert await second == "result"
+    assert first.cancelled()
+    assert not backend.cancelled
+    assert backend.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_request_is_cancelled_when_all_waiters_leave():
+    flights = SingleFlight()
+    backend = SlowBackend(delay=1)
+
+    waiters = [asyncio.create_task(flights.do("key", backend.request)) for _ in range(2)]
+    await asyncio.sleep(0.01)
+    for waiter in waiters:
+        waiter.cancel()
+    await asyncio.gather(*waiters, return_exceptions=True)
+    await asyncio.sleep(0)
+
+    assert backend.cancelled
+    assert len(flights) == 0
+
+    # A new caller starts a fresh request rather than joining the cancelled one
+    backend.delay = 0
+    assert await flights.do("key", backend.request) == "result"
+    assert backend.calls == 2
+
+
+def create_aggregator(deduplicate_tool_calls: str = "safe") -> MCPAggregator:
+    context = MagicMock()
+    context.tool_call_flights = SingleFlight()
+    context.tool_result_cache = ToolResultCache()
+    context.server_registry.registry = {
+        "geo": MCPServerSettings(deduplicate_tool_calls=deduplicate_tool_calls)
+    }
+    aggregator = MCPAggregator(server_names=["geo"], connection_persistence=False, context=context)
+    aggregator._index_server_tools(
+        "geo",
+        [
+            Tool(
+                name="lookup",
+                inputSchema={"type": "object"},
+                annotations=ToolAnnotations(readOnlyHint=True),
+            ),
+            Tool(name="update", inputSchema={"type": "object"}),
+        ],
+    )
+    aggregator.initialized = True
+    return aggregator
+
+
+def counting_server(aggregator: MCPAggregator) -> list:
+    calls = []
+
+    async def execute_on_server(**kwargs):
+        calls.append(kwargs["method_args"])
+        await asyncio.sleep(0.05)
+        return CallToolResult(content=[TextContent(type="text", text="ok")])
+
+    aggregator._execute_on_server = execute_on_server
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_aggregator_shares_concurrent_read_only_calls():
+    aggregator = create_aggregator()
+    calls = counting_server(aggregator)
+
+    results = await asyncio.gather(
+        *(aggregator.call_tool("lookup", {"city": "Paris"}) for _ in range(4))
+    )
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+    # Calls to tools that may have side effects are not shared
+    await asyncio.gather(*(aggregator.call_tool("update", {"city": "Paris"}) for _ in range(2)))
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_aggregator_deduplication_modes():
+    aggregator = create_aggregator("all")
+    calls = counting_server(aggregator)
+    await asyncio.gather(*(aggregator.call_tool("update", {"city": "Paris"}) for _ in range(2)))
+    assert len(calls) == 1
+
+    aggregator = create_aggregator("off")
+    calls = counting_server(aggregator)
+    await asyncio.gather(*(aggregator.call_tool("lookup", {"city": "Paris"}) for _ in range(2)))
+    assert len(calls) == 2
@@ -0,0 +1,116 @@
+"""Unit tests for the tool result cache."""
+
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from mcp.types import CallToolResult, TextContent, Tool, ToolAnnotations
+
+from mcp_agent._mcp_local_backup.mcp_aggregator import MCPAggregator
+from mcp_agent._mcp_local_backup.single_flight import SingleFlight
+from mcp_agent._mcp_local_backup.tool_result_cache import ToolResultCache, tool_cache_ttl
+from mcp_agent.config import MCPServerSettings, MCPSettings, MCPToolCacheSettings, Settings
+
+
+def text_result(text: str, is_error: bool = False) -> CallToolResult:
+    return CallToolResult(isError=is_error, content=[TextContent(type="text", text=text)])
+
+
+def test_key_ignores_argument_order():
+    first = ToolResultCache.key("geo", "lookup", {"city": "Paris", "radius": 5})
+    second = ToolResultCache.key("geo", "lookup", {"radius": 5, "city": "Paris"})
+    assert first == second
+    assert first != ToolResultCache.key("geo", "lookup", {"city": "Lyon", "radius": 5})
+    assert ToolResultCache.key("geo", "lookup", None) == ToolResultCache.key("geo", "lookup", {})
+
+
+def test_cache_hits_misses_and_expiry(monkeypatch):
+    cache = ToolResultCache()
+    key = cache.key("geo", "lookup", {"city": "Paris"})
+
+    assert cache.get(key) is None
+    cache.put(key, text_result("48.85,2.35"), ttl=10)
+    assert cache.get(key).content[0].text == "48.85,2.35"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    expired = time.monotonic() + 11
+    monkeypatch.setattr(time, "monotonic", lambda: expired)
+    assert cache.get(key) is None
+    assert len(cache) == 0
+
+
+def test_error_results_are_never_cached():
+    cache = ToolResultCache()
+    key = cache.key("geo", "lookup", {})
+    cache.put(key, text_result("boom", is_error=True), ttl=10)
+    assert cache.get(key) is None
+
+
+def test_lru_eviction():
+    cache = ToolResultCache(max_entries=2)
+    keys = [cache.key("geo", "lookup", {"n": n}) for n in range(3)]
+    cache.put(keys[0], text_result("0"), ttl=10)
+    cache.put(keys[1], text_result("1"), ttl=10)
+    cache.get(keys[0])  # keys[1] is now least recently used
+    cache.put(keys[2], text_result("2"), ttl=10)
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[2]) is not None
+
+
+def test_ttl_from_config_and_annotations():
+    settings = MCPServerSettings(
+        tool_cache=MCPToolCacheSettings(
+            ttl_seconds=60, tools={"schema": 600, "lookup": None}, exclude=["now"]
+        )
+    )
+    read_only = ToolAnnotations(readOnlyHint=True)
+
+    assert tool_cache_ttl(settings, "schema") == 600
+    assert tool_cache_ttl(settings, "lookup") == 60
+    assert tool_cache_ttl(settings, "search", ToolAnnotations(idempotentHint=True)) == 60
+    assert tool_cache_ttl(settings, "now", read_only) is None
+    assert tool_cache_ttl(settings, "write", ToolAnnotations(readOnlyHint=False)) is None
+    assert tool_cache_ttl(settings, "other") is None
+    # Caching is opt-in per server
+    assert tool_cache_ttl(MCPServerSettings(), "search", read_only) is None
+
+
+@pytest.mark.asyncio
+async def test_call_tool_serves_repeated_calls_from_cache():
+    context = MagicMock()
+    context.tool_result_cache = ToolResultCache()
+    context.tool_call_flights = SingleFlight()
+    context.config = Settings(mcp=MCPSettings())
+    context.server_registry.registry = {
+        "geo": MCPServerSettings(tool_cache=MCPToolCacheSettings())
+    }
+    aggregator = MCPAggregator(server_names=["geo"], connection_persistence=False, context=context)
+    aggregator._index_server_tools(
+        "geo",
+        [
+            Tool(
+                name="lookup",
+                inputSchema={"type": "object"},
+                annotations=ToolAnnotations(readOnlyHint=True),
+            ),
+            Tool(name="update", inputSchema={"type": "object"}),
+        ],
+    )
+    aggregator.initialized = True
+    aggregator._execute_on_server = AsyncMock(return_value=text_result("ok"))
+
+    for _ in range(3):
+        result = await aggregator.call_tool("lookup", {"city": "Paris"})
+        assert result.content[0].text == "ok"
+    assert aggregator._execute_on_server.await_count == 1
+
+    await aggregator.call_tool("update", {"city": "Paris"})
+    await aggregator.call_tool("update", {"city": "Paris"})
+    assert aggregator._execute_on_server.await_count == 3
+
+    aggregator._execute_on_server.return_value = text_result("failed", is_error=True)
+    await aggregator.call_tool("lookup", {"city": "Lyon"})
+    await aggregator.call_tool("lookup", {"city": "Lyon"})
+    assert aggregator._execute_on_server.await_count == 5
@@ -0,0 +1,76 @@
+"""Unit tests for the indexed hierarchical sheet search."""
+
+from tools.sheets_search import SheetIndex, hierarchical_search, tokenize
+
+
+def row(category="", grouping="", demographic="", description=""):
+    return {
+        "Category": category,
+        "Grouping": grouping,
+        "Demographic": demographic,
+        "Description": description,
+    }
+
+
+def test_tokenize_lowercases_and_splits_on_punctuation():
+    assert tokenize("Luxury Car-Buyers, 2024!") == ["luxury", "car", "buyers", "2024"]
+    assert tokenize(None) == ["none"]
+    assert tokenize("") == []
+
+
+def test_candidates_are_ranked_by_column_weight():
+    rows = [
+        row(category="Coffee"),
+        row(grouping="Coffee Drinkers"),
+        row(description="Daily coffee buyers"),
+        row(demographic="Coffee Lovers"),
+        row(category="Automotive", description="Truck owners"),
+    ]
+    index = SheetIndex(rows)
+
+    # Description > Demographic > Grouping > Category; rows without the token are skipped
+    assert index.candidates(["coffee"]) == [2, 3, 1, 0]
+    assert index.candidates(["coffee"], limit=2) == [2, 3]
+
+
+def test_candidates_add_up_matches_across_columns():
+    rows = [row(description="coffee"), row(grouping="coffee shops", category="coffee shops")]
+    index = SheetIndex(rows)
+
+    # One Description match (100) outweighs a Grouping and a Category match (50 + 25)
+    assert index.candidates(["coffee"]) == [0, 1]
+    # Two tokens matching in both columns: 2 * (50 + 25)
+    assert index.candidates(["coffee shops"]) == [1, 0]
+
+
+def test_query_tokens_expand_to_substrings_and_close_spellings():
+    index = SheetIndex(
+        [row(description="Hardwood flooring shoppers"), row(description="Carpet and tv buyers")]
+    )
+
+    assert "flooring" in index.matching_tokens("floor")
+    assert "hardwood" in index.matching_tokens("hardwod")
+    assert "carpet" in index.matching_tokens("carpets")
+    # Short tokens only match themselves
+    assert index.matching_tokens("tv") == ["tv"]
+    assert index.matching_tokens("zz") == []
+
+    assert index.candidates(["hardwod floors"]) == [0]
+
+
+def test_rows_beyond_the_first_500_are_found():
+    rows = [
+        row(category="Retail", grouping="Shoppers", demographic=f"Shopper {n}", description="")
+        for n in range(1000)
+    ]
+    rows[750] = row(
+        category="Dining",
+        grouping="Coffee Drinkers",
+        demographic="Espresso Enthusiasts",
+        description="Frequent espresso bar visitors",
+    )
+
+    matches = hierarchical_search("espresso enthusiasts", rows)
+
+    assert matches[0].row is rows[750]
+    assert matches[0].pathway == "Dining → Coffee Drinkers → Espresso Enthusiasts"